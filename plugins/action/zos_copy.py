@@ -6,9 +6,11 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import os
+import re
 import stat
 import time
-import subprocess
+
+from glob import glob
 
 from tempfile import mkstemp, gettempprefix
 
@@ -19,8 +21,13 @@ from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.plugins.action import ActionBase
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import (
-    is_member, is_data_set, extract_member_name
+    is_member, is_data_set, extract_member_name, member_name_from_file
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import checksum, compress, delta
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.sftp import SftpSession
+
+GLOB_REGEX = re.compile(r"[*?[]")
+SFTP_SPECIAL_REGEX = re.compile(r"([\\#*?[\]])")
 
 
 class ActionModule(ActionBase):
@@ -42,6 +49,9 @@ class ActionModule(ActionBase):
         local_follow = _process_boolean(self._task.args.get('local_follow'), default=False)
         remote_src = _process_boolean(self._task.args.get('remote_src'), default=False)
         is_binary = _process_boolean(self._task.args.get('is_binary'), default=False)
+        skip_unchanged = _process_boolean(self._task.args.get('skip_unchanged'), default=False)
+        use_delta = _process_boolean(self._task.args.get('delta'), default=False)
+        compress_format = self._task.args.get('compress', None)
         backup_file = self._task.args.get("backup_file", None)
         encoding = self._task.args.get('encoding', None)
         mode = self._task.args.get('mode', None)
@@ -51,6 +61,7 @@ class ActionModule(ActionBase):
         new_module_args = self._task.args.copy()
         is_pds = is_src_dir = False
         temp_path = is_uss = is_mvs_dest = copy_member = src_member = None
+        src_files = None
 
         if dest:
             if not isinstance(dest, string_types):
@@ -69,8 +80,30 @@ class ActionModule(ActionBase):
                 msg = "Either 'src' or 'content' can be provided; not both."
                 return self._exit_action(result, msg, failed=True)
 
+            elif isinstance(src, list) or (
+                not remote_src and isinstance(src, string_types) and _is_pattern(src)
+            ):
+                if remote_src:
+                    msg = "A list of source files can only be copied from the local machine"
+                    return self._exit_action(result, msg, failed=True)
+                if copy_member or not (is_uss or is_mvs_dest):
+                    msg = (
+                        "Destination must be a USS directory or a partitioned "
+                        "data set to copy several files"
+                    )
+                    return self._exit_action(result, msg, failed=True)
+                if mode == 'preserve':
+                    msg = "The 'mode' parameter can not be 'preserve' to copy several files"
+                    return self._exit_action(result, msg, failed=True)
+                try:
+                    src_files = _expand_src_files(src)
+                    if is_mvs_dest:
+                        _validate_member_names(src_files, dest)
+                except AnsibleError as err:
+                    return self._exit_action(result, str(err), failed=True)
+
             elif not isinstance(src, string_types):
-                msg = "Invalid type supplied for 'src' option, it must be a string"
+                msg = "Invalid type supplied for 'src' option, it must be a string or a list"
                 return self._exit_action(result, msg, failed=True)
 
             elif len(src) < 1 or len(dest) < 1:
@@ -104,10 +137,30 @@ class ActionModule(ActionBase):
             msg = "Invalid port provided for SFTP. Expected an integer between 0 to 65535."
             return self._exit_action(result, msg, failed=True)
 
-        if (not force) and self._dest_exists(src, dest, task_vars):
+        if compress_format is not None and compress_format not in compress.COMPRESS_FORMATS:
+            msg = "Invalid value supplied for 'compress' option, it must be one of: {0}".format(
+                ", ".join(compress.COMPRESS_FORMATS)
+            )
+            return self._exit_action(result, msg, failed=True)
+
+        if src_files:
+            new_module_args.pop('src')
+            new_module_args['force'] = force
+            new_module_args['size'] = sum(os.stat(f).st_size for f in src_files)
+            transfer_res = self._copy_files_to_remote(
+                src_files, sftp_port, compress_format=compress_format
+            )
+            if transfer_res.get("msg"):
+                return transfer_res
+            temp_path = transfer_res.get("temp_path")
+            new_module_args['src_files'] = [
+                dict(src=f, name=os.path.basename(f)) for f in src_files
+            ]
+
+        elif (not force) and self._dest_exists(src, dest, task_vars):
             return self._exit_action(result, "Destination exists. No data was copied.")
 
-        if not remote_src:
+        elif not remote_src:
             if local_follow and not src:
                 msg = "No path given for local symlink"
                 return self._exit_action(result, msg, failed=True)
@@ -123,13 +176,36 @@ class ActionModule(ActionBase):
                 )
                 return self._exit_action(result, msg, failed=True)
 
+            # Only the content is compared, so changes of the file
+            # attributes need a copy.
+            skip_unchanged = skip_unchanged and not (
+                is_src_dir or mode or owner or group
+            )
+            preflight_args = dict(
+                new_module_args,
+                is_binary=is_binary,
+                is_uss=is_uss,
+                is_mvs_dest=is_mvs_dest,
+                copy_member=copy_member,
+                checksum_only=True
+            )
             if content:
                 try:
                     local_content = _write_content_to_temp_file(content)
-                    transfer_res = self._copy_to_remote(local_content, sftp_port)
+                    if skip_unchanged and self._dest_unchanged(
+                        local_content, preflight_args, task_vars
+                    ):
+                        return self._exit_action(result, "Destination is unchanged. No data was copied.")
+                    transfer_res = self._copy_to_remote(
+                        local_content, sftp_port, compress_format=compress_format
+                    )
                 finally:
                     os.remove(local_content)
             else:
+                if skip_unchanged and self._dest_unchanged(
+                    src, preflight_args, task_vars
+                ):
+                    return self._exit_action(result, "Destination is unchanged. No data was copied.")
                 if is_src_dir:
                     path, dirs, files = next(os.walk(src))
                     if dirs:
@@ -143,12 +219,34 @@ class ActionModule(ActionBase):
                     if mode == 'preserve':
                         new_module_args['mode'] = '0{0:o}'.format(stat.S_IMODE(os.stat(b_src).st_mode))
                     new_module_args['size'] = os.stat(src).st_size
-                transfer_res = self._copy_to_remote(src, sftp_port, is_dir=is_src_dir)
+                transfer_res = None
+                # Only the blocks of a USS file that changed are sent, the
+                # module rebuilds it from the destination file.
+                if use_delta and is_uss and not (is_src_dir or encoding):
+                    transfer_res = self._copy_delta_to_remote(
+                        src, dict(preflight_args, checksum_only=False, signature_only=True),
+                        sftp_port, task_vars, compress_format=compress_format
+                    )
+                if transfer_res and transfer_res.get("block_size"):
+                    new_module_args.update(
+                        dict(
+                            is_delta=True,
+                            block_size=transfer_res.get("block_size"),
+                            src_checksum=transfer_res.get("src_checksum")
+                        )
+                    )
+                elif not transfer_res:
+                    transfer_res = self._copy_to_remote(
+                        src, sftp_port, is_dir=is_src_dir, compress_format=compress_format
+                    )
 
             temp_path = transfer_res.get("temp_path")
             if transfer_res.get("msg"):
                 return transfer_res
 
+        if temp_path and compress_format:
+            new_module_args['is_compressed'] = True
+
         new_module_args.update(
             dict(
                 is_uss=is_uss,
@@ -188,30 +286,91 @@ class ActionModule(ActionBase):
 
         return _update_result(is_binary, copy_res, self._task.args)
 
-    def _copy_to_remote(self, src, port, is_dir=False):
+    def _copy_to_remote(self, src, port, is_dir=False, compress_format=None):
         """Copy a file or directory to the remote z/OS system """
-        ansible_user = self._play_context.remote_user
-        ansible_host = self._play_context.remote_addr
+        if compress_format:
+            return self._copy_archive_to_remote([src], port, compress_format)
         temp_path = "/{0}/{1}".format(gettempprefix(), _create_temp_path_name())
-        cmd = ['sftp', "-oPort={0}".format(port), ansible_user + '@' + ansible_host]
-        stdin = "put -r {0} {1}".format(src.replace('#', '\\#'), temp_path)
+        commands = []
+        put = "put -r {0} {1}".format(_escape_sftp_path(src), temp_path)
 
         if is_dir:
             src = src.rstrip('/') if src.endswith('/') else src
             base = os.path.basename(src)
-            self._connection.exec_command("mkdir -p {0}/{1}".format(temp_path, base))
+            commands.append("mkdir {0}".format(temp_path))
+            commands.append("mkdir {0}/{1}".format(temp_path, base))
         else:
-            stdin = stdin.replace(" -r", "", 1)
-        transfer_data = subprocess.Popen(
-            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        out, err = transfer_data.communicate(to_bytes(stdin))
-        err = _detect_sftp_errors(err)
+            put = put.replace(" -r", "", 1)
+        commands.append(put)
+        sftp = SftpSession(self._connection, self._play_context, port)
+        rc, out, err = sftp.run(commands)
 
-        if transfer_data.returncode != 0 or err:
+        if rc != 0 or err:
             return dict(
                 msg="Error transfering source '{0}' to remote z/OS system".format(src),
-                rc=transfer_data.returncode,
+                rc=rc,
+                stderr=err,
+                stderr_lines=err.splitlines(),
+                failed=True
+            )
+
+        return dict(temp_path=temp_path)
+
+    def _copy_files_to_remote(self, src_files, port, compress_format=None):
+        """Copy several files to one remote temporary directory, over a
+        single sftp session """
+        if compress_format:
+            return self._copy_archive_to_remote(src_files, port, compress_format)
+        temp_path = "/{0}/{1}".format(gettempprefix(), _create_temp_path_name())
+        commands = ["mkdir {0}".format(temp_path)]
+        for src in src_files:
+            commands.append("put {0} {1}/{2}".format(
+                _escape_sftp_path(src), temp_path, os.path.basename(src)
+            ))
+        sftp = SftpSession(self._connection, self._play_context, port)
+        rc, out, err = sftp.run(commands)
+
+        if rc != 0 or err:
+            self._connection.exec_command("rm -rf {0}".format(temp_path))
+            return dict(
+                msg="Error transfering source files to remote z/OS system",
+                rc=rc,
+                stderr=err,
+                stderr_lines=err.splitlines(),
+                failed=True
+            )
+
+        return dict(temp_path=temp_path)
+
+    def _copy_archive_to_remote(self, paths, port, compress_format):
+        """Pack local files or a directory into one compressed archive and
+        copy the archive to the remote z/OS system, where the module
+        unpacks it """
+        temp_path = "/{0}/{1}{2}".format(
+            gettempprefix(), _create_temp_path_name(), compress.ARCHIVE_SUFFIX
+        )
+        fd, local_archive = mkstemp(suffix=compress.ARCHIVE_SUFFIX)
+        os.close(fd)
+        try:
+            compress.pack(paths, local_archive, compress=compress_format)
+            sftp = SftpSession(self._connection, self._play_context, port)
+            rc, out, err = sftp.run(["put {0} {1}".format(local_archive, temp_path)])
+        except (OSError, IOError, compress.CompressError) as err:
+            return dict(
+                msg="Unable to compress source '{0}': {1}".format(
+                    ", ".join(paths), str(err)
+                ),
+                failed=True
+            )
+        finally:
+            os.remove(local_archive)
+
+        if rc != 0 or err:
+            return dict(
+                msg="Error transfering source '{0}' to remote z/OS system".format(
+                    ", ".join(paths)
+                ),
+                rc=rc,
                 stderr=err,
                 stderr_lines=err.splitlines(),
                 failed=True
@@ -219,6 +378,61 @@ class ActionModule(ActionBase):
 
         return dict(temp_path=temp_path)
 
+    def _copy_delta_to_remote(self, src, module_args, port, task_vars, compress_format=None):
+        """Copy only the blocks of a local file that are not already in the
+        destination file on the remote z/OS system, using the signature of
+        the destination file. Returns None when the destination file does not
+        exist or more than half of the file changed, so the whole file is
+        copied instead """
+        signature_res = self._execute_module(
+            module_name='zos_copy',
+            module_args=module_args,
+            task_vars=task_vars
+        )
+        signature = signature_res.get('signature')
+        if signature_res.get('failed') or not signature:
+            return None
+
+        fd, local_delta = mkstemp()
+        os.close(fd)
+        try:
+            delta.write_delta(src, signature, local_delta)
+            transfer_res = self._copy_to_remote(
+                local_delta, port, compress_format=compress_format
+            )
+        except delta.DeltaTooLargeError:
+            # too much of the file changed, sending it whole is faster
+            return None
+        finally:
+            os.remove(local_delta)
+        if transfer_res.get("msg"):
+            return transfer_res
+        transfer_res.update(
+            dict(
+                block_size=signature.get('block_size'),
+                src_checksum=checksum.get_checksum(src)
+            )
+        )
+        return transfer_res
+
+    def _dest_unchanged(self, local_path, module_args, task_vars):
+        """Determine if the destination on the remote z/OS system already
+        has the content of a local file, by comparing their checksums
+        before any data is transferred """
+        local_checksum = checksum.get_checksum(
+            local_path,
+            records=not module_args.get('is_uss') and not module_args.get('is_binary')
+        )
+        checksum_res = self._execute_module(
+            module_name='zos_copy',
+            module_args=module_args,
+            task_vars=task_vars
+        )
+        return (
+            not checksum_res.get('failed') and
+            checksum_res.get('dest_checksum') == local_checksum
+        )
+
     def _remote_cleanup(self, dest, dest_exists, task_vars):
         """Remove all files or data sets pointed to by 'dest' on the remote
         z/OS system. The idea behind this cleanup step is that if, for some
@@ -297,6 +511,8 @@ def _update_result(is_binary, copy_res, original_args):
     )
     if src:
         updated_result['src'] = src
+    if copy_res.get("results") is not None:
+        updated_result['results'] = copy_res.get("results")
     if note:
         updated_result['note'] = note
     if backup_file:
@@ -321,6 +537,94 @@ def _update_result(is_binary, copy_res, original_args):
     return updated_result
 
 
+def _expand_src_files(src):
+    """Expand a list of local files or shell patterns into the files to copy.
+
+    Arguments:
+        src {Union[str, list[str]]} -- A pattern, or a list of files and patterns.
+
+    Raises:
+        AnsibleError: When a file is missing, is not readable, or two files
+        have the same name.
+
+    Returns:
+        list[str] -- The absolute paths of the files, in the order given with
+        the matches of each pattern sorted. Symbolic links are not resolved,
+        so each file keeps the name it was given.
+    """
+    src_files = []
+    names = set()
+    for item in [src] if isinstance(src, string_types) else src:
+        if not isinstance(item, string_types) or len(item) < 1:
+            raise AnsibleError("Invalid type supplied for 'src' option, it must be a string or a list")
+        item = os.path.expanduser(item)
+        if _is_pattern(item):
+            matches = [f for f in sorted(glob(item)) if os.path.isfile(f)]
+            if not matches:
+                raise AnsibleError("No local files match {0}".format(item))
+        elif not os.path.exists(item):
+            raise AnsibleError("The local file {0} does not exist".format(item))
+        elif os.path.isdir(item):
+            raise AnsibleError(
+                "The local path {0} is a directory, only files can be copied in a list".format(item)
+            )
+        else:
+            matches = [item]
+        for path in matches:
+            path = os.path.abspath(path)
+            if path in src_files:
+                continue
+            if not os.access(path, os.R_OK):
+                raise AnsibleError(
+                    "The local file {0} does not have appropriate read permission".format(path)
+                )
+            if os.path.basename(path) in names:
+                raise AnsibleError(
+                    "More than one source file is named {0}".format(os.path.basename(path))
+                )
+            names.add(os.path.basename(path))
+            src_files.append(path)
+    return src_files
+
+
+def _escape_sftp_path(path):
+    """Escape the characters sftp treats as comments or patterns in a
+    local path """
+    return SFTP_SPECIAL_REGEX.sub(r"\\\1", path)
+
+
+def _is_pattern(src):
+    """Determine whether a local source is a shell pattern, a path with
+    pattern characters that is not the path of an existing file """
+    return bool(GLOB_REGEX.search(src)) and not os.path.exists(os.path.expanduser(src))
+
+
+def _validate_member_names(src_files, dest):
+    """Check the names of the members several files are copied to, before
+    anything is transferred.
+
+    Raises:
+        AnsibleError: When a file name does not give a valid member name,
+        or two files are copied to the same member.
+    """
+    members = dict()
+    for path in src_files:
+        name = os.path.basename(path)
+        member_name = member_name_from_file(name)
+        if not is_member("{0}({1})".format(dest, member_name)):
+            raise AnsibleError(
+                "The file {0} can not be copied to a member, '{1}' is not a valid "
+                "member name".format(name, member_name)
+            )
+        if member_name in members:
+            raise AnsibleError(
+                "The files {0} and {1} would both be copied to member {2}".format(
+                    members[member_name], name, member_name
+                )
+            )
+        members[member_name] = name
+
+
 def _process_boolean(arg, default=False):
     try:
         return boolean(arg)
@@ -335,20 +639,6 @@ def _create_temp_path_name():
     return "ansible-zos-copy-payload-{0}-{1}".format(current_date, current_time)
 
 
-def _detect_sftp_errors(stderr):
-    """Detects if the stderr of the SFTP command contains any errors.
-       The SFTP command usually returns zero return code even if it
-       encountered an error while transferring data. Hence the need to parse
-       its stderr to determine what error it ran into.
-    """
-    # The first line of stderr is a connection acknowledgement,
-    # which can be ignored
-    lines = to_text(stderr).splitlines()
-    if len(lines) > 1:
-        return "".join(lines[1:])
-    return ""
-
-
 def _write_content_to_temp_file(content):
     """Write given content to a temp file and return its path """
     fd, path = mkstemp()
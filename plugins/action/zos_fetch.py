@@ -6,15 +6,18 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import os
-import subprocess
 import re
+import shutil
 
 from hashlib import sha256
-from ansible.module_utils._text import to_bytes, to_text
+from tempfile import mkdtemp, mkstemp
+from ansible.module_utils._text import to_bytes
 from ansible.module_utils.six import string_types
 from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.plugins.action import ActionBase
 from ansible.errors import AnsibleError
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import compress
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.sftp import SftpSession
 
 
 SUPPORTED_DS_TYPES = frozenset({'PS', 'PO', 'VSAM', 'USS'})
@@ -69,20 +72,6 @@ def _get_file_checksum(src):
     return hash_digest.hexdigest()
 
 
-def _detect_sftp_errors(stderr):
-    """Detects if the stderr of the SFTP command contains any errors.
-       The SFTP command usually returns zero return code even if it
-       encountered an error while transferring data. Hence the need to parse
-       its stderr to determine what error it ran into.
-    """
-    # The first line of stderr is a connection acknowledgement,
-    # which can be ignored
-    lines = to_text(stderr).splitlines()
-    if len(lines) > 1:
-        return "".join(lines[1:])
-    return ""
-
-
 class ActionModule(ActionBase):
     def run(self, tmp=None, task_vars=None):
         result = super(ActionModule, self).run(tmp, task_vars)
@@ -95,6 +84,7 @@ class ActionModule(ActionBase):
         dest = self._task.args.get('dest')
         encoding = self._task.args.get('encoding')
         sftp_port = self._task.args.get('sftp_port', 22)
+        compress_format = self._task.args.get('compress')
         flat = _process_boolean(self._task.args.get('flat'), default=False)
         is_binary = _process_boolean(self._task.args.get('is_binary'))
         validate_checksum = _process_boolean(
@@ -239,7 +229,10 @@ class ActionModule(ActionBase):
                     result["failed"] = True
                     return result
 
-                fetch_content = self._transfer_remote_content(dest, remote_path, ds_type, sftp_port)
+                if compress_format:
+                    fetch_content = self._transfer_remote_archive(dest, remote_path, sftp_port)
+                else:
+                    fetch_content = self._transfer_remote_content(dest, remote_path, ds_type, sftp_port)
                 if fetch_content.get('msg'):
                     return fetch_content
 
@@ -269,7 +262,7 @@ class ActionModule(ActionBase):
         # ********************************************************** #
 
         finally:
-            self._remote_cleanup(remote_path, ds_type, encoding)
+            self._remote_cleanup(remote_path, ds_type, encoding, is_compressed=bool(compress_format))
         return _update_result(result, src, dest, ds_type, is_binary=is_binary)
 
     def _transfer_remote_content(self, dest, remote_path, src_type, port):
@@ -278,37 +271,69 @@ class ActionModule(ActionBase):
             be removed.
         """
         result = dict()
-        ansible_user = self._play_context.remote_user
-        ansible_host = self._play_context.remote_addr
-
-        cmd = ['sftp', "-oPort={0}".format(port), ansible_user + '@' + ansible_host]
         stdin = "get -r {0} {1}".format(remote_path, dest)
         if src_type != "PO":
             stdin = stdin.replace(" -r", "")
 
-        transfer_pds = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        out, err = transfer_pds.communicate(to_bytes(stdin))
-        err = _detect_sftp_errors(err)
+        sftp = SftpSession(self._connection, self._play_context, port)
+        rc, out, err = sftp.run([stdin])
         if re.findall(r"Permission denied", err):
             result["msg"] = "Insufficient write permission for destination {0}".format(dest)
-        elif transfer_pds.returncode != 0 or err:
+        elif rc != 0 or err:
             result['msg'] = "Error transferring remote data from z/OS system"
-            result['rc'] = transfer_pds.returncode
+            result['rc'] = rc
         if result.get("msg"):
             result['stderr'] = err
             result['failed'] = True
         return result
 
-    def _remote_cleanup(self, remote_path, src_type, encoding):
+    def _transfer_remote_archive(self, dest, remote_path, port):
+        """ Transfer the compressed archive of a file or directory from USS
+            to the local machine and unpack it to the destination.
+        """
+        result = dict()
+        fd, local_archive = mkstemp(suffix=compress.ARCHIVE_SUFFIX)
+        os.close(fd)
+        unpack_dir = None
+        try:
+            sftp = SftpSession(self._connection, self._play_context, port)
+            rc, out, err = sftp.run(["get {0} {1}".format(remote_path, local_archive)])
+            if rc != 0 or err:
+                result['msg'] = "Error transferring remote data from z/OS system"
+                result['rc'] = rc
+                result['stderr'] = err
+                result['failed'] = True
+                return result
+
+            unpack_dir = mkdtemp(dir=os.path.dirname(dest) or None)
+            unpacked = compress.unpack(local_archive, unpack_dir)[0]
+            if os.path.isdir(unpacked) and os.path.isdir(dest):
+                for name in os.listdir(unpacked):
+                    os.replace(os.path.join(unpacked, name), os.path.join(dest, name))
+            else:
+                os.replace(unpacked, dest)
+        except (OSError, compress.CompressError) as err:
+            if isinstance(err, PermissionError):
+                result["msg"] = "Insufficient write permission for destination {0}".format(dest)
+            else:
+                result['msg'] = "Unable to unpack remote data to {0}".format(dest)
+            result['stderr'] = str(err)
+            result['failed'] = True
+        finally:
+            os.remove(local_archive)
+            if unpack_dir:
+                shutil.rmtree(unpack_dir, ignore_errors=True)
+        return result
+
+    def _remote_cleanup(self, remote_path, src_type, encoding, is_compressed=False):
         """Remove all temporary files and directories from the remote system"""
+        # A compressed archive is always temporary, it replaces the files
+        # the module would otherwise leave to transfer.
+        if is_compressed:
+            self._connection.exec_command("rm {0}".format(remote_path))
         # When fetching USS files and no encoding parameter is provided
         # do not remove the original file.
-        if not (src_type == "USS" and not encoding):
+        elif not (src_type == "USS" and not encoding):
             rm_cmd = "rm -r {0}".format(remote_path)
             if src_type != "PO":
                 rm_cmd = rm_cmd.replace(" -r", "")
@@ -35,6 +35,8 @@ class ActionModule(ActionBase):
             result["failed"] = True
             if source is None or dest_path is None:
                 result["msg"] = "src and dest are required"
+            elif isinstance(source, list):
+                result["msg"] = "a list of src is not supported for LOCAL"
             elif source is not None and source.endswith("/"):
                 result["msg"] = "src must be a file"
             else:
@@ -260,6 +260,21 @@ DOCUMENTATION = """
         vars:
           - name: ansible_scp_if_ssh
             version_added: '2.7'
+      zos_worker:
+        default: False
+        description:
+          - Run modules through a persistent worker process on the target instead of
+            starting a new Python interpreter for every task.
+          - The worker is installed in the C(.ansible) directory of the remote user on first use,
+            keeps ZOAU imported and exits after 10 minutes without tasks.
+          - Tasks run the normal way whenever the worker is not available.
+          - Only applies when pipelining is disabled.
+        env: [{name: ANSIBLE_ZOS_WORKER}]
+        ini:
+        - {key: zos_worker, section: ssh_connection}
+        type: bool
+        vars:
+          - name: ansible_zos_worker
       use_tty:
         version_added: '2.5'
         default: 'yes'
@@ -299,6 +314,10 @@ from ansible.plugins.connection import ConnectionBase, BUFSIZE
 from ansible.plugins.shell.powershell import _parse_clixml
 from ansible.utils.display import Display
 from ansible.utils.path import unfrackpath, makedirs_safe
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
+    rexx as zos_rexx,
+    worker as zos_worker,
+)
 
 display = Display()
 
@@ -310,6 +329,14 @@ b_NOT_SSH_ERRORS = (
 
 SSHPASS_AVAILABLE = None
 
+ZOS_WORKER_DIR = ".ansible"
+ZOS_WORKER_PATH = None
+ZOS_WORKER_MISSING = "__ZOS_WORKER_MISSING__"
+ZOS_WORKER_MISSING_REGEX = re.compile(to_bytes(r"{0}\r?\n".format(ZOS_WORKER_MISSING)))
+ZOS_WORKER_MODULE_REGEX = re.compile(
+    r"(?P<interpreter>\S+) (?P<module>\S+/AnsiballZ_\w+\.py)"
+)
+
 
 class AnsibleControlPersistBrokenPipeError(AnsibleError):
     """ ControlPersist broken pipe """
@@ -1368,6 +1395,63 @@ class Connection(ConnectionBase):
     #     # Convert all '\' to '/'
     #     return "%s%s" % (prefix, path.replace("\\", "/"))
 
+    def _zos_worker_path(self):
+        """ path of the worker script on the remote host, relative to the home directory,
+            in a directory named after the worker and the rexx module it imports,
+            which are only read and hashed once per process """
+        global ZOS_WORKER_PATH
+        if ZOS_WORKER_PATH is None:
+            digest = hashlib.sha256()
+            for module in (zos_worker, zos_rexx):
+                with open(module.__file__, "rb") as f:
+                    digest.update(f.read())
+            ZOS_WORKER_PATH = u"{0}/zos_worker_{1}/worker.py".format(
+                ZOS_WORKER_DIR, digest.hexdigest()[:16]
+            )
+        return ZOS_WORKER_PATH
+
+    def _zos_worker_command(self, cmd):
+        """ rewrites a module invocation so it runs through the persistent worker """
+        match = ZOS_WORKER_MODULE_REGEX.search(cmd)
+        if not match:
+            return cmd
+        worker_cmd = u'{0} -S -c "{1}" ~/{2} {3} {4}'.format(
+            match.group("interpreter"),
+            zos_worker.BOOTSTRAP,
+            self._zos_worker_path(),
+            ZOS_WORKER_MISSING,
+            match.group("module"),
+        )
+        return cmd[: match.start()] + worker_cmd + cmd[match.end() :]
+
+    def _install_zos_worker(self):
+        """ copies the worker script and the rexx module it imports to the remote host,
+            replacing each atomically, the worker last since its presence marks
+            the installation as complete """
+        out_path = self._zos_worker_path()
+        out_dir = os.path.dirname(out_path)
+        display.vvv(u"INSTALLING ZOS WORKER {0}".format(out_path), host=self.host)
+        try:
+            returncode, stdout, stderr = self.exec_command(
+                u"mkdir -p {0}".format(out_dir), sudoable=False
+            )
+            for module, name in ((zos_rexx, u"rexx.py"), (zos_worker, u"worker.py")):
+                if returncode != 0:
+                    break
+                tmp_path = u"{0}/{1}.{2}.tmp".format(out_dir, name, os.getpid())
+                self.put_file(module.__file__, tmp_path)
+                returncode, stdout, stderr = self.exec_command(
+                    u"mv -f {0} {1}/{2}".format(tmp_path, out_dir, name), sudoable=False
+                )
+        except AnsibleError as e:
+            returncode, stderr = 1, to_native(e)
+        if returncode != 0:
+            display.warning(
+                u"Unable to install the z/OS worker on {0}: {1}".format(
+                    self.host, to_text(stderr)
+                )
+            )
+
     def _zos_transport(self, path):
         """ determines whether to use scp or sftp based on the desired file encoding """
         # should sftp ascii arg be used for this?
@@ -1421,6 +1505,10 @@ class Connection(ConnectionBase):
             )
             cmd = " ".join(cmd_parts)
 
+        use_zos_worker = self.get_option("zos_worker") and not in_data
+        if use_zos_worker:
+            cmd = self._zos_worker_command(cmd)
+
         # we can only use tty when we are not pipelining the modules. piping
         # data into /usr/bin/python inside a tty automatically invokes the
         # python interactive-mode but the modules are not compatible with the
@@ -1446,6 +1534,14 @@ class Connection(ConnectionBase):
         ):
             stderr = _parse_clixml(stderr)
 
+        if use_zos_worker and (
+            ZOS_WORKER_MISSING_REGEX.search(stdout)
+            or ZOS_WORKER_MISSING_REGEX.search(stderr)
+        ):
+            stdout = ZOS_WORKER_MISSING_REGEX.sub(b"", stdout)
+            stderr = ZOS_WORKER_MISSING_REGEX.sub(b"", stderr)
+            self._install_zos_worker()
+
         return (returncode, stdout, stderr)
 
     def put_file(self, in_path, out_path):
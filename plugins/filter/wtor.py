@@ -4,19 +4,31 @@
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
+from collections import OrderedDict
+from threading import Lock
 import re
 
+from ansible.module_utils.six import string_types
 
-def filter_wtor_messages(wtor_response, text, ingore_case=False):
+PATTERN_CACHE_SIZE = 256
+BACKREFERENCE_REGEX = re.compile(r"\\[1-9]|\(\?P=")
+
+_pattern_cache = OrderedDict()
+_pattern_cache_lock = Lock()
+
+
+def filter_wtor_messages(wtor_response, text, ingore_case=False, first_only=False):
     """Filter a list of WTOR messages based on message text.
 
     Arguments:
         wtor_response {Union[dict, list[dict]]} -- The list structure in "actions" list returned by
         zos_operator_action_query or the entire return object from zos_operator_action_query.
-        text {str} -- String of text or regular expression to use as filter criteria.
+        text {Union[str, list[str]]} -- String of text or regular expression to use as filter criteria,
+        or a list of them to match WTOR messages matching any of them.
 
     Keyword Arguments:
         ingore_case {bool} -- Should search be case insensitive (default: {False})
+        first_only {bool} -- Stop at the first matching WTOR message (default: {False})
 
     Returns:
         list[dict] -- A list containing any WTOR objects matching search criteria
@@ -26,18 +38,52 @@ def filter_wtor_messages(wtor_response, text, ingore_case=False):
         wtors = wtor_response.get("actions")
     elif isinstance(wtor_response, list):
         wtors = wtor_response
+    patterns = _compile(text, ingore_case)
     found = []
     for wtor in wtors:
-        result = None
-        if ingore_case:
-            result = re.search(text, wtor.get("message_text", ""), re.IGNORECASE)
-        else:
-            result = re.search(text, wtor.get("message_text", ""))
-        if result:
+        message_text = wtor.get("message_text", "")
+        if any(pattern.search(message_text) for pattern in patterns):
             found.append(wtor)
+            if first_only:
+                break
     return found
 
 
+def _compile(text, ignore_case):
+    """Compile the filter criteria, reusing recently compiled criteria.
+    A list of regular expressions is compiled into a single alternation
+    unless they use backreferences or conflicting group names.
+
+    Arguments:
+        text {Union[str, list[str]]} -- The regular expression or list of regular expressions.
+        ignore_case {bool} -- Should search be case insensitive.
+
+    Returns:
+        list[Pattern] -- The compiled patterns, a message matches if any of them match.
+    """
+    texts = (text,) if isinstance(text, string_types) else tuple(text)
+    key = (texts, bool(ignore_case))
+    with _pattern_cache_lock:
+        patterns = _pattern_cache.pop(key, None)
+        if patterns is not None:
+            _pattern_cache[key] = patterns
+            return patterns
+    flags = re.IGNORECASE if ignore_case else 0
+    patterns = None
+    if len(texts) > 1 and not any(BACKREFERENCE_REGEX.search(t) for t in texts):
+        try:
+            patterns = [re.compile("|".join("(?:{0})".format(t) for t in texts), flags)]
+        except re.error:
+            patterns = None
+    if patterns is None:
+        patterns = [re.compile(t, flags) for t in texts]
+    with _pattern_cache_lock:
+        _pattern_cache[key] = patterns
+        while len(_pattern_cache) > PATTERN_CACHE_SIZE:
+            _pattern_cache.popitem(last=False)
+    return patterns
+
+
 class FilterModule(object):
     """ Jinja2 filters for use with WTOR response objects returned by zos_operator_action_query module. """
 
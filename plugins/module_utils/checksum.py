@@ -0,0 +1,59 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from hashlib import sha256
+
+from ansible.module_utils._text import to_bytes
+
+"""size of the blocks files are read in to calculate their checksum"""
+CHECKSUM_BLOCK_SIZE = 65536
+"""new line character of data set records read as EBCDIC text"""
+EBCDIC_NEW_LINE = b"\x15"
+
+
+def get_checksum(path, records=False):
+    """Calculate the SHA256 checksum of a file. The controller and the
+    managed node calculate it the same way, so a local source can be
+    compared with a destination before transferring it.
+
+    Arguments:
+        path {str} -- Path of the file.
+
+    Keyword Arguments:
+        records {bool} -- Whether the file is compared with the records of
+        a data set. Line endings, trailing blanks and trailing empty lines
+        are ignored, since text written to a data set does not keep them.
+        (default: {False})
+
+    Returns:
+        str -- The hex digest of the checksum.
+    """
+    digest = sha256()
+    with open(to_bytes(path, errors="surrogate_or_strict"), "rb") as infile:
+        if not records:
+            block = infile.read(CHECKSUM_BLOCK_SIZE)
+            while block:
+                digest.update(block)
+                block = infile.read(CHECKSUM_BLOCK_SIZE)
+            return digest.hexdigest()
+
+        empty_lines = 0
+        started = False
+        for line in infile:
+            for record in line.rstrip(b"\n").split(EBCDIC_NEW_LINE):
+                record = record.rstrip(b" \r")
+                if not record:
+                    empty_lines += 1
+                    continue
+                if started:
+                    digest.update(b"\n" * (empty_lines + 1))
+                else:
+                    digest.update(b"\n" * empty_lines)
+                    started = True
+                empty_lines = 0
+                digest.update(record)
+    return digest.hexdigest()
@@ -0,0 +1,119 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import tarfile
+
+from ansible.module_utils._text import to_text
+
+"""values of the compress option of zos_copy and zos_fetch"""
+COMPRESS_FORMATS = ("gzip", "zstd-fallback")
+"""suffix of the compressed archives files are transferred in"""
+ARCHIVE_SUFFIX = ".tar.gz"
+"""gzip level of the archives, most of the size reduction of the maximum
+level at a fraction of its cost"""
+COMPRESS_LEVEL = 6
+
+
+class CompressError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+        super(CompressError, self).__init__(msg)
+
+
+def get_tar_mode(compress):
+    """Get the mode tarfile opens an archive with for a value of the
+    compress option. zstd is not part of the Python standard library, so
+    'zstd-fallback' uses gzip.
+
+    Arguments:
+        compress {str} -- The value of the compress option.
+
+    Raises:
+        CompressError: When the compression format is not supported.
+
+    Returns:
+        str -- The compression suffix of the tarfile mode.
+    """
+    if compress not in COMPRESS_FORMATS:
+        raise CompressError(
+            "Invalid compression format {0}, expected one of: {1}".format(
+                compress, ", ".join(COMPRESS_FORMATS)
+            )
+        )
+    return "gz"
+
+
+def pack(paths, archive_path, compress="gzip"):
+    """Pack files and directories into a single compressed archive. Each of
+    them is kept in the archive under its base name, and symbolic links
+    are packed as the files they point to.
+
+    Arguments:
+        paths {list[str]} -- The files and directories to pack.
+        archive_path {str} -- Path the archive is written to.
+
+    Keyword Arguments:
+        compress {str} -- The value of the compress option. (default: {"gzip"})
+
+    Raises:
+        CompressError: When the compression format is not supported.
+    """
+    with tarfile.open(
+        archive_path,
+        "w:{0}".format(get_tar_mode(compress)),
+        compresslevel=COMPRESS_LEVEL,
+        dereference=True,
+    ) as archive:
+        for path in paths:
+            archive.add(path, arcname=os.path.basename(path.rstrip("/")))
+
+
+def unpack(archive_path, dest_dir):
+    """Unpack an archive written by pack into a directory.
+
+    Arguments:
+        archive_path {str} -- Path of the archive.
+        dest_dir {str} -- The directory to unpack the archive into.
+
+    Raises:
+        CompressError: When the archive is not valid or holds anything other
+        than files and directories below the directory.
+
+    Returns:
+        list[str] -- The paths of the unpacked files and directories
+        the archive was packed from.
+    """
+    try:
+        with tarfile.open(archive_path, "r:*") as archive:
+            members = archive.getmembers()
+            for member in members:
+                parts = member.name.split("/")
+                if (
+                    member.name.startswith("/")
+                    or ".." in parts
+                    or not (member.isfile() or member.isdir())
+                ):
+                    raise CompressError(
+                        "Archive {0} has an entry that can not be unpacked: {1}".format(
+                            archive_path, member.name
+                        )
+                    )
+            if hasattr(tarfile, "data_filter"):
+                archive.extractall(dest_dir, members, filter="fully_trusted")
+            else:
+                archive.extractall(dest_dir, members)
+    except (tarfile.TarError, EOFError, OSError) as err:
+        raise CompressError(
+            "Unable to unpack archive {0}: {1}".format(archive_path, to_text(err))
+        )
+    names = []
+    for member in members:
+        name = member.name.split("/")[0]
+        if name not in names:
+            names.append(name)
+    return [os.path.join(dest_dir, name) for name in names]
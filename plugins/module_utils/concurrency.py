@@ -0,0 +1,57 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from threading import Lock, Thread
+import sys
+
+
+def map_concurrently(function, items, max_workers):
+    """Apply a function to every item on at most max_workers threads.
+    Uses plain threads rather than multiprocessing pools, which need
+    POSIX semaphores that are not available on every system.
+
+    Arguments:
+        function {callable} -- The function to apply to each item.
+        items {list} -- The items to apply the function to.
+        max_workers {int} -- The maximum number of threads to use.
+
+    Raises:
+        Exception: The first exception raised by the function, once all
+        threads have finished.
+
+    Returns:
+        list -- The result for each item, in the order of the items.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    errors = []
+    pending = iter(enumerate(items))
+    lock = Lock()
+
+    def worker():
+        while True:
+            with lock:
+                item = next(pending, None)
+            if item is None:
+                return
+            index, value = item
+            try:
+                results[index] = function(value)
+            except BaseException:
+                errors.append((index, sys.exc_info()[1]))
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [function(value) for value in items]
+    threads = [Thread(target=worker) for i in range(min(max_workers, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise min(errors, key=lambda error: error[0])[1]
+    return results
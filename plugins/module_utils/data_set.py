@@ -7,6 +7,7 @@ __metaclass__ = type
 
 import re
 import tempfile
+from collections import OrderedDict
 from os import path
 from random import choice
 from string import ascii_uppercase, digits
@@ -22,6 +23,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler im
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
     better_arg_parser,
+    metadata_cache,
     mvs_cmd,
 )
 
@@ -259,6 +261,20 @@ class DataSet(object):
     def data_set_cataloged(name):
         """Determine if a data set is in catalog.
 
+        Arguments:
+            name (str) -- The data set name to check if cataloged.
+
+        Returns:
+            bool -- If data is is cataloged.
+        """
+        return metadata_cache.lookup(
+            "cataloged", name, None, lambda: DataSet._data_set_cataloged(name)
+        )
+
+    @staticmethod
+    def _data_set_cataloged(name):
+        """Use LISTCAT command to determine if a data set is in catalog.
+
         Arguments:
             name (str) -- The data set name to check if cataloged.
 
@@ -348,12 +364,12 @@ class DataSet(object):
         Returns:
             bool -- If data set was found in table of contents for volume.
         """
-        data_sets = vtoc.get_volume_entry(volume)
-        data_set = vtoc.find_data_set_in_volume_output(name, data_sets)
+        data_sets = vtoc.get_volume_index(volume)
+        data_set = data_sets.get(name)
         if data_set is not None:
             return True
         vsam_name = name + ".data"
-        vsam_data_set = vtoc.find_data_set_in_volume_output(vsam_name, data_sets)
+        vsam_data_set = data_sets.get(vsam_name)
         if vsam_data_set is not None:
             return True
         return False
@@ -543,6 +559,7 @@ class DataSet(object):
         original_args = locals()
         formatted_args = DataSet._build_zoau_args(**original_args)
         rc = Datasets.create(**formatted_args)
+        metadata_cache.invalidate(name)
         if rc > 0:
             raise DatasetCreateError(name, rc)
         return
@@ -559,6 +576,7 @@ class DataSet(object):
             DatasetDeleteError: When data set deletion fails.
         """
         rc = Datasets.delete(name)
+        metadata_cache.invalidate(name)
         if rc > 0:
             raise DatasetDeleteError(name, rc)
         return
@@ -612,10 +630,13 @@ class DataSet(object):
             name (str) -- The name of the data set to catalog.
             volumes (list[str]) -- The volume(s) the data set resides on.
         """
-        if DataSet.is_vsam(name, volumes):
-            DataSet._catalog_vsam(name, volumes)
-        else:
-            DataSet._catalog_non_vsam(name, volumes)
+        try:
+            if DataSet.is_vsam(name, volumes):
+                DataSet._catalog_vsam(name, volumes)
+            else:
+                DataSet._catalog_non_vsam(name, volumes)
+        finally:
+            metadata_cache.invalidate(name)
 
     @staticmethod
     # TODO: extend for multi volume data sets
@@ -714,10 +735,13 @@ class DataSet(object):
         Arguments:
             name (str) -- The name of the data set to uncatalog.
         """
-        if DataSet.is_vsam(name):
-            DataSet._uncatalog_vsam(name)
-        else:
-            DataSet._uncatalog_non_vsam(name)
+        try:
+            if DataSet.is_vsam(name):
+                DataSet._uncatalog_vsam(name)
+            else:
+                DataSet._uncatalog_non_vsam(name)
+        finally:
+            metadata_cache.invalidate(name)
         return
 
     @staticmethod
@@ -794,26 +818,25 @@ class DataSet(object):
         """
         if not volumes:
             return DataSet._is_vsam_from_listcat(name)
-        # ? will multivolume data set have vtoc info for each volume?
-        return DataSet._is_vsam_from_vtoc(name, volumes[0])
+        return DataSet._is_vsam_from_vtoc(name, volumes)
 
     @staticmethod
-    def _is_vsam_from_vtoc(name, volume):
+    def _is_vsam_from_vtoc(name, volumes):
         """Use VTOC to determine if a given data set is VSAM.
+        The table of contents of every volume is searched, since a
+        multivolume data set may not have an entry on each of them.
 
         Arguments:
             name (str) -- The name of the data set.
-            volume (str) -- The volume name whose table of contents will be searched.
+            volumes (list[str]) -- The volume names whose table of contents will be searched.
 
         Returns:
             bool -- If the data set is VSAM.
         """
-        data_sets = vtoc.get_volume_entry(volume)
+        data_sets = vtoc.get_volume_entries(volumes)
         vsam_name = name + ".DATA"
-        data_set = vtoc.find_data_set_in_volume_output(vsam_name, data_sets)
-        if data_set is None:
-            data_set = vtoc.find_data_set_in_volume_output(name, data_sets)
-        if data_set is not None:
+        entries = data_sets.get(vsam_name) or data_sets.get(name)
+        for data_set in entries:
             if data_set.get("data_set_organization", "") == "VS":
                 return True
         return False
@@ -822,6 +845,20 @@ class DataSet(object):
     def _is_vsam_from_listcat(name):
         """Use LISTCAT command to determine if a given data set is VSAM.
 
+        Arguments:
+            name (str) -- The name of the data set.
+
+        Returns:
+            bool -- If the data set is VSAM.
+        """
+        return metadata_cache.lookup(
+            "vsam", name, None, lambda: DataSet._listcat_is_vsam(name)
+        )
+
+    @staticmethod
+    def _listcat_is_vsam(name):
+        """Run LISTCAT to determine if a given data set is VSAM.
+
         Arguments:
             name (str) -- The name of the data set.
 
@@ -1063,23 +1100,130 @@ class DatasetWriteError(Exception):
 
 LISTDS_COMMAND = "  LISTDS '{0}'"
 LISTCAT_COMMAND = "  LISTCAT ENT({0}) ALL"
+BULK_LISTDS_COMMAND = "  LISTDS ( -\n{0} -\n  )"
+BULK_LISTCAT_COMMAND = "  LISTCAT ENT( -\n{0} -\n  ) ALL"
+BULK_CHUNK_SIZE = 50
+LISTDS_NOT_IN_CATALOG_REGEX = re.compile(r"DATA SET '([^']+)' NOT IN CATALOG")
+LISTCAT_NOT_FOUND_REGEX = re.compile(r"ENTRY (?:\([A-Z]\) )?(\S+) NOT FOUND")
+LISTCAT_ENTRY_REGEX = re.compile(r"^\s*[A-Z][A-Z ]*?-{3,}\s*(\S+)\s*$", re.MULTILINE)
 
 
 class DataSetUtils(object):
-    def __init__(self, data_set):
+    def __init__(self, data_set, ds_info=None):
         """A standard utility to gather information about
         a particular data set. Note that the input data set is assumed
         to be cataloged.
 
         Arguments:
             data_set {str} -- Name of the input data set
+
+        Keyword Arguments:
+            ds_info {dict} -- Attributes of the data set that were already
+            gathered, see DataSetUtils.bulk (default: {None})
         """
         self.module = AnsibleModuleHelper(argument_spec={})
         self.data_set = data_set
         self.is_uss_path = "/" in data_set
         self.ds_info = dict()
-        if not self.is_uss_path:
-            self.ds_info = self._gather_data_set_info()
+        if ds_info is not None:
+            self.ds_info = ds_info
+        elif not self.is_uss_path:
+            self.ds_info = dict(
+                metadata_cache.lookup(
+                    "info", data_set, None, self._gather_data_set_info
+                )
+            )
+
+    @classmethod
+    def bulk(cls, names):
+        """Gather information about many data sets at once. All the data sets
+        that are not cached yet are listed by a single LISTDS and a single
+        LISTCAT, instead of one of each per data set.
+
+        Arguments:
+            names {list[str]} -- Names of the input data sets or USS paths
+
+        Raises:
+            DatasetBusyError: When a data set is being edited by another user
+            MVSCmdExecError: When LISTDS or LISTCAT fail for another reason
+            than a data set not being cataloged
+
+        Returns:
+            OrderedDict[str, DataSetUtils] -- The utility of each input name
+        """
+        data_sets = []
+        for name in names:
+            if "/" not in name and name.upper() not in data_sets:
+                data_sets.append(name.upper())
+        info = metadata_cache.lookup_many("info", data_sets, None, cls._bulk_info)
+        result = OrderedDict()
+        for name in names:
+            ds_info = None
+            if "/" not in name:
+                ds_info = dict(info.get(name.upper()))
+            result[name] = cls(name, ds_info=ds_info)
+        return result
+
+    @classmethod
+    def _bulk_info(cls, data_sets):
+        """List many data sets with LISTDS and LISTCAT.
+
+        Arguments:
+            data_sets {list[str]} -- Upper case names of the data sets
+
+        Returns:
+            dict -- The attributes of each data set
+        """
+        info = dict((data_set, dict()) for data_set in data_sets)
+        cls._bulk_listds(data_sets, info)
+        cls._bulk_listcat(data_sets, info)
+        return info
+
+    @classmethod
+    def _bulk_listds(cls, data_sets, info):
+        """List many data sets with LISTDS and add their attributes to info.
+
+        Arguments:
+            data_sets {list[str]} -- Upper case names of the data sets
+            info {dict} -- The attributes of each data set, updated in place
+        """
+        cmd = "\n".join(
+            BULK_LISTDS_COMMAND.format(
+                " -\n".join("    '{0}'".format(data_set) for data_set in chunk)
+            )
+            for chunk in _chunks(data_sets, BULK_CHUNK_SIZE)
+        )
+        rc, out, err = mvs_cmd.ikjeft01(cmd, authorized=True)
+        if rc != 0:
+            if re.findall(r"ALREADY IN USE", out):
+                raise DatasetBusyError(", ".join(data_sets))
+            if not re.findall(r"NOT IN CATALOG", out):
+                raise MVSCmdExecError(rc, out, err)
+        for data_set in LISTDS_NOT_IN_CATALOG_REGEX.findall(out):
+            if data_set in info:
+                info[data_set]["exists"] = False
+        for data_set, section in _sections(out, data_sets, _listds_section_start):
+            info[data_set].update(cls._process_listds_output(section))
+
+    @classmethod
+    def _bulk_listcat(cls, data_sets, info):
+        """List many data sets with LISTCAT and add their attributes to info.
+
+        Arguments:
+            data_sets {list[str]} -- Upper case names of the data sets
+            info {dict} -- The attributes of each data set, updated in place
+        """
+        cmd = "\n".join(
+            BULK_LISTCAT_COMMAND.format(
+                " -\n".join("    {0}".format(data_set) for data_set in chunk)
+            )
+            for chunk in _chunks(data_sets, BULK_CHUNK_SIZE)
+        )
+        rc, out, err = mvs_cmd.idcams(cmd, authorized=True)
+        if rc != 0 and not re.findall(r"NOT FOUND|NOT LISTED", out):
+            raise MVSCmdExecError(rc, out, err)
+        for data_set, section in _sections(out, data_sets, _listcat_section_start):
+            info[data_set].update(cls._process_listcat_output(section))
 
     def exists(self):
         """Determines whether the input data set exists. The input data
@@ -1227,7 +1371,8 @@ class DataSetUtils(object):
                 raise MVSCmdExecError(listcat_rc, listcat_out, listcat_err)
         return result
 
-    def _process_listds_output(self, output):
+    @staticmethod
+    def _process_listds_output(output):
         """Parses the output generated by LISTDS command.
 
         Arguments:
@@ -1252,7 +1397,8 @@ class DataSetUtils(object):
                         result["blksize"] = int(ds_params[2])
         return result
 
-    def _process_listcat_output(self, output):
+    @staticmethod
+    def _process_listcat_output(output):
         """Parses the output generated by LISTCAT command.
 
         Arguments:
@@ -1262,14 +1408,68 @@ class DataSetUtils(object):
             dict -- Dictionary containing the output parameters of LISTCAT
         """
         result = dict()
-        if "NOT FOUND" not in output:
-            volser_output = re.findall(r"VOLSER-*[A-Z|0-9]*", output)
+        volser_output = re.findall(r"VOLSER-*[A-Z|0-9]*", output)
+        if "NOT FOUND" not in output and volser_output:
             result["volser"] = "".join(
                 re.findall(r"-[A-Z|0-9]*", volser_output[0])
             ).replace("-", "")
         return result
 
 
+def _chunks(items, size):
+    """Split a list into lists of at most size items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _listds_section_start(line):
+    """Get the data set a line of LISTDS output starts the listing of,
+    or False if it ends the listing of the previous data set."""
+    if LISTDS_NOT_IN_CATALOG_REGEX.search(line):
+        return False
+    return line.strip()
+
+
+def _listcat_section_start(line):
+    """Get the entry a line of LISTCAT output starts the listing of,
+    or False if it ends the listing of the previous entry."""
+    if LISTCAT_NOT_FOUND_REGEX.search(line):
+        return False
+    match = LISTCAT_ENTRY_REGEX.match(line)
+    return match.group(1) if match else None
+
+
+def _sections(output, data_sets, section_start):
+    """Split the output of a command listing many data sets into the part
+    about each data set.
+
+    Arguments:
+        output {str} -- The output of the command
+        data_sets {list[str]} -- Upper case names of the listed data sets
+        section_start {callable} -- Gets the data set a line starts the listing
+        of, if any, or False if the line ends the listing of a data set
+
+    Returns:
+        list[tuple(str, str)] -- The name of each listed data set and the part
+        of the output about it
+    """
+    wanted = set(data_sets)
+    sections = []
+    lines = None
+    for line in output.splitlines():
+        data_set = section_start(line)
+        if data_set is False:
+            lines = None
+        elif data_set in wanted:
+            lines = []
+            sections.append((data_set, lines))
+        elif lines is not None:
+            lines.append(line)
+    return [
+        (data_set, "\n".join([data_set] + lines) + "\n")
+        for data_set, lines in sections
+    ]
+
+
 def is_member(data_set):
     """Determine whether the input string specifies a data set member"""
     try:
@@ -1345,6 +1545,21 @@ def extract_member_name(data_set):
     return member
 
 
+def member_name_from_file(file_name):
+    """Get the name of the member a file is copied to, the name of the
+    file without its extension in upper case
+
+    Arguments:
+        file_name {str} -- The name of the file
+
+    Returns:
+        {str} -- The member name
+    """
+    if "." in file_name:
+        file_name = file_name[: file_name.rfind(".")]
+    return file_name.upper()
+
+
 def temp_member_name():
     """Generate a temp member name"""
     first_char_set = ascii_uppercase + "#@$"
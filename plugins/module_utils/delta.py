@@ -0,0 +1,295 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from hashlib import sha256
+from itertools import accumulate
+from math import sqrt
+import mmap
+import os
+import struct
+
+from ansible.module_utils._text import to_bytes
+
+"""smallest and largest block size of a file signature"""
+MIN_BLOCK_SIZE = 4096
+MAX_BLOCK_SIZE = 1048576
+"""modulus of the two halves of the rolling checksum"""
+WEAK_MODULUS = 65536
+"""number of hex digits of the block hash kept in a signature"""
+STRONG_DIGEST_SIZE = 16
+"""identifies a delta file and its format version"""
+DELTA_MAGIC = b"ZDLT1"
+"""largest run of new data written as a single delta instruction"""
+MAX_LITERAL_SIZE = 1048576
+"""fraction of a file that can be new data before its delta is abandoned,
+searching changed data for blocks is much slower than sending it"""
+MAX_LITERAL_RATIO = 0.5
+
+COPY_HEADER = struct.Struct(">cQI")
+DATA_HEADER = struct.Struct(">cI")
+COPY_OP = b"C"
+DATA_OP = b"D"
+
+
+class DeltaError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+        super(DeltaError, self).__init__(msg)
+
+
+class DeltaTooLargeError(DeltaError):
+    def __init__(self, limit):
+        self.msg = "More than {0} bytes of the new file are not in the old file".format(
+            limit
+        )
+        super(DeltaTooLargeError, self).__init__(self.msg)
+
+
+def get_block_size(size):
+    """Choose the block size of a signature for a file, about the square
+    root of its size so signatures stay small for large files.
+
+    Arguments:
+        size {int} -- The size of the file in bytes.
+
+    Returns:
+        int -- The block size in bytes.
+    """
+    block_size = int(sqrt(size)) // 1024 * 1024
+    return min(max(block_size, MIN_BLOCK_SIZE), MAX_BLOCK_SIZE)
+
+
+def get_signature(path, block_size=None):
+    """Calculate the signature of a file, the rolling and strong checksum
+    of each of its blocks, which is all the sender needs to know about the
+    file to send only the blocks that changed.
+
+    Arguments:
+        path {str} -- Path of the file.
+
+    Keyword Arguments:
+        block_size {int} -- The block size, chosen from the size of the
+        file when not given. (default: {None})
+
+    Returns:
+        dict -- The block size, the size of the file and, for each block,
+        a list of its rolling checksum and strong checksum.
+    """
+    b_path = to_bytes(path, errors="surrogate_or_strict")
+    if block_size is None:
+        block_size = get_block_size(os.stat(b_path).st_size)
+    blocks = []
+    size = 0
+    with open(b_path, "rb") as infile:
+        block = infile.read(block_size)
+        while block:
+            size += len(block)
+            blocks.append([_weak_checksum(block), _strong_checksum(block)])
+            block = infile.read(block_size)
+    return dict(block_size=block_size, size=size, blocks=blocks)
+
+
+def write_delta(path, signature, delta_path, max_literal_ratio=MAX_LITERAL_RATIO):
+    """Write the instructions to rebuild a file from the file a signature
+    was calculated for. Blocks found anywhere in the new file are copied
+    from the old one, everything else is sent as data.
+
+    Arguments:
+        path {str} -- Path of the new file.
+        signature {dict} -- The signature of the old file.
+        delta_path {str} -- Path the delta is written to.
+
+    Keyword Arguments:
+        max_literal_ratio {float} -- The fraction of the new file that can
+        be sent as data, None for no limit. (default: {0.5})
+
+    Raises:
+        DeltaTooLargeError: When more of the new file than max_literal_ratio
+        would be sent as data, the whole file should be sent instead.
+
+    Returns:
+        int -- The number of bytes of new data in the delta.
+    """
+    block_size = signature.get("block_size")
+    blocks = signature.get("blocks")
+    index = dict()
+    for i, (weak, strong) in enumerate(blocks):
+        index.setdefault(weak, []).append((strong, i))
+    # the last block of the old file may be shorter, it can only match
+    # at the end of the new file
+    tail = None
+    tail_size = signature.get("size") - block_size * (len(blocks) - 1)
+    if blocks and tail_size < block_size:
+        tail = (len(blocks) - 1, tail_size, blocks[-1][1])
+
+    writer = _DeltaWriter(delta_path)
+    try:
+        with open(to_bytes(path, errors="surrogate_or_strict"), "rb") as infile:
+            size = os.fstat(infile.fileno()).st_size
+            if not size:
+                return 0
+            if max_literal_ratio is not None:
+                writer.max_literal_size = int(size * max_literal_ratio)
+            data = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                _write_delta_ops(data, size, block_size, index, tail, writer)
+            finally:
+                data.close()
+    finally:
+        writer.close()
+    return writer.literal_size
+
+
+def _write_delta_ops(data, size, block_size, index, tail, writer):
+    pos = 0
+    literal_start = 0
+    a = b = None
+    while pos + block_size <= size:
+        if a is None:
+            a, b = _weak_sums(data[pos : pos + block_size])
+        match = None
+        candidates = index.get((b << 16) | a)
+        if candidates:
+            strong = _strong_checksum(data[pos : pos + block_size])
+            for candidate, i in candidates:
+                if candidate == strong:
+                    match = i
+                    break
+        if match is not None:
+            writer.data(data, literal_start, pos)
+            writer.copy(match)
+            pos += block_size
+            literal_start = pos
+            a = None
+            continue
+        if pos + block_size < size:
+            out_byte = data[pos]
+            a = (a - out_byte + data[pos + block_size]) % WEAK_MODULUS
+            b = (b - block_size * out_byte + a) % WEAK_MODULUS
+        pos += 1
+        if pos - literal_start >= MAX_LITERAL_SIZE:
+            writer.data(data, literal_start, pos)
+            literal_start = pos
+
+    end = size
+    if tail is not None:
+        last, tail_size, strong = tail
+        if size - literal_start >= tail_size and (
+            _strong_checksum(data[size - tail_size : size]) == strong
+        ):
+            end = size - tail_size
+    writer.data(data, literal_start, end)
+    if end != size:
+        writer.copy(last)
+
+
+def apply_delta(basis_path, delta_path, out_path, block_size):
+    """Rebuild a file from the file its signature was calculated for and
+    a delta written by write_delta.
+
+    Arguments:
+        basis_path {str} -- Path of the old file.
+        delta_path {str} -- Path of the delta.
+        out_path {str} -- Path the new file is written to.
+        block_size {int} -- The block size of the signature.
+
+    Raises:
+        DeltaError: When the delta is not valid for the old file.
+    """
+    with open(to_bytes(basis_path, errors="surrogate_or_strict"), "rb") as basis, open(
+        to_bytes(delta_path, errors="surrogate_or_strict"), "rb"
+    ) as delta, open(to_bytes(out_path, errors="surrogate_or_strict"), "wb") as out:
+        if delta.read(len(DELTA_MAGIC)) != DELTA_MAGIC:
+            raise DeltaError("{0} is not a delta file".format(delta_path))
+        while True:
+            op = delta.read(1)
+            if not op:
+                return
+            if op == COPY_OP:
+                header = delta.read(COPY_HEADER.size - 1)
+                if len(header) != COPY_HEADER.size - 1:
+                    raise DeltaError("Delta file {0} is truncated".format(delta_path))
+                op, start, count = COPY_HEADER.unpack(op + header)
+                basis.seek(start * block_size)
+                remaining = count * block_size
+                while remaining:
+                    block = basis.read(min(remaining, MAX_LITERAL_SIZE))
+                    if not block:
+                        break
+                    out.write(block)
+                    remaining -= len(block)
+            elif op == DATA_OP:
+                header = delta.read(DATA_HEADER.size - 1)
+                if len(header) != DATA_HEADER.size - 1:
+                    raise DeltaError("Delta file {0} is truncated".format(delta_path))
+                op, length = DATA_HEADER.unpack(op + header)
+                literal = delta.read(length)
+                if len(literal) != length:
+                    raise DeltaError("Delta file {0} is truncated".format(delta_path))
+                out.write(literal)
+            else:
+                raise DeltaError("Delta file {0} is not valid".format(delta_path))
+
+
+class _DeltaWriter(object):
+    def __init__(self, path):
+        """Writes delta instructions, merging copies of consecutive blocks."""
+        self.out = open(to_bytes(path, errors="surrogate_or_strict"), "wb")
+        self.out.write(DELTA_MAGIC)
+        self.copy_start = None
+        self.copy_count = 0
+        self.literal_size = 0
+        self.max_literal_size = None
+
+    def copy(self, block):
+        if self.copy_start is not None and self.copy_start + self.copy_count == block:
+            self.copy_count += 1
+            return
+        self._flush_copy()
+        self.copy_start = block
+        self.copy_count = 1
+
+    def data(self, data, start, end):
+        if end <= start:
+            return
+        self.literal_size += end - start
+        if (
+            self.max_literal_size is not None
+            and self.literal_size > self.max_literal_size
+        ):
+            raise DeltaTooLargeError(self.max_literal_size)
+        self._flush_copy()
+        self.out.write(DATA_HEADER.pack(DATA_OP, end - start))
+        self.out.write(data[start:end])
+
+    def close(self):
+        self._flush_copy()
+        self.out.close()
+
+    def _flush_copy(self):
+        if self.copy_start is not None:
+            self.out.write(COPY_HEADER.pack(COPY_OP, self.copy_start, self.copy_count))
+            self.copy_start = None
+            self.copy_count = 0
+
+
+def _weak_sums(block):
+    """The two halves of the rsync rolling checksum of a block,
+    computed with builtins rather than a loop over its bytes."""
+    return (
+        sum(block) % WEAK_MODULUS,
+        sum(accumulate(bytearray(block))) % WEAK_MODULUS,
+    )
+
+
+def _weak_checksum(block):
+    a, b = _weak_sums(block)
+    return (b << 16) | a
+
+
+def _strong_checksum(block):
+    return sha256(block).hexdigest()[:STRONG_DIGEST_SIZE]
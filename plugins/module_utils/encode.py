@@ -6,13 +6,16 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from tempfile import NamedTemporaryFile, TemporaryDirectory, mkstemp
+from tempfile import NamedTemporaryFile, TemporaryDirectory, gettempdir, mkstemp
+from hashlib import sha256
 from math import floor, ceil
 from os import path, walk, makedirs, unlink
 from ansible.module_utils.six import PY3
+from ansible.module_utils._text import to_bytes, to_text
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
     AnsibleModuleHelper,
 )
+import codecs
 import shutil
 import errno
 import os
@@ -24,7 +27,11 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler im
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import copy
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
+    concurrency,
+    copy,
+    rexx,
+)
 
 try:
     from zoautil_py import Datasets, MVSCmd
@@ -41,6 +48,36 @@ else:
 
 LISTCAT = " LISTCAT ENT('{}') ALL"
 
+"""the number of files converted at the same time by default"""
+DEFAULT_MAX_WORKERS = 5
+
+"""the number of bytes converted at a time by in process conversions"""
+CONVERSION_CHUNK_SIZE = 65536
+
+"""single byte EBCDIC code sets that can be converted in process, with the
+Python codec they are derived from and the pairs of bytes whose characters
+are swapped relative to it"""
+EBCDIC_CODE_SETS = {
+    "IBM-037": ("cp037", ()),
+    "IBM-1047": ("cp037", ((0x5F, 0xB0), (0xAD, 0xBA), (0xBB, 0xBD))),
+}
+
+"""other code sets that can be converted in process, with their Python codec"""
+PYTHON_CODE_SETS = {
+    "ISO8859-1": "latin-1",
+    "UTF-8": "utf-8",
+}
+
+_decoding_tables = dict()
+
+"""environment variable that can override the directory the iconv code set list is cached in"""
+CODE_SET_CACHE_DIR_ENV = "ZOS_CORE_CODE_SET_CACHE_DIR"
+CODE_SET_CACHE_DIR_PREFIX = "ibm_zos_core_code_sets_"
+ENCODING_REGEX = re.compile(r"^[A-Z0-9-]{2,}\Z", re.IGNORECASE)
+
+_iconv_lists = dict()
+_code_sets = dict()
+
 
 class EncodeUtils(object):
     def __init__(self):
@@ -71,10 +108,16 @@ class EncodeUtils(object):
         return parsed_args.get("path")
 
     def _validate_encoding(self, encoding):
-        arg_defs = dict(encoding=dict(arg_type="encoding"),)
-        parser = BetterArgParser(arg_defs)
-        parsed_args = parser.parse_args({"encoding": encoding})
-        return parsed_args.get("encoding")
+        if not ENCODING_REGEX.match(str(encoding)):
+            raise ValueError(
+                'Invalid argument "{0}" for type "encoding".'.format(encoding)
+            )
+        code_sets = get_code_sets(self.module)
+        if code_sets and str(encoding).upper() not in code_sets:
+            raise ValueError(
+                'Invalid argument "{0}" for type "encoding".'.format(encoding)
+            )
+        return str(encoding)
 
     def listdsi_data_set(self, ds):
         """Invoke IDCAMS LISTCAT command to get the record length and space used
@@ -156,21 +199,26 @@ class EncodeUtils(object):
         return temp_ps
 
     def get_codeset(self):
-        """Get the list of supported encodings from the  USS command 'iconv -l'
+        """Get the list of supported encodings from the  USS command 'iconv -l'.
+        The list is cached, see list_iconv_code_sets.
 
         Raises:
             EncodeError: When any exception is raised during the conversion
         Returns:
-            list -- The code set list supported in current USS platform
+            frozenset -- The code set list supported in current USS platform
         """
         code_set = None
-        iconv_list_cmd = ["iconv", "-l"]
-        rc, out, err = self.module.run_command(iconv_list_cmd)
+        rc, out, err = list_iconv_code_sets(self.module)
         if rc:
             raise EncodeError(err)
         if out:
-            code_set_list = list(filter(None, re.split(r"[\n|\t]", out)))
-            code_set = [c for i, c in enumerate(code_set_list) if i > 0 and i % 2 == 0]
+            code_set = _code_sets.get(out)
+            if code_set is None:
+                code_set_list = list(filter(None, re.split(r"[\n|\t]", out)))
+                code_set = frozenset(
+                    c for i, c in enumerate(code_set_list) if i > 0 and i % 2 == 0
+                )
+                _code_sets[out] = code_set
         return code_set
 
     def string_convert_encoding(self, src, from_encoding, to_encoding):
@@ -188,6 +236,16 @@ class EncodeUtils(object):
         """
         from_encoding = self._validate_encoding(from_encoding)
         to_encoding = self._validate_encoding(to_encoding)
+        if can_convert_in_process(from_encoding, to_encoding):
+            try:
+                out = convert_bytes(
+                    to_bytes(src, errors="surrogate_or_strict"),
+                    from_encoding,
+                    to_encoding,
+                )
+            except UnicodeError as e:
+                raise EncodeError(e)
+            return to_text(out, errors="surrogate_or_strict")
         iconv_cmd = "printf {0} | iconv -f {1} -t {2}".format(
             quote(src), quote(from_encoding), quote(to_encoding)
         )
@@ -225,9 +283,12 @@ class EncodeUtils(object):
             quote(from_code), quote(to_code), quote(src), quote(temp_fi)
         )
         try:
-            rc, out, err = self.module.run_command(iconv_cmd, use_unsafe_shell=True)
-            if rc:
-                raise EncodeError(err)
+            if can_convert_in_process(from_code, to_code):
+                self._convert_file_in_process(src, temp_fi, from_code, to_code)
+            else:
+                rc, out, err = self.module.run_command(iconv_cmd, use_unsafe_shell=True)
+                if rc:
+                    raise EncodeError(err)
             if dest == temp_fi:
                 convert_rc = True
             else:
@@ -252,7 +313,71 @@ class EncodeUtils(object):
                         raise
         return convert_rc
 
-    def uss_convert_encoding_prev(self, src, dest, from_code, to_code):
+    def _convert_file_in_process(self, src, dest, from_code, to_code):
+        """Convert the encoding of a USS file with Python codecs
+        instead of starting iconv.
+
+        Arguments:
+            src: {str} -- The input file name
+            dest: {str} -- The output file name
+            from_code: {str} -- The source code set of the input file
+            to_code: {str} -- The destination code set for the output file
+
+        Raises:
+            EncodeError: When the file cannot be read, written or converted.
+        """
+        try:
+            with open(src, "rb") as src_fo, open(dest, "wb") as dest_fo:
+                convert_stream(src_fo, dest_fo, from_code, to_code)
+        except (IOError, OSError, UnicodeError) as e:
+            raise EncodeError(e)
+
+    def uss_convert_encoding_files(
+        self, files, from_code, to_code, max_workers=DEFAULT_MAX_WORKERS
+    ):
+        """Convert the encoding of several USS files, converting up to
+        max_workers files at the same time
+
+        Arguments:
+            files: {list[tuple]} -- The input and output file name of each file
+            from_code: {str} -- The source code set of the input files
+            to_code: {str} -- The destination code set for the output files
+
+        Keyword Arguments:
+            max_workers {int} -- The maximum number of files to convert at once (default: {5})
+
+        Raises:
+            EncodeError: When any file is not converted, naming every file
+            that failed in the order they were given.
+        Returns:
+            boolean -- Indicate whether the conversion is successful or not.
+        """
+
+        def convert(file):
+            try:
+                if self.uss_convert_encoding(file[0], file[1], from_code, to_code):
+                    return None
+                return "The conversion was not successful."
+            except Exception as e:
+                return e
+
+        errors = concurrency.map_concurrently(convert, files, max_workers)
+        failed = [
+            "{0}: {1}".format(file[0], error)
+            for file, error in zip(files, errors)
+            if error is not None
+        ]
+        if failed:
+            raise EncodeError(
+                "Failed to convert {0} of {1} files. {2}".format(
+                    len(failed), len(files), " ".join(failed)
+                )
+            )
+        return True
+
+    def uss_convert_encoding_prev(
+        self, src, dest, from_code, to_code, max_workers=DEFAULT_MAX_WORKERS
+    ):
         """ For multiple files conversion, such as a USS path or MVS PDS data set,
         use this method to split then do the conversion
 
@@ -262,6 +387,9 @@ class EncodeUtils(object):
             src: {str} -- The input uss path or a file
             dest: {str} -- The output uss path or a file
 
+        Keyword Arguments:
+            max_workers {int} -- The maximum number of files to convert at once (default: {5})
+
         Raises:
             EncodeError: When direcotry is empty or copy multiple files to a single file
         Returns:
@@ -296,6 +424,7 @@ class EncodeUtils(object):
                         " (dest) {1}.".format(src, dest)
                     )
                 else:
+                    files = []
                     for file in file_list:
                         if dest == src:
                             dest_f = file
@@ -304,9 +433,10 @@ class EncodeUtils(object):
                             dest_dir = path.dirname(dest_f)
                             if not path.exists(dest_dir):
                                 makedirs(dest_dir)
-                        convert_rc = self.uss_convert_encoding(
-                            file, dest_f, from_code, to_code
-                        )
+                        files.append((file, dest_f))
+                    convert_rc = self.uss_convert_encoding_files(
+                        files, from_code, to_code, max_workers=max_workers
+                    )
         else:
             if path.isdir(dest):
                 file_name = path.basename(path.abspath(src))
@@ -316,7 +446,14 @@ class EncodeUtils(object):
         return convert_rc
 
     def mvs_convert_encoding(
-        self, src, dest, from_code, to_code, src_type=None, dest_type=None
+        self,
+        src,
+        dest,
+        from_code,
+        to_code,
+        src_type=None,
+        dest_type=None,
+        max_workers=DEFAULT_MAX_WORKERS,
     ):
         """Convert the encoding of the data from
            1) USS to MVS(PS, PDS/E VSAM)
@@ -332,6 +469,7 @@ class EncodeUtils(object):
         Keyword Arguments:
             src_type {[type]} -- The input MVS data set or type: PS, PDS, PDSE, VSAM(KSDS) (default: {None})
             dest_type {[type]} -- The output MVS data set type (default: {None})
+            max_workers {int} -- The maximum number of members to convert at once (default: {5})
 
         Returns:
             boolean -- Indicate whether the conversion is successful or not
@@ -366,7 +504,9 @@ class EncodeUtils(object):
             if dest_type == "PO":
                 temp_dest_fo = TemporaryDirectory()
                 temp_dest = temp_dest_fo.name
-            rc = self.uss_convert_encoding_prev(temp_src, temp_dest, from_code, to_code)
+            rc = self.uss_convert_encoding_prev(
+                temp_src, temp_dest, from_code, to_code, max_workers=max_workers
+            )
             if rc:
                 if not dest_type:
                     convert_rc = True
@@ -394,6 +534,259 @@ class EncodeUtils(object):
         return convert_rc
 
 
+def get_code_sets(module):
+    """Get every name listed by 'iconv -l', in upper case.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object used to run iconv
+
+    Returns:
+        frozenset[str] -- The code set names, empty when iconv -l fails.
+    """
+    rc, out, err = list_iconv_code_sets(module)
+    if rc or err or not out:
+        return frozenset()
+    key = ("names", out)
+    code_sets = _code_sets.get(key)
+    if code_sets is None:
+        # ignores first line of output which will be "Character sets:"
+        code_sets = frozenset(out.upper().partition("\n")[2].split())
+        _code_sets[key] = code_sets
+    return code_sets
+
+
+def list_iconv_code_sets(module):
+    """Run 'iconv -l', reusing its output while the iconv binary is unchanged.
+    The output is cached in process and in a private directory per user,
+    keyed by the path, size and modification time of the iconv binary.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object used to run iconv
+
+    Returns:
+        int -- The return code of iconv -l.
+        str -- The standard output of iconv -l.
+        str -- The standard error of iconv -l.
+    """
+    key = _iconv_key(module)
+    if key is None:
+        return module.run_command(["iconv", "-l"])
+    out = _iconv_lists.get(key)
+    if out is None:
+        out = _read_cached_iconv_list(key)
+    if out is None:
+        rc, out, err = module.run_command(["iconv", "-l"])
+        if rc or err:
+            return rc, out, err
+        _write_cached_iconv_list(key, out)
+    _iconv_lists[key] = out
+    return 0, out, ""
+
+
+def get_code_set_cache_dir():
+    """Get the directory the output of 'iconv -l' is cached in.
+    Defaults to a directory per user in the system temporary directory.
+
+    Returns:
+        str -- The absolute path of the code set cache directory.
+    """
+    cache_dir = os.environ.get(CODE_SET_CACHE_DIR_ENV)
+    if not cache_dir:
+        cache_dir = path.join(
+            gettempdir(), "{0}{1}".format(CODE_SET_CACHE_DIR_PREFIX, os.getuid())
+        )
+    return cache_dir
+
+
+def _iconv_key(module):
+    iconv = module.get_bin_path("iconv")
+    if not iconv:
+        return None
+    try:
+        stat_info = os.stat(iconv)
+    except (OSError, TypeError):
+        return None
+    return "{0}:{1}:{2}".format(iconv, stat_info.st_size, stat_info.st_mtime)
+
+
+def _cached_iconv_list_path(key):
+    digest = sha256(key.encode("utf-8")).hexdigest()[:16]
+    return path.join(get_code_set_cache_dir(), "iconv_{0}.list".format(digest))
+
+
+def _read_cached_iconv_list(key):
+    try:
+        with open(_cached_iconv_list_path(key), "r") as f:
+            cached_key, out = f.read().split("\n", 1)
+    except (IOError, OSError, ValueError):
+        return None
+    return out if cached_key == key else None
+
+
+def _write_cached_iconv_list(key, out):
+    """Write the output of 'iconv -l' to the cache directory, writing
+    a temporary file and renaming it so readers never see part of it.
+    The cache is skipped when the directory is not safe to use.
+
+    Arguments:
+        key {str} -- Identifies the iconv binary the output is from.
+        out {str} -- The output of iconv -l.
+    """
+    tmp_path = None
+    try:
+        cache_dir = get_code_set_cache_dir()
+        if not rexx.is_private_dir(cache_dir):
+            return
+        fd, tmp_path = mkstemp(dir=cache_dir, prefix=".", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write("{0}\n{1}".format(key, out))
+        os.rename(tmp_path, _cached_iconv_list_path(key))
+    except (IOError, OSError):
+        if tmp_path and path.exists(tmp_path):
+            unlink(tmp_path)
+
+
+def can_convert_in_process(from_code, to_code):
+    """Determine if data can be converted between two code sets
+    with Python codecs instead of iconv.
+
+    Arguments:
+        from_code: {str} -- The source code set
+        to_code: {str} -- The destination code set
+
+    Returns:
+        bool -- If both code sets can be converted in process.
+    """
+    return _is_python_code_set(from_code) and _is_python_code_set(to_code)
+
+
+def convert_bytes(data, from_code, to_code):
+    """Convert data between two code sets that can be converted in process.
+
+    Arguments:
+        data: {bytes} -- The data to convert
+        from_code: {str} -- The source code set of the data
+        to_code: {str} -- The destination code set for the data
+
+    Raises:
+        UnicodeError: When the data is not valid in the source code set,
+        or cannot be represented in the destination code set.
+
+    Returns:
+        bytes -- The converted data.
+    """
+    return _StreamConverter(from_code, to_code).convert(data, final=True)
+
+
+def convert_stream(src_fo, dest_fo, from_code, to_code):
+    """Convert the data of a file object between two code sets that can
+    be converted in process, CONVERSION_CHUNK_SIZE bytes at a time.
+
+    Arguments:
+        src_fo: {file} -- The binary file object to read from
+        dest_fo: {file} -- The binary file object to write to
+        from_code: {str} -- The source code set of the input
+        to_code: {str} -- The destination code set for the output
+
+    Raises:
+        UnicodeError: When the data is not valid in the source code set,
+        or cannot be represented in the destination code set.
+    """
+    converter = _StreamConverter(from_code, to_code)
+    while True:
+        chunk = src_fo.read(CONVERSION_CHUNK_SIZE)
+        dest_fo.write(converter.convert(chunk, final=not chunk))
+        if not chunk:
+            break
+
+
+def _is_python_code_set(code_set):
+    code_set = code_set.upper()
+    return code_set in EBCDIC_CODE_SETS or code_set in PYTHON_CODE_SETS
+
+
+def _decoding_table(code_set):
+    """Get the character of each byte of a single byte code set.
+    As z/OS iconv does, the EBCDIC new line (0x15) is converted
+    to a line feed and the EBCDIC line feed (0x25) to NEL.
+
+    Arguments:
+        code_set: {str} -- The code set
+
+    Returns:
+        str -- The 256 characters of the code set, None for UTF-8.
+    """
+    code_set = code_set.upper()
+    table = _decoding_tables.get(code_set)
+    if table is None and code_set != "UTF-8":
+        if code_set in EBCDIC_CODE_SETS:
+            codec, swaps = EBCDIC_CODE_SETS.get(code_set)
+            swaps = swaps + ((0x15, 0x25),)
+        else:
+            codec, swaps = PYTHON_CODE_SETS.get(code_set), ()
+        characters = list(bytes(bytearray(range(256))).decode(codec))
+        for first, second in swaps:
+            characters[first], characters[second] = (
+                characters[second],
+                characters[first],
+            )
+        table = "".join(characters)
+        _decoding_tables[code_set] = table
+    return table
+
+
+class _StreamConverter(object):
+    def __init__(self, from_code, to_code):
+        """Convert a stream of data between two code sets that can be
+        converted in process. Single byte code sets are converted with
+        a translation table, UTF-8 with an incremental decoder.
+
+        Arguments:
+            from_code: {str} -- The source code set
+            to_code: {str} -- The destination code set
+        """
+        self.decoding_table = _decoding_table(from_code)
+        self.decoder = None
+        if self.decoding_table is None:
+            self.decoder = codecs.getincrementaldecoder("utf-8")()
+        encoding_table = _decoding_table(to_code)
+        self.encoding_map = None
+        if encoding_table is not None:
+            self.encoding_map = codecs.charmap_build(encoding_table)
+        self.translation = None
+        if self.decoding_table is not None and self.encoding_map is not None:
+            self.translation = self._encode(self.decoding_table)
+
+    def convert(self, chunk, final=False):
+        """Convert the next chunk of the stream.
+
+        Arguments:
+            chunk: {bytes} -- The next chunk of data
+
+        Keyword Arguments:
+            final {bool} -- If this is the last chunk of the stream (default: {False})
+
+        Raises:
+            UnicodeError: When the data is not valid in the source code set,
+            or cannot be represented in the destination code set.
+
+        Returns:
+            bytes -- The converted data.
+        """
+        if self.translation is not None:
+            return chunk.translate(self.translation)
+        if self.decoder is not None:
+            text = self.decoder.decode(chunk, final)
+        else:
+            text = codecs.charmap_decode(chunk, "strict", self.decoding_table)[0]
+        return self._encode(text)
+
+    def _encode(self, text):
+        if self.encoding_map is None:
+            return text.encode("utf-8")
+        return codecs.charmap_encode(text, "strict", self.encoding_map)[0]
+
+
 class EncodeError(Exception):
     def __init__(self, message):
         self.msg = 'An error occurred during encoding: "{0}"'.format(message)
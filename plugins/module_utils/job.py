@@ -5,20 +5,43 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from tempfile import NamedTemporaryFile
-from os import chmod, path, remove
-from stat import S_IEXEC, S_IREAD, S_IWRITE
+from tempfile import TemporaryFile
+from subprocess import PIPE, Popen
 import json
 import re
+from ansible.module_utils._text import to_text
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
     AnsibleModuleHelper,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.rexx import (
+    cached_script,
+)
 
-
-def job_output(job_id=None, owner=None, job_name=None, dd_name=None):
+JOB_STATUS_COLUMNS = (
+    "job_id",
+    "job_name",
+    "subsystem",
+    "system",
+    "owner",
+    "class",
+    "content_type",
+)
+JOB_STATUS_COLUMN_WIDTH = 9
+JOB_STATUS_END = "*END"
+
+
+def job_output(
+    job_id=None,
+    owner=None,
+    job_name=None,
+    dd_name=None,
+    max_lines=None,
+    max_bytes=None,
+    tail=False,
+):
     """Get the output from a z/OS job based on various search criteria.
 
     Keyword Arguments:
@@ -26,6 +49,9 @@ def job_output(job_id=None, owner=None, job_name=None, dd_name=None):
         owner {str} -- The owner of the job (default: {None})
         job_name {str} -- The job name search for (default: {None})
         dd_name {str} -- The data definition to retrieve (default: {None})
+        max_lines {int} -- The maximum number of lines to retrieve per data definition (default: {None})
+        max_bytes {int} -- The maximum number of bytes to retrieve per data definition (default: {None})
+        tail {bool} -- Retrieve the last lines of each data definition instead of the first (default: {False})
 
     Raises:
         RuntimeError: When job output cannot be retrieved successfully but job exists.
@@ -34,67 +60,205 @@ def job_output(job_id=None, owner=None, job_name=None, dd_name=None):
     Returns:
         list[dict] -- The output information for a list of jobs matching specified criteria.
     """
+    return list(
+        job_output_iter(
+            job_id=job_id,
+            owner=owner,
+            job_name=job_name,
+            dd_name=dd_name,
+            max_lines=max_lines,
+            max_bytes=max_bytes,
+            tail=tail,
+        )
+    )
+
+
+def job_output_iter(
+    job_id=None,
+    owner=None,
+    job_name=None,
+    dd_name=None,
+    max_lines=None,
+    max_bytes=None,
+    tail=False,
+):
+    """Lazily get the output from a z/OS job based on various search criteria.
+    Jobs are yielded one at a time as they are read from SDSF, so only
+    the output of a single job is held in memory at once. Closing the
+    generator early stops the underlying REXX script.
+
+    Keyword Arguments:
+        job_id {str} -- The job ID to search for (default: {None})
+        owner {str} -- The owner of the job (default: {None})
+        job_name {str} -- The job name search for (default: {None})
+        dd_name {str} -- The data definition to retrieve (default: {None})
+        max_lines {int} -- The maximum number of lines to retrieve per data definition (default: {None})
+        max_bytes {int} -- The maximum number of bytes to retrieve per data definition (default: {None})
+        tail {bool} -- Retrieve the last lines of each data definition instead of the first (default: {False})
+
+    Raises:
+        RuntimeError: When job output cannot be retrieved successfully but job exists.
+        RuntimeError: When no job output is found
+
+    Yields:
+        dict -- The output information for a single job matching specified criteria.
+    """
+    job = None
+    for record in job_output_records(
+        job_id=job_id,
+        owner=owner,
+        job_name=job_name,
+        dd_name=dd_name,
+        max_lines=max_lines,
+        max_bytes=max_bytes,
+        tail=tail,
+    ):
+        record_type = record.pop("type", None)
+        if record_type == "job":
+            if job is not None:
+                yield _format_job(job)
+            job = record
+            job["ddnames"] = []
+        elif record_type == "dd":
+            record["content"] = []
+            job["ddnames"].append(record)
+        elif record_type == "line":
+            job["ddnames"][-1]["content"].append(record.get("content", ""))
+    if job is not None:
+        yield _format_job(job)
+
+
+def job_output_records(
+    job_id=None,
+    owner=None,
+    job_name=None,
+    dd_name=None,
+    max_lines=None,
+    max_bytes=None,
+    tail=False,
+):
+    """Stream the raw output records of z/OS jobs from SDSF.
+    The REXX script emits one JSON object per line (JSON Lines), each parsed
+    as soon as it is read. Records have a "type" key of "job", "dd" or "line";
+    every "dd" record belongs to the preceding "job" record and every "line"
+    record to the preceding "dd" record.
+    Line and byte limits are applied by SDSF, so records beyond the limits
+    are never read from the spool.
+
+    Keyword Arguments:
+        job_id {str} -- The job ID to search for (default: {None})
+        owner {str} -- The owner of the job (default: {None})
+        job_name {str} -- The job name search for (default: {None})
+        dd_name {str} -- The data definition to retrieve (default: {None})
+        max_lines {int} -- The maximum number of lines to retrieve per data definition (default: {None})
+        max_bytes {int} -- The maximum number of bytes to retrieve per data definition (default: {None})
+        tail {bool} -- Retrieve the last lines of each data definition instead of the first (default: {False})
+
+    Raises:
+        RuntimeError: When job output cannot be retrieved successfully but job exists.
+        RuntimeError: When no job output is found
+
+    Yields:
+        dict -- A single job, data definition or content line record.
+    """
     arg_defs = dict(
         job_id=dict(arg_type="qualifier_pattern"),
         owner=dict(arg_type="qualifier_pattern"),
         job_name=dict(arg_type="qualifier_pattern"),
         dd_name=dict(arg_type=_ddname_pattern),
+        max_lines=dict(arg_type=_limit_type),
+        max_bytes=dict(arg_type=_limit_type),
+        tail=dict(arg_type="bool", default=False),
     )
 
     parser = BetterArgParser(arg_defs)
     parsed_args = parser.parse_args(
-        {"job_id": job_id, "owner": owner, "job_name": job_name, "dd_name": dd_name}
+        {
+            "job_id": job_id,
+            "owner": owner,
+            "job_name": job_name,
+            "dd_name": dd_name,
+            "max_lines": max_lines,
+            "max_bytes": max_bytes,
+            "tail": tail,
+        }
     )
 
     job_id = parsed_args.get("job_id") or "*"
     job_name = parsed_args.get("job_name") or "*"
     owner = parsed_args.get("owner") or "*"
-    dd_name = parsed_args.get("ddname") or ""
-
-    job_detail_json = {}
-    rc, out, err = _get_job_output_str(job_id, owner, job_name, dd_name)
-    if rc != 0:
-        raise RuntimeError(
-            "Failed to retrieve job output. RC: {0} Error: {1}".format(
-                str(rc), str(err)
-            )
-        )
-    if not out:
+    dd_name = parsed_args.get("dd_name") or ""
+    max_lines = parsed_args.get("max_lines") or 0
+    max_bytes = parsed_args.get("max_bytes") or 0
+    tail = parsed_args.get("tail")
+
+    complete = False
+    for line in _get_job_output_lines(
+        job_id, owner, job_name, dd_name, max_lines, max_bytes, tail
+    ):
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line, strict=False)
+        if record.get("type") == "end":
+            complete = True
+            continue
+        yield record
+    if not complete:
         raise RuntimeError("Failed to retrieve job output. No job output found.")
-    job_detail_json = json.loads(out, strict=False)
-    for job in job_detail_json:
-        job["ret_code"] = {} if job.get("ret_code") is None else job.get("ret_code")
-        job["ret_code"]["code"] = _get_return_code_num(
-            job.get("ret_code").get("msg", "")
-        )
-        job["ret_code"]["msg_code"] = _get_return_code_str(
-            job.get("ret_code").get("msg", "")
-        )
-        job["ret_code"]["msg_txt"] = ""
-        if job.get("ret_code").get("msg", "") == "":
-            job["ret_code"]["msg"] = "AC"
-    return job_detail_json
 
 
-def _get_job_output_str(job_id="*", owner="*", job_name="*", dd_name=""):
-    """Generate JSON output string containing Job info from SDSF.
-    Writes a temporary REXX script to the USS filesystem to gather output.
+def _format_job(job):
+    """Normalize the return code information of a job parsed from SDSF.
+
+    Arguments:
+        job {dict} -- The job information as returned by the REXX script.
+
+    Returns:
+        dict -- The job information with "ret_code" expanded.
+    """
+    job["ret_code"] = {} if job.get("ret_code") is None else job.get("ret_code")
+    job["ret_code"]["code"] = _get_return_code_num(job.get("ret_code").get("msg", ""))
+    job["ret_code"]["msg_code"] = _get_return_code_str(
+        job.get("ret_code").get("msg", "")
+    )
+    job["ret_code"]["msg_txt"] = ""
+    if job.get("ret_code").get("msg", "") == "":
+        job["ret_code"]["msg"] = "AC"
+    return job
+
+
+def _get_job_output_lines(
+    job_id="*", owner="*", job_name="*", dd_name="", max_lines=0, max_bytes=0, tail=False
+):
+    """Generate JSON Lines output containing Job info from SDSF.
+    Runs a cached REXX script on the USS filesystem to gather output
+    and yields its standard output line by line while it is running.
+    When a line or byte limit is given, each data definition is browsed
+    separately and only the lines within the limits are returned by SDSF.
 
     Keyword Arguments:
         job_id {str} -- The job ID to search for (default: {''})
         owner {str} -- The owner of the job (default: {''})
         job_name {str} -- The job name search for (default: {''})
         dd_name {str} -- The data definition to retrieve (default: {''})
+        max_lines {int} -- The maximum number of lines per data definition, 0 for no limit (default: {0})
+        max_bytes {int} -- The maximum number of bytes per data definition, 0 for no limit (default: {0})
+        tail {bool} -- Return the last lines of each data definition instead of the first (default: {False})
 
-    Returns:
-        tuple[int, str, str] -- RC, STDOUT, and STDERR from the REXX script.
+    Raises:
+        RuntimeError: When the REXX script ends with a non-zero return code.
+
+    Yields:
+        str -- A single line of the REXX script's standard output.
     """
-    get_job_detail_json_rexx = """/* REXX */
+    get_job_detail_jsonl_rexx = """/* REXX */
 arg options
 parse var options param
 upper param
 parse var param 'JOBID=' jobid ' OWNER=' owner,
-' JOBNAME=' jobname ' DDNAME=' ddname
+' JOBNAME=' jobname ' DDNAME=' ddname ' MAXLINES=' maxlines,
+' MAXBYTES=' maxbytes ' TAIL=' tail
 
 rc=isfcalls('ON')
 
@@ -114,112 +278,182 @@ ddname = strip(ddname,'L')
 if (ddname == '?') then do
 ddname = ''
 end
+maxlines = strip(maxlines)
+if (datatype(maxlines,'W') <> 1) then do
+maxlines = 0
+end
+maxbytes = strip(maxbytes)
+if (datatype(maxbytes,'W') <> 1) then do
+maxbytes = 0
+end
+tail = strip(tail)
+limited = (maxlines > 0 | maxbytes > 0)
 
 Address SDSF "ISFEXEC ST (ALTERNATE DELAYED)"
 if rc<>0 then do
-Say '[]'
+Say '{"type":"end","rows":0}'
 Exit 0
 end
-if isfrows == 0 then do
-Say '[]'
-end
-else do
-Say '['
 do ix=1 to isfrows
     linecount = 0
-    if ix<>1 then do
-    Say ','
-    end
-    Say '{'
-    Say '"'||'job_id'||'":"'||value('JOBID'||"."||ix)||'",'
-    Say '"'||'job_name'||'":"'||value('JNAME'||"."||ix)||'",'
-    Say '"'||'subsystem'||'":"'||value('ESYSID'||"."||ix)||'",'
-    Say '"'||'owner'||'":"'||value('OWNERID'||"."||ix)||'",'
-    Say '"'||'ret_code'||'":{"'||'msg'||'":"'||value('RETCODE'||"."||ix)||'"},'
-    Say '"'||'class'||'":"'||value('JCLASS'||"."||ix)||'",'
-    Say '"'||'content_type'||'":"'||value('JTYPE'||"."||ix)||'",'
+    browsed = 0
+    rec = '{"type":"job"'
+    rec = rec||',"job_id":"'||value('JOBID'||"."||ix)||'"'
+    rec = rec||',"job_name":"'||value('JNAME'||"."||ix)||'"'
+    rec = rec||',"subsystem":"'||value('ESYSID'||"."||ix)||'"'
+    rec = rec||',"owner":"'||value('OWNERID'||"."||ix)||'"'
+    rec = rec||',"ret_code":{"msg":"'||value('RETCODE'||"."||ix)||'"}'
+    rec = rec||',"class":"'||value('JCLASS'||"."||ix)||'"'
+    rec = rec||',"content_type":"'||value('JTYPE'||"."||ix)||'"'
+    Say rec||'}'
     Address SDSF "ISFACT ST TOKEN('"TOKEN.ix"') PARM(NP ?)",
 "("prefix JDS_
     lrc=rc
-    if lrc<>0 | JDS_DDNAME.0 == 0 then do
-    Say '"ddnames":[]'
+    if lrc<>0 then do
+    iterate
     end
-    else do
-    Say '"ddnames":['
     do jx=1 to JDS_DDNAME.0
-        if jx<>1 & ddname == '' then do
-        Say ','
-        end
         if ddname == '' | ddname == value('JDS_DDNAME'||"."||jx) then do
-        Say '{'
-        Say '"'||'ddname'||'":"'||value('JDS_DDNAME'||"."||jx)||'",'
-        Say '"'||'record_count'||'":"'||value('JDS_RECCNT'||"."||jx)||'",'
-        Say '"'||'id'||'":"'||value('JDS_DSID'||"."||jx)||'",'
-        Say '"'||'stepname'||'":"'||value('JDS_STEPN'||"."||jx)||'",'
-        Say '"'||'procstep'||'":"'||value('JDS_PROCS'||"."||jx)||'",'
-        Say '"'||'byte_count'||'":"'||value('JDS_BYTECNT'||"."||jx)||'",'
-        Say '"'||'content'||'":['
-        Address SDSF "ISFBROWSE ST TOKEN('"token.ix"')"
-        untilline = linecount + JDS_RECCNT.jx
-        startingcount = linecount + 1
-        do kx=linecount+1 to  untilline
-            if kx<>startingcount then do
-            Say ','
+        rec = '{"type":"dd"'
+        rec = rec||',"ddname":"'||value('JDS_DDNAME'||"."||jx)||'"'
+        rec = rec||',"record_count":"'||value('JDS_RECCNT'||"."||jx)||'"'
+        rec = rec||',"id":"'||value('JDS_DSID'||"."||jx)||'"'
+        rec = rec||',"stepname":"'||value('JDS_STEPN'||"."||jx)||'"'
+        rec = rec||',"procstep":"'||value('JDS_PROCS'||"."||jx)||'"'
+        rec = rec||',"byte_count":"'||value('JDS_BYTECNT'||"."||jx)||'"'
+        Say rec||'}'
+        if limited then do
+            count = JDS_RECCNT.jx
+            skip = 0
+            if maxlines > 0 & count > maxlines then do
+                if tail == 'TRUE' then do
+                skip = count - maxlines
+                end
+                count = maxlines
+            end
+            first = 1
+            last = 0
+            if count > 0 then do
+                ISFSTARTLINENO = linecount + skip + 1
+                ISFLINELIM = count
+                Address SDSF "ISFBROWSE ST TOKEN('"token.ix"')"
+                last = min(isfline.0, count)
             end
-            linecount = linecount + 1
-            Say '"'||escapeNewLine(escapeDoubleQuote(isfline.kx))||'"'
-        end
-        Say ']'
-        Say '}'
         end
         else do
-            linecount = linecount + JDS_RECCNT.jx
+            if browsed == 0 then do
+                Address SDSF "ISFBROWSE ST TOKEN('"token.ix"')"
+                browsed = 1
+            end
+            first = linecount + 1
+            last = linecount + JDS_RECCNT.jx
         end
+        if maxbytes > 0 then do
+            total = 0
+            if tail == 'TRUE' then do
+                kx = last
+                do while kx >= first
+                    total = total + length(isfline.kx)
+                    if total > maxbytes then leave
+                    kx = kx - 1
+                end
+                first = kx + 1
+            end
+            else do
+                kx = first
+                do while kx <= last
+                    total = total + length(isfline.kx)
+                    if total > maxbytes then leave
+                    kx = kx + 1
+                end
+                last = kx - 1
+            end
+        end
+        do kx=first to last
+            Say '{"type":"line","content":"'||escapeJson(isfline.kx)||'"}'
+        end
+        end
+        linecount = linecount + JDS_RECCNT.jx
     end
-    Say ']'
-    end
-    Say '}'
-end
-Say ']'
 end
+Say '{"type":"end","rows":'||isfrows||'}'
 
 rc=isfcalls('OFF')
 
 return 0
 
-escapeDoubleQuote: Procedure
+escapeJson: Procedure
 Parse Arg string
+string = translate(string, '4040'x, '1525'x)
 out=''
-Do While Pos('"',string)<>0
-Parse Var string prefix '"' string
-out=out||prefix||'\\"'
+Do While Verify(string, '"\\', 'M')<>0
+p = Verify(string, '"\\', 'M')
+out=out||substr(string,1,p-1)||'\\'||substr(string,p,1)
+string=substr(string,p+1)
 End
 Return out||string
-
-escapeNewLine: Procedure
-Parse Arg string
-Return translate(string, '4040'x, '1525'x)
 """
-    try:
-        module = AnsibleModuleHelper(argument_spec={})
-        if dd_name is None or dd_name == "?":
-            dd_name = ""
-        jobid_param = "jobid=" + job_id
-        owner_param = "owner=" + owner
-        jobname_param = "jobname=" + job_name
-        ddname_param = "ddname=" + dd_name
+    if dd_name is None or dd_name == "?":
+        dd_name = ""
+    jobid_param = "jobid=" + job_id
+    owner_param = "owner=" + owner
+    jobname_param = "jobname=" + job_name
+    ddname_param = "ddname=" + dd_name
+    maxlines_param = "maxlines=" + str(max_lines or 0)
+    maxbytes_param = "maxbytes=" + str(max_bytes or 0)
+    tail_param = "tail=" + str(bool(tail))
+
+    args = [
+        jobid_param,
+        owner_param,
+        jobname_param,
+        ddname_param,
+        maxlines_param,
+        maxbytes_param,
+        tail_param,
+    ]
+
+    with cached_script(get_job_detail_jsonl_rexx) as script_path:
+        cmd = [script_path, " ".join(args)]
+        for line in _stream_command(cmd, "job output"):
+            yield line
+
+
+def _stream_command(cmd, description):
+    """Run a command and yield its standard output line by line as it is produced.
+    Standard error is spooled to a temporary file so a chatty command cannot
+    block on a full pipe. If the consumer stops iterating early, the command
+    is terminated.
 
-        tmp = NamedTemporaryFile(delete=True)
-        with open(tmp.name, "w") as f:
-            f.write(get_job_detail_json_rexx)
-        chmod(tmp.name, S_IEXEC | S_IREAD | S_IWRITE)
-        args = [jobid_param, owner_param, jobname_param, ddname_param]
+    Arguments:
+        cmd {list[str]} -- The command and its arguments.
+        description {str} -- What the command retrieves, used in error messages.
 
-        cmd = [tmp.name, " ".join(args)]
-        rc, out, err = module.run_command(args=cmd)
-    except Exception:
-        raise
-    return rc, out, err
+    Raises:
+        RuntimeError: When the command ends with a non-zero return code.
+
+    Yields:
+        str -- A single line of the command's standard output.
+    """
+    with TemporaryFile() as err_file:
+        proc = Popen(cmd, stdout=PIPE, stderr=err_file)
+        try:
+            for line in proc.stdout:
+                yield to_text(line, errors="surrogate_or_strict")
+            rc = proc.wait()
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        if rc != 0:
+            err_file.seek(0)
+            err = to_text(err_file.read(), errors="surrogate_or_strict")
+            raise RuntimeError(
+                "Failed to retrieve {0}. RC: {1} Error: {2}".format(
+                    description, str(rc), str(err)
+                )
+            )
 
 
 def job_status(job_id=None, owner=None, job_name=None):
@@ -252,56 +486,110 @@ def job_status(job_id=None, owner=None, job_name=None):
     job_name = parsed_args.get("job_name") or "*"
     owner = parsed_args.get("owner") or "*"
 
-    job_status_json = {}
-    rc, out, err = _get_job_status_str(job_id, owner, job_name)
+    return _get_job_status([job_id], owner, job_name)
+
+
+def job_status_batch(job_ids):
+    """Get the status information of many z/OS jobs in a single SDSF query.
+    Only the SDSF ST panel columns are retrieved, no job data sets
+    are listed or browsed, so polling many jobs costs one REXX call.
+
+    Arguments:
+        job_ids {list[str]} -- The job IDs to get the status of.
+
+    Raises:
+        RuntimeError: When job status cannot be retrieved successfully but job exists.
+        RuntimeError: When no job status is found.
+
+    Returns:
+        list[dict] -- The status information for the jobs that were found.
+    """
+    arg_defs = dict(job_ids=dict(arg_type="list", elements="qualifier_pattern"))
+
+    parser = BetterArgParser(arg_defs)
+    parsed_args = parser.parse_args({"job_ids": job_ids})
+
+    job_ids = parsed_args.get("job_ids") or []
+    if not job_ids:
+        return []
+    return _get_job_status(job_ids, "*", "*")
+
+
+def _get_job_status(job_ids, owner, job_name):
+    """Run the status REXX script and parse its fixed-column output.
+
+    Arguments:
+        job_ids {list[str]} -- The job IDs to search for.
+        owner {str} -- The owner of the jobs.
+        job_name {str} -- The job name to search for.
+
+    Raises:
+        RuntimeError: When job status cannot be retrieved successfully but job exists.
+        RuntimeError: When no job status is found.
+
+    Returns:
+        list[dict] -- The status information for a list of jobs matching search criteria.
+    """
+    rc, out, err = _get_job_status_str(",".join(job_ids), owner, job_name)
     if rc != 0:
         raise RuntimeError(
             "Failed to retrieve job status. RC: {0} Error: {1}".format(
                 str(rc), str(err)
             )
         )
-    if not out:
+    if not out or JOB_STATUS_END not in out:
         raise RuntimeError("Failed to retrieve job status. No job status found.")
-    job_status_json = json.loads(out, strict=False)
-    for job in job_status_json:
-        job["ret_code"] = {} if job.get("ret_code") is None else job.get("ret_code")
-        job["ret_code"]["code"] = _get_return_code_num(
-            job.get("ret_code").get("msg", "")
-        )
-        job["ret_code"]["msg_code"] = _get_return_code_str(
-            job.get("ret_code").get("msg", "")
-        )
-        job["ret_code"]["msg_txt"] = ""
-        if job.get("ret_code").get("msg", "") == "":
-            job["ret_code"]["msg"] = "AC"
-    return job_status_json
+    jobs = []
+    for line in out.splitlines():
+        if not line.strip() or line.startswith(JOB_STATUS_END):
+            continue
+        jobs.append(_format_job(_parse_job_status_line(line)))
+    return jobs
+
+
+def _parse_job_status_line(line):
+    """Parse a single fixed-column line written by the status REXX script.
+
+    Arguments:
+        line {str} -- A line of status output.
+
+    Returns:
+        dict -- The job status information.
+    """
+    job = {}
+    for index, column in enumerate(JOB_STATUS_COLUMNS):
+        offset = index * JOB_STATUS_COLUMN_WIDTH
+        job[column] = line[offset:offset + JOB_STATUS_COLUMN_WIDTH].strip()
+    offset = len(JOB_STATUS_COLUMNS) * JOB_STATUS_COLUMN_WIDTH
+    job["ret_code"] = {"msg": line[offset:].strip()}
+    return job
 
 
 def _get_job_status_str(job_id="*", owner="*", job_name="*"):
-    """Generate JSON output string containing Job status info from SDSF.
-    Writes a temporary REXX script to the USS filesystem to gather output.
+    """Generate fixed-column output containing Job status info from SDSF.
+    Runs a cached REXX script on the USS filesystem to gather output.
+    Every job is written on one line, with each column from
+    JOB_STATUS_COLUMNS left aligned in JOB_STATUS_COLUMN_WIDTH characters,
+    followed by the return code. The last line is JOB_STATUS_END
+    and the number of jobs found.
 
     Keyword Arguments:
-        job_id {str} -- The job ID to search for (default: {''})
+        job_id {str} -- The job ID to search for, or a comma separated list of job IDs (default: {''})
         owner {str} -- The owner of the job (default: {''})
         job_name {str} -- The job name search for (default: {''})
 
     Returns:
         tuple[int, str, str] -- RC, STDOUT, and STDERR from the REXX script.
     """
-    get_job_status_json_rexx = """/* REXX */
+    get_job_status_rexx = """/* REXX */
 arg options
 parse var options param
 upper param
-parse var param 'JOBID=' jobid ' OWNER=' owner,
+parse var param 'JOBID=' jobids ' OWNER=' owner,
 ' JOBNAME=' jobname
 
 rc=isfcalls('ON')
 
-jobid = strip(jobid,'L')
-if (jobid <> '') then do
-ISFFILTER='JobID EQ '||jobid
-end
 owner = strip(owner,'L')
 if (owner <> '') then do
 ISFOWNER=owner
@@ -310,52 +598,30 @@ jobname = strip(jobname,'L')
 if (jobname <> '') then do
 ISFPREFIX=jobname
 end
-
-Address SDSF "ISFEXEC ST (ALTERNATE DELAYED)"
-if rc<>0 then do
-Say '[]'
-Exit 0
-end
-if isfrows == 0 then do
-Say '[]'
-end
-else do
-Say '['
-do ix=1 to isfrows
-    linecount = 0
-    if ix<>1 then do
-    Say ','
+jobids = translate(strip(jobids,'L'), ' ', ',')
+rows = 0
+do while jobids <> ''
+    filter = ''
+    do fx=1 to 25 while jobids <> ''
+        parse var jobids jid jobids
+        filter = filter 'JobID EQ' jid
     end
-    Say '{'
-    Say '"'||'job_id'||'":"'||value('JOBID'||"."||ix)||'",'
-    Say '"'||'job_name'||'":"'||value('JNAME'||"."||ix)||'",'
-    Say '"'||'subsystem'||'":"'||value('ESYSID'||"."||ix)||'",'
-    Say '"'||'system'||'":"'||value('SYSNAME'||"."||ix)||'",'
-    Say '"'||'owner'||'":"'||value('OWNERID'||"."||ix)||'",'
-    Say '"'||'ret_code'||'":{"'||'msg'||'":"'||value('RETCODE'||"."||ix)||'"},'
-    Say '"'||'class'||'":"'||value('JCLASS'||"."||ix)||'",'
-    Say '"'||'content_type'||'":"'||value('JTYPE'||"."||ix)||'"'
-    Say '}'
-end
-Say ']'
+    ISFFILTER = strip(filter)
+    ISFFILTERMODE = 'OR'
+    Address SDSF "ISFEXEC ST (ALTERNATE DELAYED)"
+    if rc<>0 then leave
+    do ix=1 to isfrows
+        Say left(JOBID.ix,8) left(JNAME.ix,8) left(ESYSID.ix,8),
+            left(SYSNAME.ix,8) left(OWNERID.ix,8) left(JCLASS.ix,8),
+            left(JTYPE.ix,8) RETCODE.ix
+    end
+    rows = rows + isfrows
 end
+Say '*END' rows
 
 rc=isfcalls('OFF')
 
 return 0
-
-escapeDoubleQuote: Procedure
-Parse Arg string
-out=''
-Do While Pos('"',string)<>0
-Parse Var string prefix '"' string
-out=out||prefix||'\\"'
-End
-Return out||string
-
-escapeNewLine: Procedure
-Parse Arg string
-Return translate(string, '4040'x, '1525'x)
 """
     try:
         module = AnsibleModuleHelper(argument_spec={})
@@ -363,14 +629,11 @@ Return translate(string, '4040'x, '1525'x)
         owner_param = "owner=" + owner
         jobname_param = "jobname=" + job_name
 
-        tmp = NamedTemporaryFile(delete=True)
-        with open(tmp.name, "w") as f:
-            f.write(get_job_status_json_rexx)
-        chmod(tmp.name, S_IEXEC | S_IREAD | S_IWRITE)
         args = [jobid_param, owner_param, jobname_param]
 
-        cmd = [tmp.name, " ".join(args)]
-        rc, out, err = module.run_command(args=cmd)
+        with cached_script(get_job_status_rexx) as script_path:
+            cmd = [script_path, " ".join(args)]
+            rc, out, err = module.run_command(args=cmd)
     except Exception:
         raise
     return rc, out, err
@@ -433,3 +696,28 @@ def _ddname_pattern(contents, resolve_dependencies):
             )
         )
     return str(contents)
+
+
+def _limit_type(contents, resolve_dependencies):
+    """Resolver for line and byte limit arguments
+
+    Arguments:
+        contents {int} -- The contents of the argument.
+        resolved_dependencies {dict} -- Contains all of the dependencies and their contents,
+        which have already been handled,
+        for use during current arguments handling operations.
+
+    Raises:
+        ValueError: When contents is not a non-negative integer
+    Returns:
+        int -- The arguments contents after any necessary operations.
+    """
+    if contents is None:
+        return None
+    if isinstance(contents, bool) or not str(contents).isdigit():
+        raise ValueError(
+            'Invalid argument "{0}". expected a non-negative integer limit'.format(
+                contents
+            )
+        )
+    return int(contents)
@@ -0,0 +1,146 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from threading import Lock
+
+"""lookup kind used for VTOC listings, which are keyed by volume only"""
+VTOC = "vtoc"
+
+
+class MetadataCache(object):
+    def __init__(self):
+        """A cache of catalog and VTOC lookups made during a module run.
+        Lookups are keyed by their kind, data set name and volume. Anything
+        that creates, deletes, catalogs or uncatalogs a data set must
+        invalidate it.
+        """
+        self._entries = dict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, kind, name, volume, loader):
+        """Get the result of a lookup, running it only if it is not cached.
+
+        Arguments:
+            kind {str} -- The kind of lookup, for example 'cataloged'.
+            name {str} -- The data set name, or None for volume wide lookups.
+            volume {str} -- The volume, or None for catalog lookups.
+            loader {callable} -- Runs the lookup when it is not cached.
+
+        Returns:
+            object -- The result of the lookup.
+        """
+        key = (kind, _normalize(name), _normalize(volume))
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries.get(key)
+        value = loader()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+        return value
+
+    def lookup_many(self, kind, names, volume, loader):
+        """Get the results of a lookup for many data sets, running it once
+        for all of the data sets that are not cached.
+
+        Arguments:
+            kind {str} -- The kind of lookup, for example 'info'.
+            names {list[str]} -- The data set names.
+            volume {str} -- The volume, or None for catalog lookups.
+            loader {callable} -- Takes the names that are not cached and
+            returns a dict with the result of each of them.
+
+        Returns:
+            dict -- The result of the lookup for each name.
+        """
+        results = dict()
+        missing = []
+        with self._lock:
+            for name in names:
+                key = (kind, _normalize(name), _normalize(volume))
+                if key in self._entries:
+                    self.hits += 1
+                    results[name] = self._entries.get(key)
+                elif name not in missing:
+                    missing.append(name)
+        if not missing:
+            return results
+        loaded = loader(missing)
+        with self._lock:
+            for name in missing:
+                self.misses += 1
+                results[name] = loaded.get(name)
+                self._entries[(kind, _normalize(name), _normalize(volume))] = results[
+                    name
+                ]
+        return results
+
+    def invalidate(self, name=None):
+        """Forget the lookups about a data set, and every VTOC listing since
+        they may include it. Forget all lookups when no name is given.
+
+        Keyword Arguments:
+            name {str} -- The data set name, a member name is ignored. (default: {None})
+        """
+        with self._lock:
+            self.invalidations += 1
+            if name is None:
+                self._entries.clear()
+                return
+            name = _normalize(name.split("(")[0])
+            for key in list(self._entries):
+                if key[0] == VTOC or key[1] == name:
+                    del self._entries[key]
+
+    def stats(self):
+        """Get the number of lookups served from the cache and run.
+
+        Returns:
+            dict -- The hits, misses, invalidations and cached entries.
+        """
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                invalidations=self.invalidations,
+                entries=len(self._entries),
+            )
+
+
+def _normalize(value):
+    return value.strip().upper() if value else None
+
+
+_cache = MetadataCache()
+
+
+def lookup(kind, name, volume, loader):
+    """Get the result of a lookup from the process wide cache,
+    see MetadataCache.lookup."""
+    return _cache.lookup(kind, name, volume, loader)
+
+
+def lookup_many(kind, names, volume, loader):
+    """Get the results of a lookup for many data sets from the process
+    wide cache, see MetadataCache.lookup_many."""
+    return _cache.lookup_many(kind, names, volume, loader)
+
+
+def invalidate(name=None):
+    """Forget lookups in the process wide cache,
+    see MetadataCache.invalidate."""
+    _cache.invalidate(name)
+
+
+def get_stats():
+    """Get the statistics of the process wide cache,
+    see MetadataCache.stats."""
+    return _cache.stats()
@@ -0,0 +1,115 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from contextlib import contextmanager
+from hashlib import sha256
+from tempfile import NamedTemporaryFile, gettempdir, mkstemp
+from stat import S_IEXEC, S_IREAD, S_IWRITE, S_ISDIR
+import os
+
+"""environment variable that can override the directory scripts are cached in"""
+SCRIPT_CACHE_DIR_ENV = "ZOS_CORE_SCRIPT_CACHE_DIR"
+SCRIPT_CACHE_DIR_PREFIX = "ibm_zos_core_scripts_"
+
+
+@contextmanager
+def cached_script(script):
+    """Provide an executable file containing a REXX script.
+    Scripts are installed once in a private cache directory, named after the
+    hash of their contents, and reused by every later task and module run.
+    If the cache directory cannot be used safely, the script is written to a
+    temporary file that is removed on exit instead.
+
+    Arguments:
+        script {str} -- The source of the REXX script.
+
+    Yields:
+        str -- The absolute path of the executable script.
+    """
+    path = None
+    try:
+        path = _install_script(script)
+    except (IOError, OSError):
+        path = None
+    if path is not None:
+        yield path
+        return
+    tmp = NamedTemporaryFile(delete=True)
+    try:
+        with open(tmp.name, "w") as f:
+            f.write(script)
+        os.chmod(tmp.name, S_IEXEC | S_IREAD | S_IWRITE)
+        yield tmp.name
+    finally:
+        tmp.close()
+
+
+def get_script_cache_dir():
+    """Get the directory REXX scripts are cached in.
+    Defaults to a directory per user in the system temporary directory.
+
+    Returns:
+        str -- The absolute path of the script cache directory.
+    """
+    cache_dir = os.environ.get(SCRIPT_CACHE_DIR_ENV)
+    if not cache_dir:
+        cache_dir = os.path.join(
+            gettempdir(), "{0}{1}".format(SCRIPT_CACHE_DIR_PREFIX, os.getuid())
+        )
+    return cache_dir
+
+
+def _install_script(script):
+    """Install a script in the cache directory unless it is already there.
+    The script is written to a temporary file in the cache directory and
+    renamed into place, so a partially written script is never executed.
+
+    Arguments:
+        script {str} -- The source of the REXX script.
+
+    Returns:
+        Union[str, NoneType] -- The path of the cached script,
+        or None if the cache directory is not safe to use.
+    """
+    cache_dir = get_script_cache_dir()
+    if not is_private_dir(cache_dir):
+        return None
+    digest = sha256(script.encode("utf-8")).hexdigest()
+    path = os.path.join(cache_dir, "{0}.rexx".format(digest))
+    if os.path.isfile(path):
+        return path
+    fd, tmp_path = mkstemp(dir=cache_dir, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(script)
+        os.chmod(tmp_path, S_IEXEC | S_IREAD | S_IWRITE)
+        os.rename(tmp_path, path)
+    except (IOError, OSError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def is_private_dir(path):
+    """Create a directory only accessible by the current user if it is missing,
+    and check that an existing one is a real directory owned by the
+    current user that no one else can access.
+
+    Arguments:
+        path {str} -- The absolute path of the directory.
+
+    Returns:
+        bool -- True if the directory can safely hold cached scripts and files.
+    """
+    os.makedirs(path, mode=S_IREAD | S_IWRITE | S_IEXEC, exist_ok=True)
+    stat_info = os.lstat(path)
+    return (
+        S_ISDIR(stat_info.st_mode)
+        and stat_info.st_uid == os.getuid()
+        and stat_info.st_mode & 0o077 == 0
+    )
@@ -0,0 +1,155 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from hashlib import sha256
+import inspect
+import os
+import subprocess
+
+from ansible.module_utils._text import to_bytes, to_text
+
+"""port used by sftp when none is configured for the connection"""
+DEFAULT_SFTP_PORT = 22
+"""how long a master connection started for a transfer stays open after its last use"""
+CONTROL_PERSIST = "60s"
+"""directory the sockets of those master connections are kept in"""
+CONTROL_PATH_DIR = "~/.ansible/cp"
+
+
+class SftpSession(object):
+    def __init__(self, connection, play_context, port=DEFAULT_SFTP_PORT):
+        """Runs sftp batch scripts against the remote host of an action plugin.
+        When the connection of the task can build sftp commands itself and
+        uses the same port, as the zos_ssh and ssh connections do, sftp goes
+        through the ControlPath master connection it already keeps open.
+        Otherwise sftp starts a persistent master connection of its own,
+        so only the first transfer to a host has to authenticate.
+
+        Arguments:
+            connection {ConnectionBase} -- The connection of the task.
+            play_context {PlayContext} -- The play context of the task.
+
+        Keyword Arguments:
+            port {int} -- The port to connect to for sftp. (default: {22})
+        """
+        self.connection = connection
+        self.user = play_context.remote_user
+        self.host = play_context.remote_addr
+        self.port = port
+        self.uses_connection = port == (play_context.port or DEFAULT_SFTP_PORT) and all(
+            hasattr(connection, attr)
+            for attr in ("_build_command", "_run", "get_option")
+        )
+
+    def run(self, commands):
+        """Run sftp commands as a single batch over one session. sftp runs
+        in batch mode, so it stops at the first command that fails and
+        returns a nonzero return code.
+
+        Arguments:
+            commands {list[str]} -- The sftp commands, for example 'put a b'.
+
+        Returns:
+            int -- The return code of sftp.
+            str -- The standard output of sftp.
+            str -- The errors reported by sftp, empty when the return code is zero.
+        """
+        in_data = to_bytes("\n".join(commands) + "\n", errors="surrogate_or_strict")
+        if self.uses_connection:
+            cmd = self._connection_command()
+            rc, out, err = self.connection._run(
+                cmd, in_data, sudoable=False, checkrc=False
+            )
+        else:
+            transfer = subprocess.Popen(
+                self._command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            out, err = transfer.communicate(in_data)
+            rc = transfer.returncode
+        if rc == 0:
+            return rc, to_text(out), ""
+        return rc, to_text(out), _detect_sftp_errors(err)
+
+    def _connection_command(self):
+        """Build the sftp command with the connection of the task. The ssh
+        connection of ansible-core takes the kind of binary as its second
+        argument, which adds '-b -' for sftp, zos_ssh does not.
+
+        Returns:
+            list[bytes] -- The sftp command.
+        """
+        sftp = self.connection.get_option("sftp_executable")
+        host = "[{0}]".format(self.host)
+        try:
+            params = inspect.signature(self.connection._build_command).parameters
+        except (TypeError, ValueError):
+            params = {}
+        if "subsystem" in params:
+            return self.connection._build_command(sftp, "sftp", host)
+        return self.connection._build_command(sftp, host)
+
+    def _command(self):
+        """Build a stand alone sftp command that shares a master connection
+        with later transfers to the same host, port and user.
+
+        Returns:
+            list[str] -- The sftp command.
+        """
+        cmd = ["sftp", "-b", "-", "-oPort={0}".format(self.port)]
+        control_path = _control_path(self.host, self.port, self.user)
+        if control_path:
+            cmd += [
+                "-oControlMaster=auto",
+                "-oControlPersist={0}".format(CONTROL_PERSIST),
+                "-oControlPath={0}".format(control_path),
+            ]
+        cmd.append("{0}@{1}".format(self.user, self.host))
+        return cmd
+
+
+def _control_path(host, port, user):
+    """Get the socket path of the master connection to a host, hashed
+    the way the ssh connection plugins name theirs so it stays short.
+
+    Returns:
+        str -- The socket path, None if its directory can not be used.
+    """
+    control_path_dir = os.path.expanduser(CONTROL_PATH_DIR)
+    try:
+        if not os.path.isdir(control_path_dir):
+            os.makedirs(control_path_dir, 0o700)
+    except OSError:
+        return None
+    if not os.access(control_path_dir, os.W_OK):
+        return None
+    key = "sftp-{0}-{1}-{2}".format(host, port, user)
+    digest = sha256(to_bytes(key, errors="surrogate_or_strict")).hexdigest()
+    return os.path.join(control_path_dir, digest[:10])
+
+
+def _detect_sftp_errors(stderr):
+    """Get the errors from the stderr of a failed SFTP command. ssh also
+    writes the connection acknowledgement and, at higher verbosity, its
+    own log messages there, so stderr alone does not tell whether the
+    transfer failed.
+
+    Arguments:
+        stderr {bytes} -- The standard error of sftp.
+
+    Returns:
+        str -- The error lines, without the connection acknowledgement
+        and ssh debug messages.
+    """
+    lines = [
+        line
+        for line in to_text(stderr).splitlines()
+        if line and not line.startswith(("Connected to ", "debug", "OpenSSH_"))
+    ]
+    return "".join(lines)
@@ -7,9 +7,44 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import re
+import time
+from collections import OrderedDict
+from threading import Lock
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
     AnsibleModuleHelper,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
+    concurrency,
+    metadata_cache,
+)
+
+DATA_SET_SECTION_DELIMITER = "0---------------DATA SET NAME----------------"
+FIRST_ROW_REGEX = re.compile(
+    r"(0-*DATA SET NAME-*\s+)(SER NO\s+)(SEQNO\s+)(DATE.CRE\s+)(DATE.EXP\s+)"
+    r"(DATE.REF\s+)(EXT\s+)(DSORG\s+)(RECFM\s+)(OPTCD\s+)(BLKSIZE[ ]*)"
+)
+SECOND_ROW_REGEX = re.compile(
+    r"(0SMS.IND\s+)(LRECL\s+)(KEYLEN\s+)(INITIAL ALLOC\s+)(2ND ALLOC\s+)"
+    r"(EXTEND\s+)(LAST BLK\(T-R-L\)\s+)(DIR.REM\s+)(F2 OR F3\(C-H-R\)\s+)(DSCB\(C-H-R\)[ ]*)"
+)
+THIRD_ROW_REGEX = re.compile(r"([ ]*EATTR[ ]*)")
+EXTEND_REGEX = re.compile(r"([0-9]+)(AV|BY|KB|MB)")
+LAST_BLK_REGEX = re.compile(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)?")
+CHR_REGEX = re.compile(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)")
+CH_REGEX = re.compile(r"[ ]*([0-9]+)[ ]+([0-9]+)")
+NO_EXTENTS_REGEX = re.compile(r"THE\sABOVE\sDATASET\sHAS\sNO\sEXTENTS")
+EXTENTS_INDENT_REGEX = re.compile(
+    r"(0\s*EXTENTS\s+)(?:(NO\s+)(LOW\(C-H\)\s+)(HIGH\(C-H\)[ ]*))"
+)
+EXTENTS_HEADER_REGEX = re.compile(r"(NO\s+)(LOW\(C-H\)\s+)(HIGH\(C-H\)[ ]*)")
+
+"""the number of distinct table and extent layouts to remember"""
+LAYOUT_CACHE_SIZE = 64
+
+_layout_cache = dict()
+
+"""the number of volumes to run IEHLIST for at the same time"""
+DEFAULT_MAX_WORKERS = 8
 
 
 def get_volume_entry(volume):
@@ -25,36 +60,97 @@ def get_volume_entry(volume):
     Returns:
         list[dict] -- List of dictionaries holding data set information from VTOC.
     """
+    return get_volume_index(volume).entries()
+
+
+def get_volume_index(volume):
+    """Retrieve the index of the VTOC of a volume. IEHLIST runs once
+    per volume, later lookups reuse the index until the data sets
+    on the volume change.
+
+    Arguments:
+        volume {str} -- The name of the volume.
+
+    Raises:
+        VolumeTableOfContentsError: When any exception is raised during VTOC operations.
+
+    Returns:
+        VolumeTableOfContents -- The index of the data sets on the volume.
+    """
+    return metadata_cache.lookup(
+        metadata_cache.VTOC,
+        None,
+        volume,
+        lambda: VolumeTableOfContents(_listvtoc(volume)),
+    )
+
+
+def get_volume_entries(volumes, max_workers=DEFAULT_MAX_WORKERS):
+    """Retrieve the VTOC of several volumes, running IEHLIST for up
+    to max_workers volumes at the same time.
+
+    Arguments:
+        volumes {list[str]} -- The names of the volumes.
+
+    Keyword Arguments:
+        max_workers {int} -- The maximum number of volumes to list at once. (default: {8})
+
+    Raises:
+        VolumeTableOfContentsError: When any exception is raised during VTOC operations.
+
+    Returns:
+        MultiVolumeTableOfContents -- The index of the data sets on all volumes.
+    """
+    volumes = list(OrderedDict((volume.upper(), None) for volume in volumes))
+
+    def get_timed_volume_index(volume):
+        start = time.time()
+        index = get_volume_index(volume)
+        return index, time.time() - start
+
+    results = concurrency.map_concurrently(get_timed_volume_index, volumes, max_workers)
+    indexes = OrderedDict()
+    elapsed = OrderedDict()
+    for volume, result in zip(volumes, results):
+        indexes[volume], elapsed[volume] = result
+    return MultiVolumeTableOfContents(indexes, elapsed)
+
+
+def _listvtoc(volume):
+    """Run IEHLIST to list the VTOC of a volume.
+
+    Arguments:
+        volume {str} -- The name of the volume.
+
+    Raises:
+        VolumeTableOfContentsError: When any exception is raised during VTOC operations.
+
+    Returns:
+        str -- The output of LISTVTOC, None if IEHLIST failed.
+    """
     try:
         stdin = "  LISTVTOC FORMAT,VOL=3390={0}".format(volume.upper())
         dd = "SYS1.VVDS.V{0}".format(volume.upper())
-        stdout = _iehlist(dd, stdin)
-        if stdout is None:
-            return None
-        data_sets = _process_output(stdout)
+        return _iehlist(dd, stdin)
     except Exception as e:
         raise VolumeTableOfContentsError(repr(e))
-    return data_sets
 
 
 def get_data_set_entry(data_set_name, volume):
     """Retrieve VTOC information for a single data set
-    on a volume.
+    on a volume. The VTOC is only parsed as far as the data set.
 
     Arguments:
         data_set_name {str} -- The name of the data set to retrieve information for.
         volume {str} -- The name of the volume.
 
+    Raises:
+        VolumeTableOfContentsError: When any exception is raised during VTOC operations.
+
     Returns:
         dict -- The information for the data set found in VTOC.
     """
-    data_set = None
-    data_sets = get_volume_entry(volume)
-    for ds in data_sets:
-        if ds.get("data_set_name") == data_set_name.upper():
-            data_set = ds
-            break
-    return data_set
+    return get_volume_index(volume).get(data_set_name)
 
 
 def find_data_set_in_volume_output(data_set_name, data_sets):
@@ -107,54 +203,63 @@ def _process_output(stdout):
     Returns:
         list[dict] -- List of dictionaries holding data set information from VTOC.
     """
-    data_sets = []
-    data_set_strings = _separate_data_set_sections(stdout)
-    for data_set_string in data_set_strings:
-        data_sets.append(_parse_data_set_info(data_set_string))
-    return data_sets
+    return list(_iter_data_sets(stdout))
 
 
-def _separate_data_set_sections(contents):
-    """Split LISTVTOC output into data set sections.
+def _iter_data_sets(stdout):
+    """Parse the output of LISTVTOC one line at a time, yielding the
+    information for each data set as soon as its section ends.
 
     Arguments:
-        contents {str} -- The output of LISTVTOC.
+        stdout {str} -- The output of LISTVTOC.
 
     Returns:
-        list[str] -- LISTVTOC output separated into sections by data set.
+        Iterator[dict] -- Holds data set information from VTOC, one data set at a time.
     """
-    delimeter = "0---------------DATA SET NAME----------------"
-    data_sets = re.split(delimeter, contents)
-    fixed_ds = [delimeter + x for x in data_sets[1:]]
-    return fixed_ds
+    section = None
+    for line in _iter_lines(stdout):
+        if line.startswith(DATA_SET_SECTION_DELIMITER):
+            if section is not None:
+                yield _parse_data_set_info(section)
+            section = [line]
+        elif section is not None:
+            section.append(line)
+    if section is not None:
+        yield _parse_data_set_info(section)
+
 
+def _iter_lines(contents):
+    """Split text into lines without copying all of it at once.
 
-def _parse_data_set_info(data_set_string):
+    Arguments:
+        contents {str} -- The text to split.
+
+    Returns:
+        Iterator[str] -- Each line of the text, without its line break.
+    """
+    start = 0
+    end = contents.find("\n")
+    while end >= 0:
+        yield contents[start:end]
+        start = end + 1
+        end = contents.find("\n", start)
+    yield contents[start:]
+
+
+def _parse_data_set_info(lines):
     """Build dictionaries representing data set information
     from LISTVTOC output.
 
     Arguments:
-        data_set_string {str} -- Single data set section of the LISTVTOC output.
+        lines {list[str]} -- Lines of a single data set section of the LISTVTOC output.
 
     Returns:
         dict -- Holds data set information from VTOC.
     """
-    lines = data_set_string.split("\n")
     data_set_info = {}
-    regex_for_rows = [
-        (
-            r"(0-*DATA SET NAME-*\s+)(SER NO\s+)(SEQNO\s+)(DATE.CRE\s+)(DATE.EXP\s+)"
-            r"(DATE.REF\s+)(EXT\s+)(DSORG\s+)(RECFM\s+)(OPTCD\s+)(BLKSIZE[ ]*)"
-        ),
-        (
-            r"(0SMS.IND\s+)(LRECL\s+)(KEYLEN\s+)(INITIAL ALLOC\s+)(2ND ALLOC\s+)"
-            r"(EXTEND\s+)(LAST BLK\(T-R-L\)\s+)(DIR.REM\s+)(F2 OR F3\(C-H-R\)\s+)(DSCB\(C-H-R\)[ ]*)"
-        ),
-        r"([ ]*EATTR[ ]*)",
-    ]
-    data_set_info.update(_parse_table_row(regex_for_rows[0], lines[0], lines[1]))
-    data_set_info.update(_parse_table_row(regex_for_rows[1], lines[2], lines[3]))
-    data_set_info.update(_parse_table_row(regex_for_rows[2], lines[4], lines[5]))
+    data_set_info.update(_parse_table_row(FIRST_ROW_REGEX, lines[0], lines[1]))
+    data_set_info.update(_parse_table_row(SECOND_ROW_REGEX, lines[2], lines[3]))
+    data_set_info.update(_parse_table_row(THIRD_ROW_REGEX, lines[4], lines[5]))
     data_set_info.update(_parse_extents(lines[6:]))
     return data_set_info
 
@@ -164,7 +269,7 @@ def _parse_table_row(regex, header_row, data_row):
     VTOCLIST output.
 
     Arguments:
-        regex {str} -- The regular expression used to parse table row.
+        regex {Pattern} -- The regular expression used to parse table row.
         header_row {str} -- The row of the table containing headers.
         data_row {str} -- The row of the table containing data.
 
@@ -172,18 +277,42 @@ def _parse_table_row(regex, header_row, data_row):
         dict -- Structured data for the row of the table.
     """
     table_data = {}
-    fields = re.findall(regex, header_row)
+    for field, start, end in _table_row_layout(regex, header_row):
+        table_data[field] = data_row[start:end].strip()
+    table_data = _format_table_data(table_data)
+    return table_data
+
+
+def _table_row_layout(regex, header_row):
+    """Find the name and columns of each field in a table header.
+    Every data set section repeats the same headers, so the layout
+    of recently seen headers is remembered.
+
+    Arguments:
+        regex {Pattern} -- The regular expression used to parse table row.
+        header_row {str} -- The row of the table containing headers.
 
+    Returns:
+        list[tuple] -- The name, start and end column of each field.
+    """
+    key = (regex.pattern, header_row)
+    layout = _layout_cache.get(key)
+    if layout is not None:
+        return layout
+    layout = []
+    fields = regex.findall(header_row)
     if len(fields) > 0:
         if isinstance(fields[0], str):
             fields = [[fields[0]]]
         count = 0
         for field in fields[0]:
             end = count + len(field)
-            table_data[field.strip(" -0")] = data_row[count:end].strip()
+            layout.append((field.strip(" -0"), count, end))
             count += len(field)
-    table_data = _format_table_data(table_data)
-    return table_data
+    if len(_layout_cache) >= LAYOUT_CACHE_SIZE:
+        _layout_cache.clear()
+    _layout_cache[key] = layout
+    return layout
 
 
 def _format_table_data(table_data):
@@ -197,35 +326,11 @@ def _format_table_data(table_data):
     Returns:
         dict -- Updated data.
     """
-    handlers = {
-        "DATA SET NAME": "data_set_name",
-        "SER NO": "volume",
-        "SEQNO": "sequence",
-        "DATE.CRE": "creation_date",
-        "DATE.EXP": "expiration_date",
-        "DATE.REF": "last_referenced_date",
-        "EXT": "number_of_extents",
-        "DSORG": "data_set_organization",
-        "RECFM": "record_format",
-        "OPTCD": "option_code",
-        "BLKSIZE": "block_size",
-        "SMS.IND": "sms_attributes",
-        "LRECL": "record_length",
-        "KEYLEN": "key_length",
-        "INITIAL ALLOC": "space_type",
-        "2ND ALLOC": "space_secondary",
-        "EXTEND": _format_extend,
-        "LAST BLK(T-R-L)": {"name": "last_block_pointer", "func": _format_last_blk},
-        "DIR.REM": "last_directory_block_bytes_used",
-        "F2 OR F3(C-H-R)": {"name": "dscb_format_2_or_3", "func": _format_f2_or_f3},
-        "DSCB(C-H-R)": {"name": "dscb_format_1_or_8", "func": _format_dscb},
-        "EATTR": "extended_attributes",
-    }
     formatted_table_data = {}
     for key, value in table_data.items():
         if not value:
             continue
-        updated_data_item = handlers.get(key, key)
+        updated_data_item = TABLE_DATA_HANDLERS.get(key, key)
         if isinstance(updated_data_item, str):  # only need to update name
             formatted_table_data[updated_data_item] = value
         elif isinstance(updated_data_item, dict):  # need to update value, name defined
@@ -249,7 +354,7 @@ def _format_extend(contents, formatted_table_data):
     Returns:
         dict -- The updated formatted_table_data dictionary.
     """
-    matches = re.search(r"([0-9]+)(AV|BY|KB|MB)", contents)
+    matches = EXTEND_REGEX.search(contents)
     original_space_secondary = ""
     average_block_size = ""
     if matches:
@@ -278,7 +383,7 @@ def _format_last_blk(contents):
         dict -- Structured data parsed from last blk field contents.
     """
     result = None
-    matches = re.search(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)?", contents)
+    matches = LAST_BLK_REGEX.search(contents)
     if matches:
         result = {}
         result["track"] = matches.group(1)
@@ -298,7 +403,7 @@ def _format_f2_or_f3(contents):
         dict -- Structured data parsed from the F2 or F3 field contents.
     """
     result = None
-    matches = re.search(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)", contents)
+    matches = CHR_REGEX.search(contents)
     if matches:
         result = {}
         result["cylinder"] = matches.group(1)
@@ -317,7 +422,7 @@ def _format_dscb(contents):
         dict -- Structured data parsed from the dscb field contents.
     """
     result = None
-    matches = re.search(r"[ ]*([0-9]+)[ ]+([0-9]+)[ ]+([0-9]+)", contents)
+    matches = CHR_REGEX.search(contents)
     if matches:
         result = {}
         result["cylinder"] = matches.group(1)
@@ -326,6 +431,33 @@ def _format_dscb(contents):
     return result
 
 
+"""the names and formatters of the fields in the LISTVTOC table"""
+TABLE_DATA_HANDLERS = {
+    "DATA SET NAME": "data_set_name",
+    "SER NO": "volume",
+    "SEQNO": "sequence",
+    "DATE.CRE": "creation_date",
+    "DATE.EXP": "expiration_date",
+    "DATE.REF": "last_referenced_date",
+    "EXT": "number_of_extents",
+    "DSORG": "data_set_organization",
+    "RECFM": "record_format",
+    "OPTCD": "option_code",
+    "BLKSIZE": "block_size",
+    "SMS.IND": "sms_attributes",
+    "LRECL": "record_length",
+    "KEYLEN": "key_length",
+    "INITIAL ALLOC": "space_type",
+    "2ND ALLOC": "space_secondary",
+    "EXTEND": _format_extend,
+    "LAST BLK(T-R-L)": {"name": "last_block_pointer", "func": _format_last_blk},
+    "DIR.REM": "last_directory_block_bytes_used",
+    "F2 OR F3(C-H-R)": {"name": "dscb_format_2_or_3", "func": _format_f2_or_f3},
+    "DSCB(C-H-R)": {"name": "dscb_format_1_or_8", "func": _format_dscb},
+    "EATTR": "extended_attributes",
+}
+
+
 def _parse_extents(lines):
     """Parse and structure extent data from VTOCLIST.
 
@@ -338,17 +470,13 @@ def _parse_extents(lines):
         list[dict] -- Structured data parsed from the extent field contents.
     """
     extents = []
-    if re.search(r"THE\sABOVE\sDATASET\sHAS\sNO\sEXTENTS", "".join(lines)):
+    if NO_EXTENTS_REGEX.search("".join(lines)):
         return {}
-    regex_for_extents_indent = (
-        r"(0\s*EXTENTS\s+)(?:(NO\s+)(LOW\(C-H\)\s+)(HIGH\(C-H\)[ ]*))"
-    )
-    regex_for_header_row = r"(NO\s+)(LOW\(C-H\)\s+)(HIGH\(C-H\)[ ]*)"
-    indent_group = re.findall(regex_for_extents_indent, lines[0])
+    indent_group = EXTENTS_INDENT_REGEX.findall(lines[0])
     indent_length = len(indent_group[0][0])
-    header_groups = re.findall(regex_for_header_row, lines[0])
+    header_groups = EXTENTS_HEADER_REGEX.findall(lines[0])
     regex_for_extents_data = _extent_regex_builder(indent_length, header_groups)
-    extent_data = re.findall(regex_for_extents_data, "\n".join(lines), re.MULTILINE)
+    extent_data = regex_for_extents_data.findall("\n".join(lines))
     if len(extent_data) > 0:
         extents = _format_extent_data(extent_data)
     return {"extents": extents}
@@ -356,6 +484,7 @@ def _parse_extents(lines):
 
 def _extent_regex_builder(indent_length, header_groups):
     """Build regular expressions for parsing extent information.
+    The expressions for recently seen layouts are remembered.
 
     Arguments:
         indent_length {int} -- The number of spaces before extent information starts.
@@ -363,17 +492,28 @@ def _extent_regex_builder(indent_length, header_groups):
         during VTOCLIST parsing.
 
     Returns:
-        str -- The regular expression for parsing extent information.
+        Pattern -- The compiled regular expression for parsing extent information.
     """
+    widths = tuple(
+        tuple(len(x) for x in header_group) for header_group in header_groups
+    )
+    key = (indent_length, widths)
+    extent_regex = _layout_cache.get(key)
+    if extent_regex is not None:
+        return extent_regex
     extent_regex = "^[ ]{{{0}}}".format(str(indent_length))
-    for index, header_group in enumerate(header_groups):
+    for index, header_group in enumerate(widths):
         group_regex = "([ 0-9]{{{0}}})([ 0-9]{{{1}}})([ 0-9]{{{2}}})".format(
-            *[str(len(x)) for x in header_group]
+            *[str(x) for x in header_group]
         )
         if index > 0:
             group_regex = "(?:{0}){{0,1}}".format(group_regex)
         extent_regex += group_regex
     extent_regex += "$"
+    extent_regex = re.compile(extent_regex, re.MULTILINE)
+    if len(_layout_cache) >= LAYOUT_CACHE_SIZE:
+        _layout_cache.clear()
+    _layout_cache[key] = extent_regex
     return extent_regex
 
 
@@ -395,18 +535,136 @@ def _format_extent_data(extent_data):
         position = index * 3
         extent = {}
         extent["number"] = flattened_extent_data[position]
-        low = re.search(
-            r"[ ]*([0-9]+)[ ]+([0-9]+)", flattened_extent_data[position + 1]
-        )
+        low = CH_REGEX.search(flattened_extent_data[position + 1])
         extent["low"] = {"cylinder": low.group(1), "track": low.group(2)}
-        high = re.search(
-            r"[ ]*([0-9]+)[ ]+([0-9]+)", flattened_extent_data[position + 2]
-        )
+        high = CH_REGEX.search(flattened_extent_data[position + 2])
         extent["high"] = {"cylinder": high.group(1), "track": high.group(2)}
         extents.append(extent)
     return extents
 
 
+class VolumeTableOfContents(object):
+    def __init__(self, stdout):
+        """An index of the data sets in the VTOC of a volume, keyed by
+        data set name. The output of LISTVTOC is parsed lazily, only
+        as far as needed to find the data sets looked up so far.
+
+        Arguments:
+            stdout {str} -- The output of LISTVTOC, None if IEHLIST failed.
+        """
+        self._data_sets = None if stdout is None else []
+        self._index = dict()
+        self._pending = None if stdout is None else _iter_data_sets(stdout)
+        self._lock = Lock()
+
+    def get(self, data_set_name):
+        """Find a data set, parsing the VTOC until it is found.
+
+        Arguments:
+            data_set_name {str} -- The name of the data set to retrieve information for.
+
+        Raises:
+            VolumeTableOfContentsError: When the LISTVTOC output cannot be parsed.
+
+        Returns:
+            dict -- The information for the data set found in VTOC.
+        """
+        name = data_set_name.upper()
+        with self._lock:
+            data_set = self._index.get(name)
+            while data_set is None and self._pending is not None:
+                data_set = self._parse_next()
+                if data_set is not None and data_set.get("data_set_name") != name:
+                    data_set = None
+        return data_set
+
+    def entries(self):
+        """Get every data set in the VTOC, parsing the rest of it.
+
+        Raises:
+            VolumeTableOfContentsError: When the LISTVTOC output cannot be parsed.
+
+        Returns:
+            list[dict] -- List of dictionaries holding data set information from VTOC.
+        """
+        with self._lock:
+            while self._pending is not None:
+                self._parse_next()
+        return self._data_sets
+
+    def _parse_next(self):
+        """Parse and index the next data set in the LISTVTOC output.
+
+        Raises:
+            VolumeTableOfContentsError: When the LISTVTOC output cannot be parsed.
+
+        Returns:
+            dict -- The information for the data set, None when all are parsed.
+        """
+        try:
+            data_set = next(self._pending, None)
+        except Exception as e:
+            self._pending = None
+            raise VolumeTableOfContentsError(repr(e))
+        if data_set is None:
+            self._pending = None
+            return None
+        self._data_sets.append(data_set)
+        self._index.setdefault(data_set.get("data_set_name"), data_set)
+        return data_set
+
+
+class MultiVolumeTableOfContents(object):
+    def __init__(self, indexes, elapsed):
+        """An index of the data sets in the VTOC of several volumes.
+
+        Arguments:
+            indexes {OrderedDict[str, VolumeTableOfContents]} -- The index of each volume.
+            elapsed {OrderedDict[str, float]} -- The seconds taken to list each volume.
+        """
+        self.indexes = indexes
+        self.elapsed = elapsed
+
+    def get(self, data_set_name):
+        """Find a data set on every volume, parsing each VTOC until it is found.
+
+        Arguments:
+            data_set_name {str} -- The name of the data set to retrieve information for.
+
+        Raises:
+            VolumeTableOfContentsError: When the LISTVTOC output cannot be parsed.
+
+        Returns:
+            list[dict] -- The information for the data set found in each VTOC,
+            in volume sequence order.
+        """
+        data_sets = []
+        for index in self.indexes.values():
+            data_set = index.get(data_set_name)
+            if data_set is not None:
+                data_sets.append(data_set)
+        return sorted(data_sets, key=_volume_sequence)
+
+    def entries(self):
+        """Get every data set in the VTOC of every volume.
+
+        Raises:
+            VolumeTableOfContentsError: When the LISTVTOC output cannot be parsed.
+
+        Returns:
+            list[dict] -- List of dictionaries holding data set information from VTOC.
+        """
+        data_sets = []
+        for index in self.indexes.values():
+            data_sets.extend(index.entries() or [])
+        return data_sets
+
+
+def _volume_sequence(data_set):
+    sequence = data_set.get("sequence", "")
+    return int(sequence) if sequence.isdigit() else 0
+
+
 class VolumeTableOfContentsError(Exception):
     def __init__(self, msg=""):
         self.msg = "An error occurred during VTOC parsing or retrieval. {0}".format(msg)
@@ -0,0 +1,466 @@
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+"""Persistent worker that runs module payloads without starting a new interpreter.
+
+This file is copied to the target as a standalone script by the zos_ssh
+connection plugin, together with rexx.py in the same directory, so it must
+only depend on the Python standard library and that module.
+
+Usage:
+    python worker.py <module> [args...]   run a module payload through the worker
+    python worker.py --serve <socket>     run the worker daemon itself
+
+The first run starts the daemon in the background and runs the payload the
+normal way. The daemon imports ZOAU and commonly used standard library modules
+once, then forks a child for every payload so each run starts from the same
+clean, already warm interpreter state.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from hashlib import sha256
+from tempfile import TemporaryFile, gettempdir
+from time import time
+import atexit
+import errno
+import fcntl
+import gc
+import json
+import os
+import runpy
+import select
+import socket
+import sys
+import traceback
+
+try:
+    from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import rexx
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import rexx
+
+"""environment variable that can override the directory the worker socket is created in"""
+WORKER_DIR_ENV = "ZOS_CORE_WORKER_DIR"
+WORKER_DIR_PREFIX = "ibm_zos_core_worker_"
+DEFAULT_IDLE_TIMEOUT_S = 600
+REAP_INTERVAL_S = 1
+CONNECT_TIMEOUT_S = 5
+
+"""
+Run with python -c "<BOOTSTRAP>" <worker> <marker> <module> [args...] to run a module
+through the worker when it is installed, or to print the marker to stderr and
+run the module the normal way when it is not. Contains no shell quoting.
+"""
+BOOTSTRAP = (
+    "import os,sys,runpy;a=sys.argv;w=os.path.expanduser(a[1]);"
+    "os.path.isfile(w) or (sys.stderr.write(a[2]+os.linesep),sys.stderr.flush(),"
+    "os.execv(sys.executable,[sys.executable]+a[3:]));"
+    "sys.argv=[w]+a[3:];runpy.run_path(w,run_name=__name__)"
+)
+
+PRELOAD_MODULES = (
+    "zoautil_py",
+    "base64",
+    "codecs",
+    "datetime",
+    "grp",
+    "json",
+    "locale",
+    "platform",
+    "pwd",
+    "re",
+    "selectors",
+    "shlex",
+    "shutil",
+    "subprocess",
+    "tempfile",
+    "traceback",
+    "zipfile",
+)
+
+
+def main(argv):
+    """Dispatch to the worker daemon or client.
+
+    Arguments:
+        argv {list[str]} -- The command line arguments, without the script name.
+
+    Returns:
+        int -- The exit code.
+    """
+    if len(argv) == 2 and argv[0] == "--serve":
+        serve(argv[1])
+        return 0
+    if not argv:
+        sys.stderr.write("usage: worker.py <module> [args...]\n")
+        return 2
+    return run(argv)
+
+
+def run(module_argv):
+    """Run a module payload through the worker daemon.
+    When the daemon is not running it is started in the background and the
+    payload is run by replacing this process with a normal interpreter.
+
+    Arguments:
+        module_argv {list[str]} -- The payload path followed by its arguments.
+
+    Returns:
+        int -- The exit code of the payload.
+    """
+    socket_path = get_socket_path()
+    try:
+        conn = _connect(socket_path)
+    except (IOError, OSError):
+        _spawn_server(socket_path)
+        _exec_payload(module_argv)
+    try:
+        _send_frame(
+            conn,
+            dict(
+                argv=[os.path.abspath(module_argv[0])] + list(module_argv[1:]),
+                cwd=os.getcwd(),
+                env=dict(os.environ),
+            ),
+        )
+        header, stdout, stderr = _recv_response(conn)
+    except (IOError, OSError, ValueError) as e:
+        # the payload may already have run, so it is not safe to run it again
+        sys.stderr.write("Worker failed to run {0}: {1}\n".format(module_argv[0], e))
+        return 1
+    finally:
+        conn.close()
+    _write(sys.stdout, stdout)
+    _write(sys.stderr, stderr)
+    return header.get("rc", 1)
+
+
+def serve(socket_path, idle_timeout=DEFAULT_IDLE_TIMEOUT_S):
+    """Serve module payloads on a Unix socket until idle.
+    Only one daemon serves a socket, later ones exit immediately.
+
+    Arguments:
+        socket_path {str} -- The path of the socket to listen on.
+
+    Keyword Arguments:
+        idle_timeout {int} -- Seconds without requests before exiting. (default: {600})
+    """
+    try:
+        if not rexx.is_private_dir(os.path.dirname(socket_path)):
+            return
+        lock = open(socket_path + ".lock", "a")
+    except (IOError, OSError):
+        return
+    try:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except (IOError, OSError):
+        lock.close()
+        return
+    _preload()
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o077)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(umask)
+    server.listen(16)
+    children = set()
+    last_request = time()
+    try:
+        while os.path.exists(socket_path):
+            ready = select.select([server], [], [], REAP_INTERVAL_S)[0]
+            _reap(children)
+            if ready:
+                _accept(server, children)
+                last_request = time()
+            elif not children and time() - last_request > idle_timeout:
+                # stop new clients from connecting before serving the ones
+                # that connected while the last check was running
+                os.remove(socket_path)
+                while select.select([server], [], [], 0)[0]:
+                    _accept(server, children)
+                break
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        lock.close()
+
+
+def get_socket_path():
+    """Get the path of the worker socket.
+    The name depends on this script, the rexx module and the interpreter
+    running them, so
+    workers for different collection versions or interpreters never mix.
+
+    Returns:
+        str -- The absolute path of the worker socket.
+    """
+    worker_dir = os.environ.get(WORKER_DIR_ENV)
+    if not worker_dir:
+        worker_dir = os.path.join(
+            gettempdir(), "{0}{1}".format(WORKER_DIR_PREFIX, os.getuid())
+        )
+    digest = sha256()
+    for script_path in (__file__, rexx.__file__):
+        with open(os.path.abspath(script_path), "rb") as f:
+            digest.update(f.read())
+    digest.update(sys.executable.encode("utf-8"))
+    return os.path.join(worker_dir, "worker_{0}.sock".format(digest.hexdigest()[:16]))
+
+
+def _connect(socket_path):
+    """Connect to the worker daemon.
+
+    Arguments:
+        socket_path {str} -- The path of the worker socket.
+
+    Raises:
+        OSError: When the daemon is not running or the socket is not safe to use.
+
+    Returns:
+        socket.socket -- The connected socket.
+    """
+    if not rexx.is_private_dir(os.path.dirname(socket_path)):
+        raise OSError(errno.EPERM, "Worker directory is not private", socket_path)
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(CONNECT_TIMEOUT_S)
+    try:
+        conn.connect(socket_path)
+    except (IOError, OSError):
+        conn.close()
+        raise
+    conn.settimeout(None)
+    return conn
+
+
+def _spawn_server(socket_path):
+    """Start the worker daemon fully detached from the current session.
+
+    Arguments:
+        socket_path {str} -- The path of the socket the daemon listens on.
+    """
+    try:
+        if not rexx.is_private_dir(os.path.dirname(socket_path)):
+            return
+        pid = os.fork()
+    except (IOError, OSError):
+        return
+    if pid:
+        os.waitpid(pid, 0)
+        return
+    try:
+        os.setsid()
+        if os.fork() == 0:
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            os.execv(
+                sys.executable,
+                [sys.executable, os.path.abspath(__file__), "--serve", socket_path],
+            )
+    finally:
+        os._exit(0)
+
+
+def _exec_payload(module_argv):
+    """Replace the current process with a normal run of the payload.
+
+    Arguments:
+        module_argv {list[str]} -- The payload path followed by its arguments.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, [sys.executable] + list(module_argv))
+
+
+def _preload():
+    """Import the modules every payload needs, ignoring any that are missing."""
+    for name in PRELOAD_MODULES:
+        try:
+            __import__(name)
+        except Exception:
+            pass
+
+
+def _reap(children):
+    """Collect the exit status of finished children.
+
+    Arguments:
+        children {set[int]} -- The process ids of running children, updated in place.
+    """
+    for pid in list(children):
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                children.discard(pid)
+        except OSError:
+            children.discard(pid)
+
+
+def _accept(server, children):
+    """Accept a connection and handle it in a forked child.
+
+    Arguments:
+        server {socket.socket} -- The listening socket.
+        children {set[int]} -- The process ids of running children, updated in place.
+    """
+    conn = server.accept()[0]
+    pid = os.fork()
+    if pid == 0:
+        server.close()
+        _handle_request(conn)
+    children.add(pid)
+    conn.close()
+
+
+def _handle_request(conn):
+    """Run one payload in a forked child and send back its result.
+    Never returns.
+
+    Arguments:
+        conn {socket.socket} -- The connection to the client.
+    """
+    rc = 1
+    try:
+        request = _recv_frame(conn.makefile("rb"))
+        rc, stdout, stderr = _run_payload(
+            request.get("argv"), request.get("cwd"), request.get("env")
+        )
+        _send_frame(conn, dict(rc=rc, stdout=len(stdout), stderr=len(stderr)))
+        conn.sendall(stdout)
+        conn.sendall(stderr)
+    except Exception:
+        rc = 1
+    finally:
+        os._exit(rc)
+
+
+def _run_payload(argv, cwd, env):
+    """Run a payload as __main__ in the current process, followed by the
+    exit handlers it registered.
+
+    Arguments:
+        argv {list[str]} -- The payload path followed by its arguments.
+        cwd {str} -- The working directory of the client.
+        env {dict} -- The environment of the client.
+
+    Returns:
+        tuple(int, bytes, bytes) -- The exit code, stdout and stderr of the payload.
+    """
+    stdout = TemporaryFile()
+    stderr = TemporaryFile()
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(stdout.fileno(), 1)
+    os.dup2(stderr.fileno(), 2)
+    os.chdir(cwd)
+    os.environ.clear()
+    os.environ.update(env)
+    sys.argv = list(argv)
+    sys.path[0] = os.path.dirname(argv[0])
+    # only the handlers of the payload run when it exits, not those of the daemon
+    atexit._clear()
+    rc = 0
+    try:
+        runpy.run_path(argv[0], run_name="__main__")
+    except SystemExit as e:
+        rc = _exit_code(e.code)
+    except BaseException:
+        traceback.print_exc()
+        rc = 1
+    # the child ends with os._exit, which skips finalizers and exit handlers,
+    # so run them here to remove the temporary files of the payload
+    gc.collect()
+    atexit._run_exitfuncs()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    stdout.seek(0)
+    stderr.seek(0)
+    return rc, stdout.read(), stderr.read()
+
+
+def _exit_code(code):
+    """Convert the argument of sys.exit to an exit code the way the interpreter does.
+
+    Arguments:
+        code {Union[int, str, NoneType]} -- The argument passed to sys.exit.
+
+    Returns:
+        int -- The exit code.
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code & 0xFF
+    sys.stderr.write("{0}\n".format(code))
+    return 1
+
+
+def _send_frame(conn, data):
+    """Send a JSON header line.
+
+    Arguments:
+        conn {socket.socket} -- The connection to send on.
+        data {dict} -- The header to send.
+    """
+    conn.sendall(json.dumps(data).encode("utf-8", "surrogateescape") + b"\n")
+
+
+def _recv_frame(stream):
+    """Read a JSON header line.
+
+    Arguments:
+        stream {file} -- The binary stream to read from.
+
+    Raises:
+        ValueError: When the connection was closed before a header was read.
+
+    Returns:
+        dict -- The header.
+    """
+    line = stream.readline()
+    if not line.endswith(b"\n"):
+        raise ValueError("Worker connection closed unexpectedly.")
+    return json.loads(line.decode("utf-8", "surrogateescape"))
+
+
+def _recv_response(conn):
+    """Read the result of a payload run.
+
+    Arguments:
+        conn {socket.socket} -- The connection to the daemon.
+
+    Raises:
+        ValueError: When the response is incomplete.
+
+    Returns:
+        tuple(dict, bytes, bytes) -- The header, stdout and stderr of the payload.
+    """
+    stream = conn.makefile("rb")
+    header = _recv_frame(stream)
+    stdout = stream.read(header.get("stdout", 0))
+    stderr = stream.read(header.get("stderr", 0))
+    if len(stdout) != header.get("stdout", 0) or len(stderr) != header.get("stderr", 0):
+        raise ValueError("Worker connection closed unexpectedly.")
+    return header, stdout, stderr
+
+
+def _write(stream, data):
+    """Write bytes to a text stream.
+
+    Arguments:
+        stream {file} -- The stream to write to.
+        data {bytes} -- The data to write.
+    """
+    stream.flush()
+    getattr(stream, "buffer", stream).write(data)
+    stream.flush()
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
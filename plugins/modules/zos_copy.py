@@ -32,8 +32,19 @@ options:
       - If C(src) is a file and dest ends with "/" or destination is a directory, the
         file is copied to the directory with the same filename as src.
       - If C(src) is a VSAM data set, destination must also be a VSAM.
+      - C(src) can also be a list of local files, or a pattern such as
+        C(/path/to/*.jcl) that matches local files. All of the files are
+        transferred in one session and copied by a single run of the module
+        into C(dest), which must be a USS directory or a PDS/PDSE. Each file
+        is copied to a file with the same name, or to the member named after
+        the file without its extension. A result is returned for each file
+        in C(results).
+      - A path with pattern characters is only used as a pattern if no local
+        file has that path.
+      - When copying several files to a PDS/PDSE, every file must give a
+        valid member name, otherwise nothing is copied.
       - Required unless using C(content).
-    type: str
+    type: raw
   dest:
     description:
       - Remote absolute path or data set where the file should be copied to.
@@ -175,6 +186,68 @@ options:
           - The encoding to be converted to
         required: true
         type: str
+  parallelism:
+    description:
+      - The maximum number of files converted at the same time when
+        C(encoding) is provided and C(src) is a directory.
+    type: int
+    required: false
+    default: 5
+  skip_unchanged:
+    description:
+      - If set to C(true), the SHA256 checksum of the local C(src) or
+        C(content) is compared with the checksum of the destination before
+        any data is transferred. When they match, nothing is transferred or
+        copied and the task reports no change.
+      - The destination is read in the encoding given by C(encoding.to) and
+        converted to C(encoding.from) before it is compared.
+      - When the destination is a data set or a data set member, line
+        endings and trailing blanks of each record are not compared.
+      - Only valid if C(src) is a local file or C(content) is used, and
+        C(dest) is a USS file, a sequential data set or a data set member,
+        otherwise ignored.
+      - Requires C(force=true). When C(force=false), an existing
+        destination is never overwritten, so the task exits before the
+        checksums are compared.
+    type: bool
+    required: false
+    default: false
+  delta:
+    description:
+      - If set to C(true) and C(dest) is an existing USS file, only the blocks
+        of the local C(src) file that are not already in C(dest) are
+        transferred, and the file is rebuilt from C(dest) on the remote z/OS
+        system. The rebuilt file is compared with the SHA256 checksum of
+        C(src) before it is copied to C(dest).
+      - Useful for large files with small changes between copies.
+      - When more than half of C(src) is not found in C(dest), the whole
+        file is transferred instead, since searching changed data for
+        blocks is slower than sending it.
+      - Only valid if C(src) is a local file and C(dest) is a USS file and
+        C(encoding) is not provided, otherwise the whole file is transferred.
+      - Requires C(force=true), since C(dest) must already exist and is
+        overwritten. When C(force=false), the task exits without copying
+        anything.
+    type: bool
+    required: false
+    default: false
+  compress:
+    description:
+      - Compress the local C(src) or C(content) before it is transferred to
+        the remote z/OS system, where it is decompressed before any encoding
+        conversion and copied to C(dest).
+      - Files and directories are packed into a single compressed archive,
+        so a directory is also transferred as one file.
+      - Useful for text files over slow connections, which usually compress
+        to a fraction of their size.
+      - zstd is not available in the Python standard library, so
+        C(zstd-fallback) compresses with gzip.
+      - Ignored if C(remote_src) is true.
+    type: str
+    required: false
+    choices:
+      - gzip
+      - zstd-fallback
   validate:
     description:
       - Specifies whether to perform checksum validation for source and
@@ -242,6 +315,18 @@ EXAMPLES = r"""
     dest: /path/to/uss/location
     local_follow: true
 
+- name: Copy every local JCL file to members of a PDSE in one transfer
+  zos_copy:
+    src: /path/to/local/jcl/*.jcl
+    dest: HLQ.SAMPLE.JCL
+
+- name: Copy a list of local files to a USS directory
+  zos_copy:
+    src:
+      - /path/to/local/file1.txt
+      - /path/to/local/file2.txt
+    dest: /path/to/uss/dir
+
 - name: Copy a local file to a PDS member
   zos_copy:
     src: /path/to/local/file
@@ -333,6 +418,15 @@ EXAMPLES = r"""
     src: SRC.PDS
     dest: /tmp
     remote_src: true
+
+- name: Compress a local directory before it is transferred to a PDSE
+  zos_copy:
+    src: /path/to/local/dir/
+    dest: HLQ.DEST.PDSE
+    encoding:
+      from: ISO8859-1
+      to: IBM-1047
+    compress: gzip
 """
 
 RETURN = r"""
@@ -391,6 +485,24 @@ state:
     returned: success and if dest is USS
     type: str
     sample: file
+results:
+    description:
+      - The result of copying each file when C(src) is a list of files or
+        a pattern.
+      - Files whose destination exists are not copied when C(force) is
+        C(false), and have a note.
+    returned: success and C(src) is a list or a pattern
+    type: list
+    elements: dict
+    sample:
+      - src: /path/to/local/file1.txt
+        dest: /path/to/uss/dir/file1.txt
+        changed: true
+        size: 1220
+      - src: /path/to/local/file2.txt
+        dest: /path/to/uss/dir/file2.txt
+        changed: false
+        note: Destination exists. No data was copied.
 note:
     description: A note to the user after module terminates.
     returned: C(force) is C(false) and dest exists
@@ -451,11 +563,15 @@ from ansible.module_utils._text import to_bytes
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
     better_arg_parser,
+    checksum,
     data_set,
     encode,
     vtoc,
     backup,
+    compress,
     copy,
+    delta,
+    metadata_cache,
     mvs_cmd
 )
 
@@ -530,6 +646,7 @@ class CopyHandler(object):
             # *****************************************************************
             if rc != 0:
                 Datasets.create(dest, "SEQ")
+                metadata_cache.invalidate(dest)
                 rc = Datasets.copy(new_src, dest)
                 if rc != 0:
                     self.fail_json(
@@ -547,6 +664,7 @@ class CopyHandler(object):
         """
         if self.dest_exists:
             rc = Datasets.delete(dest)
+            metadata_cache.invalidate(dest)
             if rc != 0:
                 self.fail_json(
                     msg="Unable to delete destination data set {0}".format(dest),
@@ -568,7 +686,7 @@ class CopyHandler(object):
                 cmd=repro_cmd
             )
 
-    def convert_encoding(self, src, temp_path, encoding):
+    def convert_encoding(self, src, temp_path, encoding, max_workers=encode.DEFAULT_MAX_WORKERS):
         """Convert encoding for given src
 
         Arguments:
@@ -576,6 +694,9 @@ class CopyHandler(object):
             temp_path {str} -- Path to the location where the control node transferred data to
             encoding {dict} -- Charsets that the source is to be converted from and to
 
+        Keyword Arguments:
+            max_workers {int} -- The maximum number of files to convert at once. (Default {5})
+
         Raises:
             EncodingConversionError -- When the encoding of a USS file is not able to be converted
 
@@ -598,7 +719,9 @@ class CopyHandler(object):
                     temp_dir = tempfile.mkdtemp()
                     shutil.copytree(new_src, temp_dir)
                     new_src = temp_dir
-                self._convert_encoding_dir(new_src, from_code_set, to_code_set)
+                self._convert_encoding_dir(
+                    new_src, from_code_set, to_code_set, max_workers=max_workers
+                )
                 self._tag_file_encoding(new_src, to_code_set, is_dir=True)
 
             except Exception as err:
@@ -643,6 +766,7 @@ class CopyHandler(object):
             alloc_cmd += " BLKSIZE({0})".format(blksize)
 
         rc, out, err = mvs_cmd.ikjeft01(alloc_cmd, authorized=True)
+        metadata_cache.invalidate(ds_name)
         if rc != 0:
             self.fail_json(
                 msg="Unable to allocate destination {0}".format(ds_name),
@@ -653,26 +777,32 @@ class CopyHandler(object):
             )
         return rc
 
-    def _convert_encoding_dir(self, dir_path, from_code_set, to_code_set):
-        """Convert encoding for all files inside a given directory
+    def _convert_encoding_dir(
+        self, dir_path, from_code_set, to_code_set, max_workers=encode.DEFAULT_MAX_WORKERS
+    ):
+        """Convert encoding for all files inside a given directory, converting
+        up to 'max_workers' files at the same time
 
         Arguments:
             dir_path {str} -- Absolute path to the input directory
             from_code_set {str} -- The character set to convert the files from
             to_code_set {str} -- The character set to convert the files to
 
+        Keyword Arguments:
+            max_workers {int} -- The maximum number of files to convert at once. (Default {5})
+
         Raises
-            EncodingConversionError -- When the encoding of a USS file is not able to be converted
+            EncodeError -- When the encoding of any USS file is not able to be converted
         """
         path, dirs, files = next(os.walk(dir_path))
         enc_utils = encode.EncodeUtils()
-        for file in files:
-            full_file_path = path + "/" + file
-            rc = enc_utils.uss_convert_encoding(
-                full_file_path, full_file_path, from_code_set, to_code_set
-            )
-            if not rc:
-                raise EncodingConversionError(full_file_path, from_code_set, to_code_set)
+        full_file_paths = [path + "/" + file for file in files]
+        enc_utils.uss_convert_encoding_files(
+            [(file, file) for file in full_file_paths],
+            from_code_set,
+            to_code_set,
+            max_workers=max_workers
+        )
 
     def _tag_file_encoding(self, file_path, tag, is_dir=False):
         """Tag the file specified by 'file_path' with the given code set.
@@ -741,6 +871,15 @@ class USSCopyHandler(CopyHandler):
             else:
                 dest = self._copy_to_dir(src, dest, conv_path, temp_path)
 
+        self.set_file_attributes(dest)
+        return dest
+
+    def set_file_attributes(self, dest):
+        """Apply the mode, group and owner requested for the destination.
+
+        Arguments:
+            dest {str} -- Path of the destination file or directory
+        """
         if self.common_file_args is not None:
             mode = self.common_file_args.get("mode")
             group = self.common_file_args.get("group")
@@ -751,7 +890,6 @@ class USSCopyHandler(CopyHandler):
                 self.module.set_group_if_different(dest, group, False)
             if owner is not None:
                 self.module.set_owner_if_different(dest, owner, False)
-        return dest
 
     def _copy_to_file(self, src, dest, conv_path, temp_path):
         """Helper function to copy a USS src to USS dest.
@@ -894,6 +1032,7 @@ class PDSECopyHandler(CopyHandler):
         else:
             if self.dest_exists:
                 rc = Datasets.delete(dest)
+                metadata_cache.invalidate(dest)
                 if rc != 0:
                     self.fail_json(
                         msg="Error while removing existing destination {0}".format(dest),
@@ -1038,6 +1177,7 @@ class PDSECopyHandler(CopyHandler):
 
             alloc_size = "{0}K".format(str(int(math.ceil(alloc_size / 1024))))
             rc = Datasets.create(ds_name, "PDSE", alloc_size, recfm, "", lrecl)
+        metadata_cache.invalidate(ds_name)
         return rc
 
 
@@ -1203,6 +1343,7 @@ def run_module(module, arg_def):
     backup_file = parsed_args.get('backup_file')
     model_ds = parsed_args.get('model_ds')
     validate = parsed_args.get('validate')
+    parallelism = parsed_args.get('parallelism')
     mode = module.params.get('mode')
     group = module.params.get('group')
     owner = module.params.get('owner')
@@ -1246,13 +1387,20 @@ def run_module(module, arg_def):
     # ********************************************************************
     # 1. Use DataSetUtils to determine the src and dest data set type.
     # 2. For source data sets, find its volume, which will be used later.
+    #    Both data sets are listed together.
     # ********************************************************************
     try:
+        ds_names = []
+        if not is_uss:
+            ds_names.append(dest_name)
+        if not (temp_path or '/' in src):
+            ds_names.append(src_name)
+        ds_utils = data_set.DataSetUtils.bulk(ds_names)
         if is_uss:
             dest_ds_type = "USS"
             dest_exists = os.path.exists(dest)
         else:
-            dest_du = data_set.DataSetUtils(dest_name)
+            dest_du = ds_utils[dest_name]
             dest_exists = dest_du.exists()
             if copy_member:
                 dest_exists = dest_exists and dest_du.member_exists(dest_member)
@@ -1260,7 +1408,7 @@ def run_module(module, arg_def):
         if temp_path or '/' in src:
             src_ds_type = "USS"
         else:
-            src_du = data_set.DataSetUtils(src_name)
+            src_du = ds_utils[src_name]
             if src_du.exists():
                 if src_member and not src_du.member_exists(member_name):
                     raise NonExistentSourceError(src)
@@ -1347,7 +1495,13 @@ def run_module(module, arg_def):
                 msg="Encoding conversion is only valid for USS source"
             )
         # 'conv_path' points to the converted src file or directory
-        conv_path = copy_handler.convert_encoding(src, temp_path, encoding)
+        if parallelism <= 0:
+            copy_handler.fail_json(
+                msg="The value of parallelism must be greater than 0"
+            )
+        conv_path = copy_handler.convert_encoding(
+            src, temp_path, encoding, max_workers=parallelism
+        )
 
     # ------------------------------- o -----------------------------------
     # Copy to USS file or directory
@@ -1426,10 +1580,340 @@ def run_module(module, arg_def):
     return res_args, temp_path, conv_path
 
 
+def run_module_for_src_files(module, arg_def):
+    """Copy several local files, transferred together to one temporary
+    directory, into a USS directory or into members of a PDS/PDSE.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from currently running module
+        arg_def {dict} -- The BetterArgParser definitions of the module arguments
+
+    Returns:
+        {dict} -- The result of the module, with a result for each file
+        {str} -- Path to the temporary directory the files were transferred to
+        {str} -- Path to the converted files, always None since the files
+        are converted in place
+    """
+    try:
+        parser = better_arg_parser.BetterArgParser(arg_def)
+        parsed_args = parser.parse_args(module.params)
+    except ValueError as err:
+        module.fail_json(
+            msg="Parameter verification failed", stderr=str(err)
+        )
+
+    dest = parsed_args.get('dest')
+    is_binary = parsed_args.get('is_binary')
+    backup = parsed_args.get('backup')
+    backup_file = parsed_args.get('backup_file')
+    model_ds = parsed_args.get('model_ds')
+    validate = parsed_args.get('validate')
+    parallelism = parsed_args.get('parallelism')
+    mode = module.params.get('mode')
+    group = module.params.get('group')
+    owner = module.params.get('owner')
+    encoding = module.params.get('encoding')
+    force = module.params.get('force')
+    is_uss = module.params.get('is_uss')
+    temp_path = module.params.get('temp_path')
+    alloc_size = module.params.get('size')
+    src_files = module.params.get('src_files')
+
+    # ********************************************************************
+    # The destination must be a USS directory or a PDS/PDSE. Each file is
+    # copied to the directory under its own name, or to the member named
+    # after the file without its extension.
+    # ********************************************************************
+    try:
+        if is_uss:
+            dest_ds_type = "USS"
+            dest_exists = os.path.exists(dest)
+            if dest_exists and not os.path.isdir(dest):
+                raise ValueError(
+                    "Destination {0} must be a directory to copy several files".format(dest)
+                )
+        else:
+            dest_du = data_set.DataSetUtils(dest)
+            dest_exists = dest_du.exists()
+            dest_ds_type = dest_du.ds_type()
+            if dest_exists and dest_ds_type not in MVS_PARTITIONED:
+                raise ValueError(
+                    "Destination {0} must be a partitioned data set to copy several files".format(dest)
+                )
+    except Exception as err:
+        module.fail_json(msg=str(err))
+
+    results = []
+    for src_file in src_files:
+        name = src_file.get('name')
+        if is_uss:
+            file_dest = os.path.join(dest, name)
+        else:
+            file_dest = "{0}({1})".format(dest, data_set.member_name_from_file(name))
+        if any(result.get('dest') == file_dest for result in results):
+            module.fail_json(
+                msg="More than one source file would be copied to {0}".format(file_dest)
+            )
+        results.append(dict(src=src_file.get('src'), dest=file_dest))
+
+    res_args = dict()
+    if dest_exists:
+        if backup or backup_file:
+            if (dest_ds_type in MVS_PARTITIONED and data_set.is_empty(dest)):
+                res_args['note'] = "Destination is emtpy, backup request ignored"
+            else:
+                backup_file = backup_data(dest, dest_ds_type, backup_file)
+    elif is_uss:
+        try:
+            os.makedirs(dest)
+        except OSError as err:
+            module.fail_json(
+                msg="Unable to create destination directory {0}".format(dest),
+                stderr=str(err)
+            )
+    else:
+        dest_ds_type = "PDSE"
+        pch = PDSECopyHandler(module, dest_exists, backup_file=backup_file)
+        pch.create_pdse(
+            temp_path, dest, alloc_size, "USS", model_ds=model_ds
+        )
+
+    copy_handler = CopyHandler(
+        module, dest_exists, is_binary=is_binary, backup_file=backup_file
+    )
+    if encoding:
+        if parallelism <= 0:
+            copy_handler.fail_json(
+                msg="The value of parallelism must be greater than 0"
+            )
+        try:
+            copy_handler._convert_encoding_dir(
+                temp_path, encoding.get("from"), encoding.get("to"),
+                max_workers=parallelism
+            )
+        except Exception as err:
+            copy_handler.fail_json(msg=str(err))
+        copy_handler._tag_file_encoding(temp_path, encoding.get("to"), is_dir=True)
+
+    if is_uss:
+        uss_copy_handler = USSCopyHandler(
+            module, dest_exists, is_binary=is_binary,
+            common_file_args=dict(mode=mode, group=group, owner=owner),
+            backup_file=backup_file
+        )
+    else:
+        pdse_copy_handler = PDSECopyHandler(
+            module, dest_exists, is_binary=is_binary, backup_file=backup_file
+        )
+        existing_members = set()
+        if dest_exists:
+            existing_members = set(
+                member.upper() for member in Datasets.list_members(dest) or []
+            )
+
+    for src_file, result in zip(src_files, results):
+        file_temp_path = os.path.join(temp_path, src_file.get('name'))
+        file_dest = result.get('dest')
+        if is_uss:
+            file_exists = os.path.exists(file_dest)
+        else:
+            file_exists = data_set.extract_member_name(file_dest) in existing_members
+        if file_exists and not force:
+            result.update(changed=False, note="Destination exists. No data was copied.")
+            continue
+
+        if is_uss:
+            dest_checksum = get_file_checksum(file_dest) if file_exists else None
+            uss_copy_handler._copy_to_file(
+                file_dest, file_dest, None, file_temp_path
+            )
+            uss_copy_handler.set_file_attributes(file_dest)
+            src_checksum = get_file_checksum(file_temp_path)
+            result.update(
+                changed=src_checksum != dest_checksum,
+                size=Path(file_dest).stat().st_size
+            )
+            if validate:
+                result['checksum'] = src_checksum
+        else:
+            pdse_copy_handler.copy_to_member(
+                file_temp_path, None, None, file_dest, copy_member=True
+            )
+            result['changed'] = True
+
+    res_args.update(
+        dict(
+            dest=dest,
+            ds_type=dest_ds_type,
+            dest_exists=dest_exists,
+            backup_file=backup_file,
+            changed=any(result.get('changed') for result in results),
+            results=results
+        )
+    )
+    return res_args, temp_path, None
+
+
+def get_dest_signature(module):
+    """Calculate the signature of a USS destination file, so the action
+    plugin can send only the blocks of the source that it does not have.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from currently running module
+
+    Returns:
+        {dict} -- The signature of the destination, None if it is not a file
+    """
+    dest = get_uss_dest_file(module)
+    if not os.path.isfile(dest):
+        return None
+    try:
+        return delta.get_signature(dest)
+    except (OSError, IOError):
+        return None
+
+
+def rebuild_from_delta(module):
+    """Rebuild the source file from the destination file and the delta
+    transferred by the action plugin, in place of the delta.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from currently running module
+    """
+    temp_path = module.params.get('temp_path')
+    dest = get_uss_dest_file(module)
+    fd, rebuilt_path = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        delta.apply_delta(
+            dest, temp_path, rebuilt_path, module.params.get('block_size')
+        )
+        if checksum.get_checksum(rebuilt_path) != module.params.get('src_checksum'):
+            raise delta.DeltaError(
+                "The checksum of the file rebuilt from {0} does not match the source".format(dest)
+            )
+        shutil.move(rebuilt_path, temp_path)
+    except (OSError, IOError, delta.DeltaError) as err:
+        cleanup([temp_path, rebuilt_path])
+        module.fail_json(
+            msg="Unable to rebuild {0} from the transferred delta: {1}".format(
+                module.params.get('src'), str(err)
+            )
+        )
+
+
+def unpack_payload(module):
+    """Unpack the compressed archive transferred by the action plugin, in
+    place of the files it would otherwise have transferred.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from currently running module
+    """
+    temp_path = module.params.get('temp_path')
+    unpack_dir = tempfile.mkdtemp(
+        prefix="ansible-zos-copy-payload-", dir=os.path.dirname(temp_path)
+    )
+    try:
+        paths = compress.unpack(temp_path, unpack_dir)
+    except compress.CompressError as err:
+        cleanup([temp_path, unpack_dir])
+        module.fail_json(msg=err.msg)
+    os.remove(temp_path)
+    # A single file is transferred to the temporary path itself, and
+    # directories or several files into it.
+    if not module.params.get('src_files') and len(paths) == 1 and os.path.isfile(paths[0]):
+        module.params['temp_path'] = paths[0]
+    else:
+        module.params['temp_path'] = unpack_dir
+
+
+def get_uss_dest_file(module):
+    """Get the USS file a local file is copied to.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from currently running module
+
+    Returns:
+        {str} -- The destination file
+    """
+    src = module.params.get('src')
+    dest = module.params.get('dest')
+    name = os.path.basename(src) if src else 'inline_copy'
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, name)
+    return dest
+
+
+def get_dest_checksum(module):
+    """Calculate the checksum of the destination the way the action plugin
+    calculates the checksum of the local source, so the transfer can be
+    skipped when they match. Data set content is read as text, or as binary
+    when 'is_binary' is set, and converted back to the source encoding.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object from currently running module
+
+    Returns:
+        {str} -- The checksum of the destination, None if it does not exist
+        or can not be compared with the source
+    """
+    src = module.params.get('src')
+    dest = module.params.get('dest')
+    is_uss = module.params.get('is_uss')
+    is_binary = module.params.get('is_binary')
+    encoding = module.params.get('encoding')
+    copy_member = module.params.get('copy_member')
+    name = os.path.basename(src) if src else 'inline_copy'
+    temp_files = []
+    try:
+        if is_uss:
+            dest = get_uss_dest_file(module)
+            if not os.path.isfile(dest):
+                return None
+            dest_path = dest
+        else:
+            dest_name = data_set.extract_dsname(dest)
+            dest_du = data_set.DataSetUtils(dest_name)
+            if not dest_du.exists():
+                return None
+            dest_ds_type = dest_du.ds_type()
+            if dest_ds_type in MVS_PARTITIONED:
+                member_name = data_set.extract_member_name(dest) if copy_member else name
+                if not dest_du.member_exists(member_name):
+                    return None
+                dest = "{0}({1})".format(dest_name, member_name)
+            elif dest_ds_type not in MVS_SEQ:
+                return None
+            fd, dest_path = tempfile.mkstemp()
+            os.close(fd)
+            temp_files.append(dest_path)
+            copy.copy_ps2uss(dest, dest_path, is_binary=is_binary)
+
+        if encoding and not is_binary:
+            fd, conv_path = tempfile.mkstemp()
+            os.close(fd)
+            temp_files.append(conv_path)
+            enc_utils = encode.EncodeUtils()
+            if not enc_utils.uss_convert_encoding(
+                dest_path, conv_path, encoding.get("to"), encoding.get("from")
+            ):
+                return None
+            dest_path = conv_path
+        return checksum.get_checksum(
+            dest_path, records=not is_uss and not is_binary
+        )
+    except Exception:
+        return None
+    finally:
+        for temp_file in temp_files:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+
 def main():
     module = AnsibleModule(
         argument_spec=dict(
-            src=dict(type='str'),
+            src=dict(type='raw'),
             dest=dict(required=True, type='str'),
             is_binary=dict(type='bool', default=False),
             encoding=dict(type='dict'),
@@ -1440,6 +1924,7 @@ def main():
             local_follow=dict(type='bool', default=True),
             remote_src=dict(type='bool', default=False),
             sftp_port=dict(type='int', default=22),
+            parallelism=dict(type='int', default=encode.DEFAULT_MAX_WORKERS),
             validate=dict(type='bool'),
             is_uss=dict(type='bool'),
             is_pds=dict(type='bool'),
@@ -1447,7 +1932,18 @@ def main():
             size=dict(type='int'),
             temp_path=dict(type='str'),
             copy_member=dict(type='bool'),
-            src_member=dict(type='bool')
+            src_member=dict(type='bool'),
+            src_files=dict(type='list', elements='dict'),
+            force=dict(type='bool', default=False),
+            skip_unchanged=dict(type='bool', default=False),
+            checksum_only=dict(type='bool', default=False),
+            delta=dict(type='bool', default=False),
+            signature_only=dict(type='bool', default=False),
+            is_delta=dict(type='bool', default=False),
+            block_size=dict(type='int'),
+            src_checksum=dict(type='str'),
+            compress=dict(type='str', choices=list(compress.COMPRESS_FORMATS)),
+            is_compressed=dict(type='bool', default=False)
         ),
         add_file_common_args=True
     )
@@ -1464,7 +1960,10 @@ def main():
         remote_src=dict(arg_type='bool', default=False, required=False),
         checksum=dict(arg_type='str', required=False),
         validate=dict(arg_type='bool', required=False),
-        sftp_port=dict(arg_type='int', required=False, default=22)
+        skip_unchanged=dict(arg_type='bool', required=False, default=False),
+        delta=dict(arg_type='bool', required=False, default=False),
+        sftp_port=dict(arg_type='int', required=False, default=22),
+        parallelism=dict(arg_type='int', required=False, default=encode.DEFAULT_MAX_WORKERS)
     )
 
     if module.params.get("encoding"):
@@ -1476,9 +1975,31 @@ def main():
             from_encoding=dict(arg_type='encoding'),
             to_encoding=dict(arg_type='encoding')
         ))
+    if module.params.get('checksum_only'):
+        module.exit_json(
+            changed=False,
+            dest=module.params.get('dest'),
+            dest_checksum=get_dest_checksum(module)
+        )
+    if module.params.get('signature_only'):
+        module.exit_json(
+            changed=False,
+            dest=module.params.get('dest'),
+            signature=get_dest_signature(module)
+        )
+    if module.params.get('is_compressed'):
+        unpack_payload(module)
+    if module.params.get('is_delta'):
+        rebuild_from_delta(module)
+
     try:
         res_args = temp_path = conv_path = None
-        res_args, temp_path, conv_path = run_module(module, arg_def)
+        if module.params.get('src_files'):
+            res_args, temp_path, conv_path = run_module_for_src_files(module, arg_def)
+        else:
+            res_args, temp_path, conv_path = run_module(module, arg_def)
+        if module._debug:
+            res_args.update(metadata_cache=metadata_cache.get_stats())
         module.exit_json(**res_args)
     finally:
         cleanup([temp_path, conv_path])
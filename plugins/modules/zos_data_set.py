@@ -612,6 +612,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser
     BetterArgParser,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import DataSet
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import metadata_cache
 from ansible.module_utils.basic import AnsibleModule
 
 import re
@@ -1171,6 +1172,8 @@ def run_module():
     else:
         if module.params.get("replace"):
             result["changed"] = True
+    if module._debug:
+        result["metadata_cache"] = metadata_cache.get_stats()
     module.exit_json(**result)
 
 
@@ -97,6 +97,15 @@ options:
     type: bool
     required: false
     default: false
+  parallelism:
+    description:
+      - The maximum number of files or members converted at the same time
+        when I(src) is a USS directory, PDS or PDSE.
+      - When any file fails to convert, the task fails after the remaining
+        files are converted, and every file that failed is reported.
+    type: int
+    required: false
+    default: 5
 notes:
   - It is the playbook author or user's responsibility to avoid files that should
     not be encoded, such as binary files. A user is described as the remote user,
@@ -339,6 +348,7 @@ def run_module():
         backup=dict(type="bool", default=False),
         backup_file=dict(type="str", required=False, default=None),
         backup_compress=dict(type="bool", required=False, default=False),
+        parallelism=dict(type="int", default=encode.DEFAULT_MAX_WORKERS),
     )
 
     module = AnsibleModule(argument_spec=module_args)
@@ -351,6 +361,9 @@ def run_module():
         backup=dict(arg_type="bool", default=False, required=False),
         backup_file=dict(arg_type="data_set_or_path", required=False, default=None),
         backup_compress=dict(arg_type="bool", required=False, default=False),
+        parallelism=dict(
+            arg_type="int", required=False, default=encode.DEFAULT_MAX_WORKERS
+        ),
     )
 
     parser = better_arg_parser.BetterArgParser(arg_defs)
@@ -362,6 +375,7 @@ def run_module():
     backup_compress = parsed_args.get("backup_compress")
     from_encoding = parsed_args.get("from_encoding").upper()
     to_encoding = parsed_args.get("to_encoding").upper()
+    parallelism = parsed_args.get("parallelism")
 
     # is_uss_src(dest) to determine whether the src(dest) is a USS file/path or not
     # is_mvs_src(dest) to determine whether the src(dest) is a MVS data set or not
@@ -378,6 +392,9 @@ def run_module():
 
     try:
 
+        if parallelism <= 0:
+            raise EncodeError("The value of parallelism must be greater than 0.")
+
         eu = encode.EncodeUtils()
 
         # Check input code set is valid or not
@@ -439,7 +456,7 @@ def run_module():
 
         if is_uss_src and is_uss_dest:
             convert_rc = eu.uss_convert_encoding_prev(
-                src, dest, from_encoding, to_encoding
+                src, dest, from_encoding, to_encoding, max_workers=parallelism
             )
         else:
             convert_rc = eu.mvs_convert_encoding(
@@ -449,6 +466,7 @@ def run_module():
                 to_encoding,
                 src_type=ds_type_src,
                 dest_type=ds_type_dest,
+                max_workers=parallelism,
             )
 
         if convert_rc:
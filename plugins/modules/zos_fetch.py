@@ -111,6 +111,23 @@ options:
               (iconv) version; the most common character sets are supported.
         required: true
         type: str
+  compress:
+    description:
+      - Compress the file or data set on the remote z/OS system before it is
+        transferred, and decompress it on the local machine.
+      - Data is converted as specified by I(encoding) before it is
+        compressed.
+      - A PDS or PDSE is packed into a single compressed archive, so all
+        of its members are transferred as one file.
+      - Useful for text data sets and spool output over slow connections,
+        which usually compress to a fraction of their size.
+      - zstd is not available in the Python standard library, so
+        C(zstd-fallback) compresses with gzip.
+    required: false
+    type: str
+    choices:
+      - gzip
+      - zstd-fallback
 notes:
     - When fetching PDSE and VSAM data sets, temporary storage will be used
       on the remote z/OS system. After the PDSE or VSAM data set is
@@ -258,6 +275,7 @@ from ansible.module_utils._text import to_bytes
 from ansible.module_utils.parsing.convert_bool import boolean
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
     better_arg_parser,
+    compress,
     data_set,
     encode
 )
@@ -497,6 +515,30 @@ class FetchHandler:
                 )
         return file_path
 
+    def _compress(self, path, compress_format, remove=True):
+        """ Pack a fetched file or directory into a compressed archive, which
+            is transferred in place of it. The file or directory is removed
+            once it is packed, unless it is the source itself.
+        """
+        fd, archive_path = tempfile.mkstemp(suffix=compress.ARCHIVE_SUFFIX)
+        os.close(fd)
+        try:
+            compress.pack([path], archive_path, compress=compress_format)
+        except (OSError, compress.CompressError) as err:
+            os.remove(archive_path)
+            self._fail_json(
+                msg="Unable to compress {0}".format(path),
+                stderr=str(err),
+                stderr_lines=str(err).splitlines(),
+            )
+        finally:
+            if remove:
+                if os.path.isdir(path):
+                    rmtree(path)
+                else:
+                    os.remove(path)
+        return archive_path
+
 
 def run_module():
     # ********************************************************** #
@@ -512,7 +554,10 @@ def run_module():
             use_qualifier=dict(required=False, default=False, type="bool"),
             validate_checksum=dict(required=False, default=True, type="bool"),
             encoding=dict(required=False, type="dict"),
-            sftp_port=dict(type='int', default=22, required=False)
+            sftp_port=dict(type='int', default=22, required=False),
+            compress=dict(
+                required=False, type="str", choices=list(compress.COMPRESS_FORMATS)
+            ),
         )
     )
 
@@ -638,6 +683,12 @@ def run_module():
         file_path = fetch_handler._fetch_vsam(src, is_binary, encoding)
         res_args["remote_path"] = file_path
 
+    if module.params.get("compress"):
+        remote_path = res_args.get("remote_path")
+        res_args["remote_path"] = fetch_handler._compress(
+            remote_path, module.params.get("compress"), remove=remote_path != src
+        )
+
     res_args["file"] = ds_name
     res_args["ds_type"] = ds_type
     module.exit_json(**res_args)
@@ -30,6 +30,9 @@ description:
     like "*".
   - If there is no ddname, or if ddname="?", output of all the ddnames under
     the given job will be displayed.
+  - The amount of output returned for each ddname can be limited with
+    I(max_lines) and I(max_bytes); the limits are applied on z/OS so output
+    beyond them is never transferred.
 version_added: "2.9"
 author: "Jack Ho (@jacklotusho)"
 options:
@@ -54,6 +57,26 @@ options:
       - Data definition name. (e.g "JESJCL", "?")
     type: str
     required: false
+  max_lines:
+    description:
+      - The maximum number of lines to return for each ddname.
+      - If not set, all lines are returned.
+    type: int
+    required: false
+  max_bytes:
+    description:
+      - The maximum number of bytes of content to return for each ddname.
+      - Only whole lines are returned, line separators are not counted.
+      - If not set, all lines are returned.
+    type: int
+    required: false
+  tail:
+    description:
+      - When I(max_lines) or I(max_bytes) is set, return the last lines of
+        each ddname instead of the first lines.
+    type: bool
+    required: false
+    default: false
 """
 
 EXAMPLES = r"""
@@ -72,6 +95,13 @@ EXAMPLES = r"""
     job_name: "*"
     owner: "IBMUSER"
     ddname: "?"
+
+- name: Last 200 lines of SYSPRINT
+  zos_job_output:
+    job_id: "JOB00134"
+    ddname: "SYSPRINT"
+    max_lines: 200
+    tail: true
 """
 
 RETURN = r"""
@@ -339,6 +369,9 @@ def run_module():
         job_name=dict(type="str", required=False),
         owner=dict(type="str", required=False),
         ddname=dict(type="str", required=False),
+        max_lines=dict(type="int", required=False),
+        max_bytes=dict(type="int", required=False),
+        tail=dict(type="bool", required=False, default=False),
     )
 
     module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
@@ -347,13 +380,24 @@ def run_module():
     job_name = module.params.get("job_name")
     owner = module.params.get("owner")
     ddname = module.params.get("ddname")
+    max_lines = module.params.get("max_lines")
+    max_bytes = module.params.get("max_bytes")
+    tail = module.params.get("tail")
 
     if not job_id and not job_name and not owner:
         module.fail_json(msg="Please provide a job_id or job_name or owner")
 
     try:
         results = {}
-        results["jobs"] = job_output(job_id, owner, job_name, ddname)
+        results["jobs"] = job_output(
+            job_id,
+            owner,
+            job_name,
+            ddname,
+            max_lines=max_lines,
+            max_bytes=max_bytes,
+            tail=tail,
+        )
         results["changed"] = False
     except Exception as e:
         module.fail_json(msg=repr(e))
@@ -26,8 +26,8 @@ description:
 version_added: "2.9"
 options:
   src:
-    required: true
-    type: str
+    required: false
+    type: raw
     description:
       - The source directory or data set containing the JCL to submit.
       - It could be physical sequential data set or a partitioned data set
@@ -35,6 +35,14 @@ options:
       - Or an USS file. (e.g "/u/tester/demo/sample.jcl")
       - Or an LOCAL file in ansible control node.
         (e.g "/User/tester/ansible-playbook/sample.jcl")
+      - The member of a partitioned data set can be a pattern using ``*`` and
+        ``?``, (e.g "USER.JCL(NIGHT*)"), to submit every matching member.
+      - Can also be a list of data sets or USS files, all of which are
+        submitted in a single module run. Lists and member patterns are not
+        supported when I(location=LOCAL).
+      - When more than one job is submitted, the jobs are waited for together
+        and the status of all of them is checked with a single query.
+      - Required unless I(schedule) is provided.
   location:
     required: true
     default: DATA_SET
@@ -63,6 +71,21 @@ options:
       - When wait is true, the module will wait for a maximum of 60 seconds by
         default.
       - User can set the wait time manually in this option.
+  poll_interval_s:
+    required: false
+    default: 0.25
+    type: float
+    description:
+      - When wait is true, the number of seconds to wait before the first
+        check of the job status.
+      - The interval doubles after every check, up to ``max_poll_interval_s``.
+  max_poll_interval_s:
+    required: false
+    default: 10
+    type: float
+    description:
+      - When wait is true, the maximum number of seconds between two checks of
+        the job status.
   max_rc:
     required: false
     type: int
@@ -71,6 +94,55 @@ options:
         allowed without failing the module.
       - The ``max_rc`` is only checked when ``wait=true``, otherwise, it is
         ignored.
+      - With I(schedule), the default maximum return code of every job in the
+        schedule.
+  schedule:
+    required: false
+    type: list
+    elements: dict
+    description:
+      - A set of jobs with dependencies between them to submit and wait for in
+        a single module run, as an alternative to I(src).
+      - A job is submitted once all the jobs listed in its I(after) have
+        finished with a return code not greater than their I(max_rc). Jobs
+        depending on a job that failed, or was skipped, are skipped.
+      - Up to I(parallelism) jobs run at the same time, and the status of
+        all the running jobs is checked with a single query.
+      - I(wait_time_s) is the maximum time for the whole schedule, jobs that
+        are not finished by then are reported as timed out.
+      - I(location) and I(volume) apply to every job. Only C(DATA_SET) and
+        C(USS) are supported.
+    suboptions:
+      name:
+        description:
+          - A unique name for the job in the schedule, used in I(after).
+        required: true
+        type: str
+      src:
+        description:
+          - The data set or USS file containing the JCL of the job.
+        required: true
+        type: str
+      after:
+        description:
+          - The names of the jobs that must finish successfully before this
+            job is submitted.
+        required: false
+        type: list
+        elements: str
+      max_rc:
+        description:
+          - The maximum return code for the job to be considered successful.
+          - Defaults to the module I(max_rc). If neither is set, any job that
+            completes with a return code is successful.
+        required: false
+        type: int
+  parallelism:
+    required: false
+    default: 10
+    type: int
+    description:
+      - With I(schedule), the maximum number of jobs running at the same time.
   return_output:
     required: false
     default: true
@@ -134,10 +206,28 @@ jobs:
          The name of the batch job.
       type: str
       sample: HELLO
+    src:
+      description:
+         The JCL source the job was submitted from, only returned when more
+         than one job is submitted.
+      type: str
+      sample: USER.JCL(NIGHT01)
     duration:
       description: The total lapsed time the JCL ran for.
       type: int
       sample: 0
+    poll_count:
+      description:
+         The number of job status checks made while waiting for the job to
+         finish.
+      type: int
+      sample: 6
+    poll_overhead_s:
+      description:
+         The total number of seconds spent checking the job status while
+         waiting for the job to finish, excluding the time spent sleeping.
+      type: float
+      sample: 1.42
     ddnames:
       description:
          Data definition names.
@@ -438,6 +528,49 @@ jobs:
               "subsystem": "STL1"
           }
      ]
+highest_rc:
+  description:
+     The highest return code of the submitted jobs, only returned when more
+     than one job is submitted. Null when a job did not complete or has no
+     numeric return code.
+  returned: success
+  type: int
+  sample: 4
+schedule:
+  description:
+     The outcome of every job in I(schedule), in the order they were given.
+  returned: when schedule is provided
+  type: list
+  elements: dict
+  contains:
+    name:
+      description: The name of the job in the schedule.
+      type: str
+      sample: LOAD
+    src:
+      description: The JCL source the job was submitted from.
+      type: str
+      sample: USER.JCL(LOAD)
+    job_id:
+      description: The z/OS job ID, null when the job was not submitted.
+      type: str
+      sample: JOB00134
+    status:
+      description:
+         One of C(passed), C(failed), C(skipped), C(submit_failed),
+         C(timeout) or C(not_run).
+      type: str
+      sample: passed
+    ret_code:
+      description: Return code output collected from the job status.
+      type: dict
+  sample:
+     [
+       {"name": "EXTRACT", "src": "USER.JCL(EXTRACT)", "job_id": "JOB00134",
+        "status": "passed", "ret_code": {"msg": "CC 0000", "code": 0}},
+       {"name": "LOAD", "src": "USER.JCL(LOAD)", "job_id": null,
+        "status": "skipped", "ret_code": null}
+     ]
 message:
   description: The output message that the sample module generates.
   returned: success
@@ -482,18 +615,68 @@ EXAMPLES = r"""
     location: DATA_SET
     wait: true
     wait_time_s: 30
+
+- name: Submit every member of a PDS starting with NIGHT and wait for all
+  zos_job_submit:
+    src: TEST.JCL(NIGHT*)
+    location: DATA_SET
+    wait: true
+    wait_time_s: 3600
+    return_output: false
+    max_rc: 4
+
+- name: Submit a list of USS JCL files
+  zos_job_submit:
+    src:
+      - /u/tester/demo/step1.jcl
+      - /u/tester/demo/step2.jcl
+    location: USS
+
+- name: Run extract jobs in parallel, then the load job once both succeed
+  zos_job_submit:
+    location: DATA_SET
+    wait_time_s: 7200
+    parallelism: 4
+    max_rc: 4
+    schedule:
+      - name: EXTRACT1
+        src: TEST.JCL(EXTRACT1)
+      - name: EXTRACT2
+        src: TEST.JCL(EXTRACT2)
+      - name: LOAD
+        src: TEST.JCL(LOAD)
+        after:
+          - EXTRACT1
+          - EXTRACT2
+        max_rc: 0
+
+- name: Submit PDS job and check its status every 5 seconds at most
+  zos_job_submit:
+    src: TEST.UTILs(LONGRUN)
+    location: DATA_SET
+    wait: true
+    wait_time_s: 600
+    poll_interval_s: 1
+    max_poll_interval_s: 5
 """
 
 from ansible.module_utils.basic import AnsibleModule
-from time import sleep
-from os import chmod, path, remove
+from time import sleep, time
+from os import path, remove
 from tempfile import NamedTemporaryFile
+from fnmatch import fnmatchcase
+from collections import OrderedDict
 import re
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import job_output
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
+    job_output,
+    job_status_batch,
+)
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
-from stat import S_IEXEC, S_IREAD, S_IWRITE
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.rexx import (
+    cached_script,
+)
 from ansible.module_utils.six import PY3
 
 if PY3:
@@ -505,10 +688,28 @@ else:
 POLLING_INTERVAL = 1
 POLLING_COUNT = 60
 
+"""initial and maximum time between job status checks while waiting for a job"""
+DEFAULT_POLL_INTERVAL_S = 0.25
+DEFAULT_MAX_POLL_INTERVAL_S = 10
+DEFAULT_PARALLELISM = 10
+
 JOB_COMPLETION_MESSAGES = ["CC", "ABEND", "SEC"]
+JOB_COMPLETION_PATTERN = re.compile(
+    "^(?:{0})".format("|".join(JOB_COMPLETION_MESSAGES))
+)
 DEFAULT_ASCII_CHARSET = "ISO8859-1"
 DEFAULT_EBCDIC_CHARSET = "IBM-1047"
 
+DSN_PATTERN = r"(?:[A-Z$#@]{1}[A-Z0-9$#@-]{0,7}[.]){1,21}[A-Z$#@]{1}[A-Z0-9$#@-]{0,7}"
+DSN_REGEX = r"^(([A-Z]{1}[A-Z0-9]{0,7})([.]{1})){1,21}[A-Z]{1}[A-Z0-9]{0,7}([(]([A-Z]{1}[A-Z0-9]{0,7})[)]){0,1}?$"
+DATA_SET_SRC_REGEX = re.compile(
+    r"^{0}(?:\([A-Z$#@]{{1}}[A-Z0-9$#@]{{0,7}}\))?$".format(DSN_PATTERN), re.IGNORECASE
+)
+MEMBER_PATTERN_REGEX = re.compile(
+    r"^({0})\(([A-Z$#@*?]{{1}}[A-Z0-9$#@*?]{{0,7}})\)$".format(DSN_PATTERN),
+    re.IGNORECASE,
+)
+
 
 def submit_pds_jcl(src, module):
     """ A wrapper around zoautil_py Jobs submit to raise exceptions on failure. """
@@ -563,14 +764,12 @@ SAY X
 
 
 def copy_rexx_and_run(script, src, vol, module):
-    delete_on_close = True
-    tmp_file = NamedTemporaryFile(delete=delete_on_close)
-    with open(tmp_file.name, "w") as f:
-        f.write(script)
-    chmod(tmp_file.name, S_IEXEC | S_IREAD | S_IWRITE)
-    pathName = path.dirname(tmp_file.name)
-    scriptName = path.basename(tmp_file.name)
-    rc, stdout, stderr = module.run_command(["./" + scriptName, src, vol], cwd=pathName)
+    with cached_script(script) as script_path:
+        pathName = path.dirname(script_path)
+        scriptName = path.basename(script_path)
+        rc, stdout, stderr = module.run_command(
+            ["./" + scriptName, src, vol], cwd=pathName
+        )
     return rc, stdout, stderr
 
 
@@ -611,6 +810,230 @@ def query_jobs_status(module, jobId):
     return output
 
 
+def wait_for_jobs(job_ids, wait_time_s, poll_interval_s, max_poll_interval_s):
+    """Wait for jobs to finish by polling their status with exponential backoff.
+    Only the job status is queried, the job output is not retrieved. All jobs
+    that have not finished yet are checked with a single status query.
+
+    Arguments:
+        job_ids {list[str]} -- The IDs of the jobs to wait for.
+        wait_time_s {int} -- The maximum number of seconds to wait.
+        poll_interval_s {float} -- The number of seconds before the first status check.
+        max_poll_interval_s {float} -- The maximum number of seconds between status checks.
+
+    Raises:
+        SubmitJCLError: When the job status cannot be retrieved.
+
+    Returns:
+        dict -- Whether all jobs completed, the last known status of each job
+        keyed by job ID, the elapsed seconds, the number of status checks
+        and the seconds spent in status checks.
+    """
+    start = time()
+    deadline = start + wait_time_s
+    interval = poll_interval_s
+    pending = set(job_ids)
+    statuses = {}
+    poll_count = 0
+    poll_overhead = 0.0
+    while pending:
+        remaining = deadline - time()
+        if remaining <= 0:
+            break
+        sleep(min(interval, remaining))
+        interval = min(interval * 2, max_poll_interval_s)
+        poll_start = time()
+        try:
+            jobs = job_status_batch(sorted(pending))
+        except Exception as e:
+            raise SubmitJCLError(repr(e))
+        poll_overhead += time() - poll_start
+        poll_count += 1
+        for job in jobs:
+            statuses[job.get("job_id")] = job
+            if JOB_COMPLETION_PATTERN.search(job.get("ret_code").get("msg")):
+                pending.discard(job.get("job_id"))
+    return dict(
+        completed=not pending,
+        jobs=statuses,
+        duration=time() - start,
+        poll_count=poll_count,
+        poll_overhead_s=poll_overhead,
+    )
+
+
+def is_member_pattern(src):
+    """Determine whether a JCL source is a data set member name pattern"""
+    match = MEMBER_PATTERN_REGEX.fullmatch(src)
+    return bool(match) and ("*" in match.group(2) or "?" in match.group(2))
+
+
+def list_matching_members(src, module):
+    """List the members of a partitioned data set matching a member name pattern.
+
+    Arguments:
+        src {str} -- The data set and member pattern. (e.g "USER.JCL(NIGHT*)")
+        module {AnsibleModule} -- The AnsibleModule object used to run commands.
+
+    Raises:
+        SubmitJCLError: When the members of the data set cannot be listed.
+
+    Returns:
+        list[str] -- The sorted data set member names matching the pattern.
+    """
+    match = MEMBER_PATTERN_REGEX.fullmatch(src)
+    data_set = match.group(1).upper()
+    pattern = match.group(2).upper()
+    rc, stdout, stderr = module.run_command(["mls", data_set])
+    # mls returns 2 when the data set has no members
+    if rc not in (0, 2):
+        raise SubmitJCLError("LIST MEMBERS FAILED: " + stderr)
+    members = []
+    for line in stdout.splitlines():
+        member = line.strip()
+        if "(" in member:
+            member = member[member.find("(") + 1 : member.find(")")]
+        if member and fnmatchcase(member.upper(), pattern):
+            members.append("{0}({1})".format(data_set, member.upper()))
+    return sorted(members)
+
+
+def submit_jcl(src, location, volume, module):
+    """Submit a single JCL source from a data set or a USS file.
+
+    Arguments:
+        src {str} -- The data set or USS file containing the JCL.
+        location {str} -- The JCL location, DATA_SET or USS.
+        volume {str} -- The volume of an uncataloged data set, or None.
+        module {AnsibleModule} -- The AnsibleModule object used to run commands.
+
+    Raises:
+        SubmitJCLError: When the job cannot be submitted.
+
+    Returns:
+        str -- The job ID of the submitted job.
+    """
+    if location == "DATA_SET":
+        if not re.fullmatch(DSN_REGEX, src, re.IGNORECASE):
+            raise SubmitJCLError(
+                "The parameter src for data set is not a valid name pattern: " + src
+            )
+        if volume:
+            return submit_jcl_in_volume(src, volume, module)
+        return submit_pds_jcl(src, module)
+    return submit_uss_jcl(src, module)
+
+
+def submit_jcl_batch(module, srcs, params):
+    """Submit many JCL sources in one module run and optionally wait for all of them.
+    Member patterns are expanded before submission. A source that fails to
+    submit does not stop the remaining sources from being submitted.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object used to run commands.
+        srcs {list[str]} -- The data sets, member patterns or USS files to submit.
+        params {dict} -- The parsed module arguments.
+
+    Returns:
+        dict -- The module result, with one entry in jobs per submitted source.
+    """
+    result = dict(changed=False, jobs=[])
+    location = params.get("location")
+    volume = params.get("volume")
+    jobs = []
+    failures = []
+    try:
+        for src in srcs:
+            if location == "DATA_SET" and is_member_pattern(src):
+                jobs.extend(
+                    dict(src=member) for member in list_matching_members(src, module)
+                )
+            else:
+                jobs.append(dict(src=src))
+    except SubmitJCLError as e:
+        module.fail_json(msg=repr(e), **result)
+    if not jobs:
+        module.fail_json(msg="No JCL matched the parameter src.", **result)
+
+    for job in jobs:
+        try:
+            job["job_id"] = submit_jcl(job.get("src"), location, volume, module)
+            result["changed"] = True
+        except SubmitJCLError as e:
+            job["job_id"] = None
+            job["msg"] = repr(e)
+            failures.append(job.get("src"))
+    job_ids = [job.get("job_id") for job in jobs if job.get("job_id")]
+
+    wait_stats = dict(
+        completed=True, jobs={}, duration=0, poll_count=0, poll_overhead_s=0.0
+    )
+    try:
+        if params.get("wait") is True and job_ids:
+            wait_stats = wait_for_jobs(
+                job_ids,
+                params.get("wait_time_s"),
+                params.get("poll_interval_s"),
+                params.get("max_poll_interval_s"),
+            )
+        statuses = wait_stats.get("jobs")
+        if job_ids and len(statuses) < len(job_ids):
+            for status in job_status_batch(job_ids):
+                statuses[status.get("job_id")] = status
+    except Exception as e:
+        result["jobs"] = jobs
+        module.fail_json(msg=repr(e), **result)
+
+    highest_rc = None
+    for job in jobs:
+        status = statuses.get(job.get("job_id"), {})
+        job["job_name"] = status.get("job_name")
+        job["ret_code"] = status.get("ret_code")
+        code = (job.get("ret_code") or {}).get("code")
+        if code is not None and (highest_rc is None or code > highest_rc):
+            highest_rc = code
+        job["ddnames"] = []
+        if params.get("return_output") and job.get("job_id"):
+            try:
+                output = job_output(job_id=job.get("job_id"))
+                if output:
+                    job["ddnames"] = output[0].get("ddnames")
+            except Exception as e:
+                job["msg"] = repr(e)
+
+    result["jobs"] = jobs
+    result["highest_rc"] = highest_rc
+    result["duration"] = int(wait_stats.get("duration"))
+    result["poll_count"] = wait_stats.get("poll_count")
+    result["poll_overhead_s"] = round(wait_stats.get("poll_overhead_s"), 3)
+    if failures:
+        module.fail_json(
+            msg="Failed to submit JCL: {0}".format(", ".join(failures)), **result
+        )
+    max_rc = params.get("max_rc")
+    if params.get("wait") is True and max_rc is not None:
+        for job in jobs:
+            try:
+                assert_valid_return_code(
+                    max_rc, (job.get("ret_code") or {}).get("code")
+                )
+            except SubmitJCLError:
+                module.fail_json(
+                    msg="Job {0} submitted from {1} exceeded max_rc {2}.".format(
+                        job.get("job_id"), job.get("src"), max_rc
+                    ),
+                    **result
+                )
+    if not wait_stats.get("completed"):
+        result["message"] = {
+            "stdout": "Submit JCL operation succeeded but not all jobs finished. "
+            "Timeout is " + str(params.get("wait_time_s")) + " seconds."
+        }
+    else:
+        result["message"] = {"stdout": "Submit JCL operation succeeded."}
+    return result
+
+
 def assert_valid_return_code(max_rc, found_rc):
     if found_rc is None or max_rc < int(found_rc):
         raise SubmitJCLError("")
@@ -618,7 +1041,19 @@ def assert_valid_return_code(max_rc, found_rc):
 
 def run_module():
     module_args = dict(
-        src=dict(type="str", required=True),
+        src=dict(type="raw", required=False),
+        schedule=dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                name=dict(type="str", required=True),
+                src=dict(type="str", required=True),
+                after=dict(type="list", elements="str", required=False),
+                max_rc=dict(type="int", required=False),
+            ),
+        ),
+        parallelism=dict(type="int", default=DEFAULT_PARALLELISM),
         wait=dict(type="bool", required=False),
         location=dict(
             type="str", default="DATA_SET", choices=["DATA_SET", "USS", "LOCAL"],
@@ -627,11 +1062,18 @@ def run_module():
         volume=dict(type="str", required=False),
         return_output=dict(type="bool", required=False, default=True),
         wait_time_s=dict(type="int", default=60),
+        poll_interval_s=dict(type="float", default=DEFAULT_POLL_INTERVAL_S),
+        max_poll_interval_s=dict(type="float", default=DEFAULT_MAX_POLL_INTERVAL_S),
         max_rc=dict(type="int", required=False),
         temp_file=dict(type="path", required=False),
     )
 
-    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=module_args,
+        mutually_exclusive=[["src", "schedule"]],
+        required_one_of=[["src", "schedule"]],
+        supports_check_mode=True,
+    )
     encoding = module.params.get("encoding")
     if encoding is None:
         encoding = {"from": DEFAULT_ASCII_CHARSET, "to": DEFAULT_EBCDIC_CHARSET}
@@ -641,7 +1083,19 @@ def run_module():
         encoding["to"] = DEFAULT_EBCDIC_CHARSET
 
     arg_defs = dict(
-        src=dict(arg_type="data_set_or_path", required=True),
+        src=dict(arg_type=jcl_sources, required=False),
+        schedule=dict(
+            arg_type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                name=dict(arg_type="str", required=True),
+                src=dict(arg_type="data_set_or_path", required=True),
+                after=dict(arg_type="list", elements="str", required=False),
+                max_rc=dict(arg_type="int", required=False),
+            ),
+        ),
+        parallelism=dict(arg_type="int", default=DEFAULT_PARALLELISM),
         wait=dict(arg_type="bool", required=False),
         location=dict(
             arg_type="str", default="DATA_SET", choices=["DATA_SET", "USS", "LOCAL"],
@@ -668,10 +1122,15 @@ def run_module():
     location = parsed_args.get("location")
     volume = parsed_args.get("volume")
     wait = parsed_args.get("wait")
-    src = parsed_args.get("src")
+    srcs = parsed_args.get("src") or []
+    src = srcs[0] if srcs else None
+    schedule = parsed_args.get("schedule")
     return_output = parsed_args.get("return_output")
     wait_time_s = parsed_args.get("wait_time_s")
     max_rc = parsed_args.get("max_rc")
+    # BetterArgParser has no float type, these are validated by AnsibleModule
+    poll_interval_s = module.params.get("poll_interval_s")
+    max_poll_interval_s = module.params.get("max_poll_interval_s")
     # get temporary file names for copied files
     temp_file = parsed_args.get("temp_file")
     if temp_file:
@@ -683,7 +1142,54 @@ def run_module():
             **result
         )
 
-    DSN_REGEX = r"^(([A-Z]{1}[A-Z0-9]{0,7})([.]{1})){1,21}[A-Z]{1}[A-Z0-9]{0,7}([(]([A-Z]{1}[A-Z0-9]{0,7})[)]){0,1}?$"
+    if poll_interval_s <= 0 or max_poll_interval_s < poll_interval_s:
+        module.fail_json(
+            msg="The options poll_interval_s and max_poll_interval_s are not valid. "
+            "They must be greater than 0 and poll_interval_s must not be greater than "
+            "max_poll_interval_s.",
+            **result
+        )
+
+    if schedule:
+        if location == "LOCAL":
+            module.fail_json(msg="A schedule is not supported for LOCAL.", **result)
+        if parsed_args.get("parallelism") <= 0:
+            module.fail_json(
+                msg="The option parallelism is not valid it must be greater than 0.",
+                **result
+            )
+        parsed_args.update(
+            poll_interval_s=poll_interval_s, max_poll_interval_s=max_poll_interval_s
+        )
+        try:
+            result = run_job_schedule(module, schedule, parsed_args)
+        except (ValueError, SubmitJCLError) as e:
+            module.fail_json(msg=repr(e), **result)
+        failed = [
+            job.get("name")
+            for job in result.get("schedule")
+            if job.get("status") != "passed"
+        ]
+        if failed:
+            module.fail_json(
+                msg="Jobs in the schedule did not succeed: {0}".format(
+                    ", ".join(failed)
+                ),
+                **result
+            )
+        result["message"] = {"stdout": "Submit JCL schedule succeeded."}
+        module.exit_json(**result)
+
+    if len(srcs) > 1 or is_member_pattern(src):
+        if location == "LOCAL":
+            module.fail_json(
+                msg="A list of src or a member pattern is not supported for LOCAL.",
+                **result
+            )
+        parsed_args.update(
+            poll_interval_s=poll_interval_s, max_poll_interval_s=max_poll_interval_s
+        )
+        module.exit_json(**submit_jcl_batch(module, srcs, parsed_args))
 
     try:
         if location == "DATA_SET":
@@ -733,26 +1239,16 @@ def run_module():
         )
 
     result["job_id"] = jobId
-    duration = 0
+    wait_stats = dict(completed=True, duration=0, poll_count=0, poll_overhead_s=0.0)
     if wait is True:
         # calculate the job elapse time
         try:
-            waitJob = query_jobs_status(module, jobId)
-            job_msg = waitJob[0].get("ret_code").get("msg")
+            wait_stats = wait_for_jobs(
+                [jobId], wait_time_s, poll_interval_s, max_poll_interval_s
+            )
         except SubmitJCLError as e:
             module.fail_json(msg=repr(e), **result)
-        # while (job_msg.startswith("CC") or job_msg.startswith("ABEND")) is False:
-        while not re.search(
-            "^(?:{0})".format("|".join(JOB_COMPLETION_MESSAGES)), job_msg
-        ):
-            sleep(1)
-            duration = duration + 1
-            waitJob = job_output(job_id=jobId)
-            job_msg = waitJob[0].get("ret_code").get("msg")
-            if re.search("^(?:{0})".format("|".join(JOB_COMPLETION_MESSAGES)), job_msg):
-                break
-            if duration == wait_time_s:  # Long running task. timeout return
-                break
+    duration = int(wait_stats.get("duration"))
 
     try:
         result = get_job_info(module, jobId, return_output)
@@ -768,7 +1264,9 @@ def run_module():
         if temp_file:
             remove(temp_file)
     result["duration"] = duration
-    if duration == wait_time_s:
+    result["poll_count"] = wait_stats.get("poll_count")
+    result["poll_overhead_s"] = round(wait_stats.get("poll_overhead_s"), 3)
+    if not wait_stats.get("completed"):
         result["message"] = {
             "stdout": "Submit JCL operation succeeded but it is a long running job. Timeout is "
             + str(wait_time_s)
@@ -780,6 +1278,210 @@ def run_module():
     module.exit_json(**result)
 
 
+def order_job_schedule(schedule):
+    """Validate the dependencies of a job schedule and sort it topologically.
+    Jobs without dependencies between them keep the order they were given in.
+
+    Arguments:
+        schedule {list[dict]} -- The jobs of the schedule, each with a name and a list of names in after.
+
+    Raises:
+        ValueError: When a name is duplicated, a dependency is unknown or the dependencies contain a cycle.
+
+    Returns:
+        list[dict] -- The jobs of the schedule, each after all of its dependencies.
+    """
+    jobs = OrderedDict()
+    for job in schedule:
+        if job.get("name") in jobs:
+            raise ValueError(
+                'Duplicate job name "{0}" in schedule.'.format(job.get("name"))
+            )
+        jobs[job.get("name")] = job
+    for job in jobs.values():
+        for dependency in job.get("after") or []:
+            if dependency not in jobs:
+                raise ValueError(
+                    'Job "{0}" depends on unknown job "{1}".'.format(
+                        job.get("name"), dependency
+                    )
+                )
+    ordered = []
+    visited = set()
+    visiting = set()
+
+    def visit(name):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(
+                'The schedule contains a dependency cycle through job "{0}".'.format(
+                    name
+                )
+            )
+        visiting.add(name)
+        for dependency in jobs.get(name).get("after") or []:
+            visit(dependency)
+        visiting.discard(name)
+        visited.add(name)
+        ordered.append(jobs.get(name))
+
+    for name in jobs:
+        visit(name)
+    return ordered
+
+
+def run_job_schedule(module, schedule, params):
+    """Submit the jobs of a schedule as soon as their dependencies succeed.
+    At most parallelism jobs run at the same time, and the status of all the
+    running jobs is checked with a single query, with exponential backoff
+    between checks that is reset whenever a job is submitted or finishes.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule object used to run commands.
+        schedule {list[dict]} -- The jobs of the schedule.
+        params {dict} -- The parsed module arguments.
+
+    Raises:
+        ValueError: When the schedule dependencies are invalid.
+        SubmitJCLError: When the job status cannot be retrieved.
+
+    Returns:
+        dict -- The module result, with the outcome of each job in schedule.
+    """
+    ordered = order_job_schedule(schedule)
+    location = params.get("location")
+    volume = params.get("volume")
+    parallelism = params.get("parallelism")
+    poll_interval_s = params.get("poll_interval_s")
+    max_poll_interval_s = params.get("max_poll_interval_s")
+    states = OrderedDict()
+    for job in schedule:
+        states[job.get("name")] = dict(
+            name=job.get("name"),
+            src=job.get("src"),
+            job_id=None,
+            status="pending",
+            ret_code=None,
+        )
+    max_rcs = {}
+    for job in ordered:
+        max_rc = job.get("max_rc")
+        max_rcs[job.get("name")] = params.get("max_rc") if max_rc is None else max_rc
+
+    start = time()
+    deadline = start + params.get("wait_time_s")
+    interval = poll_interval_s
+    running = {}
+    poll_count = 0
+    poll_overhead = 0.0
+    while True:
+        progressed = False
+        for job in ordered:
+            state = states.get(job.get("name"))
+            if state.get("status") != "pending":
+                continue
+            dependencies = [states.get(name) for name in job.get("after") or []]
+            if any(
+                dep.get("status") not in ("pending", "running", "passed")
+                for dep in dependencies
+            ):
+                state["status"] = "skipped"
+            elif len(running) < parallelism and all(
+                dep.get("status") == "passed" for dep in dependencies
+            ):
+                try:
+                    job_id = submit_jcl(job.get("src"), location, volume, module)
+                    state["job_id"] = job_id
+                    state["status"] = "running"
+                    running[job_id] = state
+                except SubmitJCLError as e:
+                    state["status"] = "submit_failed"
+                    state["msg"] = repr(e)
+                progressed = True
+        if not running:
+            break
+        remaining = deadline - time()
+        if remaining <= 0:
+            break
+        if progressed:
+            interval = poll_interval_s
+        sleep(min(interval, remaining))
+        interval = min(interval * 2, max_poll_interval_s)
+        poll_start = time()
+        try:
+            statuses = job_status_batch(sorted(running))
+        except Exception as e:
+            raise SubmitJCLError(repr(e))
+        poll_overhead += time() - poll_start
+        poll_count += 1
+        for status in statuses:
+            state = running.get(status.get("job_id"))
+            if state is None:
+                continue
+            state["ret_code"] = status.get("ret_code")
+            if JOB_COMPLETION_PATTERN.search(status.get("ret_code").get("msg")):
+                del running[status.get("job_id")]
+                code = status.get("ret_code").get("code")
+                max_rc = max_rcs.get(state.get("name"))
+                if code is not None and (max_rc is None or code <= max_rc):
+                    state["status"] = "passed"
+                else:
+                    state["status"] = "failed"
+
+    highest_rc = None
+    for state in states.values():
+        if state.get("status") == "running":
+            state["status"] = "timeout"
+        elif state.get("status") == "pending":
+            state["status"] = "not_run"
+        code = (state.get("ret_code") or {}).get("code")
+        if code is not None and (highest_rc is None or code > highest_rc):
+            highest_rc = code
+    return dict(
+        changed=any(state.get("job_id") for state in states.values()),
+        schedule=list(states.values()),
+        highest_rc=highest_rc,
+        duration=int(time() - start),
+        poll_count=poll_count,
+        poll_overhead_s=round(poll_overhead, 3),
+    )
+
+
+def jcl_sources(contents, resolve_dependencies):
+    """Resolver for the src argument, a single JCL source or a list of them.
+    Each source must be a data set, a data set member pattern or an absolute path.
+
+    Arguments:
+        contents {Union[str, list[str]]} -- The contents of the argument.
+        resolve_dependencies {dict} -- Contains all of the dependencies and their contents,
+        which have already been handled,
+        for use during current arguments handling operations.
+
+    Raises:
+        ValueError: When contents is invalid argument type
+    Returns:
+        list[str] -- The JCL sources.
+    """
+    if not isinstance(contents, list):
+        contents = [contents]
+    if not contents:
+        raise ValueError("At least one JCL source must be provided in src.")
+    srcs = []
+    for src in contents:
+        src = str(src)
+        if not (
+            DATA_SET_SRC_REGEX.fullmatch(src)
+            or MEMBER_PATTERN_REGEX.fullmatch(src)
+            or path.isabs(src)
+        ):
+            raise ValueError(
+                'Invalid argument "{0}" for type "data_set" or "path".'.format(src)
+            )
+        srcs.append(src)
+    return srcs
+
+
 class Error(Exception):
     pass
 
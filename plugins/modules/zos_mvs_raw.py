@@ -1504,6 +1504,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import D
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmd
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
     backup as zos_backup,
+    encode,
 )
 
 from ansible.module_utils.basic import AnsibleModule
@@ -2060,7 +2061,7 @@ def encoding(contents, dependencies):
             if contents.lower() not in valid_encodings:
                 raise ValueError(
                     'Provided encoding "{0}" is not valid. Valid encodings are: {1}.'.format(
-                        contents, ", ".join(valid_encodings)
+                        contents, ", ".join(sorted(valid_encodings))
                     )
                 )
         else:
@@ -2068,7 +2069,7 @@ def encoding(contents, dependencies):
             if not re.fullmatch(r"^[A-Z0-9-]{2,}$", str(contents), re.IGNORECASE):
                 raise ValueError(
                     'Provided encoding "{0}" is not valid. Valid encodings are: {1}.'.format(
-                        contents, ", ".join(valid_encodings)
+                        contents, ", ".join(sorted(valid_encodings))
                     )
                 )
         encoding = contents
@@ -2076,23 +2077,14 @@ def encoding(contents, dependencies):
 
 
 def get_valid_encodings():
-    """Retrieve all valid encodings from the system
+    """Retrieve all valid encodings from the system.
+    The output of iconv -l is cached, see encode.list_iconv_code_sets.
 
     Returns:
-        list[str]: list of all valid encodings on the system
+        frozenset[str]: all valid encodings on the system, in lower case
     """
     module = AnsibleModuleHelper(argument_spec={})
-    valid_encodings = []
-    rc, stdout, stderr = module.run_command("iconv -l")
-    if rc or stderr:
-        return valid_encodings
-    if stdout:
-        # ignores first line of output which will be "Character sets:""
-        stdout_lines = [line.lower() for line in stdout.split("\n")[1:]]
-        for line in stdout_lines:
-            encodings_from_line = line.split()
-            valid_encodings += encodings_from_line
-    return valid_encodings
+    return frozenset(code_set.lower() for code_set in encode.get_code_sets(module))
 
 
 def dd_content(contents, dependencies):
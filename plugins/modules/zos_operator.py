@@ -20,13 +20,32 @@ module: zos_operator
 short_description: Execute operator command
 description:
     - Execute an operator command and receive the output.
+    - Several operator commands can be executed in a single module run
+      with I(cmds).
 author: "Ping Xiao (@xiaopingBJ)"
 options:
   cmd:
     description:
       - The command to execute.
+      - Required unless I(cmds) is provided.
     type: str
-    required: true
+    required: false
+  cmds:
+    description:
+      - A list of commands to execute.
+      - Up to I(parallelism) commands are executed at the same time, and the
+        response of each command is returned in I(results), in the order the
+        commands were listed.
+      - Mutually exclusive with I(cmd).
+    type: list
+    elements: str
+    required: false
+  parallelism:
+    description:
+      - With I(cmds), the maximum number of commands executing at the same time.
+    type: int
+    required: false
+    default: 5
   verbose:
     description:
       - Return verbose information.
@@ -61,19 +80,28 @@ EXAMPLES = r"""
   zos_operator:
     cmd: "\\$PJ(*)"
 
+- name: Execute several display commands in a single module run
+  zos_operator:
+    cmds:
+      - 'd a,l'
+      - 'd r,l'
+      - 'd etr'
+    parallelism: 3
+
 """
 
 RETURN = r"""
 rc:
     description:
-       Return code of the operator command
+       Return code of the operator command. With I(cmds), the highest return
+       code of all the commands.
     returned: on success
     type: int
     sample: 0
 content:
     description:
        The response resulting from the execution of the operator command
-    returned: on success
+    returned: on success, when I(cmd) is provided
     type: list
     sample:
         [ "MV2C      2020039  04:29:57.58             ISF031I CONSOLE XIAOPIN ACTIVATED ",
@@ -83,6 +111,37 @@ content:
           "          0100 3277 OFFLINE                                 0                ",
           "          0101 3277 OFFLINE                                 0                "
         ]
+results:
+    description:
+       The result of each command, when I(cmds) is provided.
+    returned: when I(cmds) is provided
+    type: list
+    elements: dict
+    contains:
+      cmd:
+        description: The command that was executed.
+        type: str
+        sample: d a,l
+      rc:
+        description: Return code of the operator command.
+        type: int
+        sample: 0
+      content:
+        description: The response resulting from the execution of the operator command.
+        type: list
+        sample:
+          [ "MV2C      2020039  04:29:57.58            -D A,L  ",
+            "MV2C      2020039  04:29:57.59             IEE114I 04.29.57 2020.039 ACTIVITY 950 " ]
+      elapsed:
+        description: The number of seconds the command took to execute.
+        type: float
+        sample: 0.412
+elapsed:
+    description:
+       The number of seconds all the commands took to execute, when I(cmds) is provided.
+    returned: when I(cmds) is provided
+    type: float
+    sample: 1.207
 changed:
     description:
        Indicates if any changes were made during module operation.
@@ -94,10 +153,15 @@ changed:
 """
 
 
+from time import time
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
     AnsibleModuleHelper,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.concurrency import (
+    map_concurrently,
+)
 from ansible.module_utils.six import PY3
 
 
@@ -110,23 +174,44 @@ if PY3:
 else:
     from pipes import quote
 
+DEFAULT_PARALLELISM = 5
+
 
 def run_module():
     module_args = dict(
-        cmd=dict(type="str", required=True),
+        cmd=dict(type="str", required=False),
+        cmds=dict(type="list", elements="str", required=False),
+        parallelism=dict(type="int", default=DEFAULT_PARALLELISM),
         verbose=dict(type="bool", default=False),
         debug=dict(type="bool", default=False),
     )
 
     result = dict(changed=False)
 
-    module = AnsibleModule(argument_spec=module_args, supports_check_mode=False)
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=False,
+        mutually_exclusive=[["cmd", "cmds"]],
+        required_one_of=[["cmd", "cmds"]],
+    )
 
     try:
         new_params = parse_params(module.params)
-        rc_message = run_operator_command(new_params)
-        result["rc"] = rc_message.get("rc")
-        result["content"] = rc_message.get("message").split("\n")
+        if new_params.get("cmds"):
+            start = time()
+            results = run_operator_commands(new_params)
+            result["results"] = results
+            result["rc"] = max(res.get("rc") for res in results)
+            result["elapsed"] = round(time() - start, 3)
+            for res in results:
+                if res.get("rc") > 0:
+                    raise OperatorCmdError(
+                        res.get("cmd"), res.get("rc"), res.get("content")
+                    )
+        else:
+            rc_message = run_operator_command(new_params)
+            result["rc"] = rc_message.get("rc")
+            result["content"] = rc_message.get("message").split("\n")
     except Error as e:
         module.fail_json(msg=repr(e), **result)
     except Exception as e:
@@ -139,29 +224,85 @@ def run_module():
 
 def parse_params(params):
     arg_defs = dict(
-        cmd=dict(arg_type="str", required=True),
+        cmd=dict(arg_type="str", required=False),
+        cmds=dict(arg_type="list", elements="str", required=False),
+        parallelism=dict(arg_type="int", default=DEFAULT_PARALLELISM),
         verbose=dict(arg_type="bool", required=False),
         debug=dict(arg_type="bool", required=False),
     )
     parser = BetterArgParser(arg_defs)
     new_params = parser.parse_args(params)
+    if not new_params.get("cmd") and not new_params.get("cmds"):
+        raise ValueError("One of the options cmd or cmds is required.")
+    if new_params.get("parallelism") <= 0:
+        raise ValueError(
+            "The option parallelism is not valid it must be greater than 0."
+        )
     return new_params
 
 
 def run_operator_command(params):
     module = AnsibleModuleHelper(argument_spec={})
     command = params.get("cmd")
-    verbose = "-v" if params.get("verbose") else ""
-    debug = "-d" if params.get("debug") else ""
-    rc, stdout, stderr = module.run_command(
-        "opercmd {0} {1} {2}".format(verbose, debug, command),
+    rc, message = _run_opercmd(
+        module, command, params.get("verbose"), params.get("debug")
     )
-    message = stdout + stderr
     if rc > 0:
         raise OperatorCmdError(command, rc, message.split("\n") if message else message)
     return {"rc": rc, "message": message}
 
 
+def run_operator_commands(params):
+    """Execute several operator commands, at most parallelism at the same time.
+    A failing command does not stop the others from executing.
+
+    Arguments:
+        params {dict} -- The parsed module parameters.
+
+    Returns:
+        list[dict] -- The cmd, rc, content and elapsed seconds of each command,
+        in the order of the commands.
+    """
+    module = AnsibleModuleHelper(argument_spec={})
+    commands = params.get("cmds")
+    verbose = params.get("verbose")
+    debug = params.get("debug")
+
+    def run(command):
+        start = time()
+        rc, message = _run_opercmd(module, command, verbose, debug)
+        return dict(
+            cmd=command,
+            rc=rc,
+            content=message.split("\n"),
+            elapsed=round(time() - start, 3),
+        )
+
+    return map_concurrently(run, commands, params.get("parallelism"))
+
+
+def _run_opercmd(module, command, verbose=False, debug=False):
+    """Execute an operator command with opercmd.
+
+    Arguments:
+        module {AnsibleModule} -- The module used to run opercmd.
+        command {str} -- The operator command.
+
+    Keyword Arguments:
+        verbose {bool} -- Return verbose information. (default: {False})
+        debug {bool} -- Return debugging information. (default: {False})
+
+    Returns:
+        tuple(int, str) -- The return code and the response of the command.
+    """
+    rc, stdout, stderr = module.run_command(
+        "opercmd {0} {1} {2}".format(
+            "-v" if verbose else "", "-d" if debug else "", command
+        ),
+    )
+    return rc, stdout + stderr
+
+
 class Error(Exception):
     pass
 
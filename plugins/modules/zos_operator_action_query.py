@@ -167,6 +167,7 @@ actions:
 """
 
 from ansible.module_utils.basic import AnsibleModule
+from collections import OrderedDict
 import re
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
@@ -174,12 +175,27 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     MissingZOAUImport,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.concurrency import (
+    map_concurrently,
+)
 
 try:
     from zoautil_py import OperatorCmd
 except Exception:
     OperatorCmd = MissingZOAUImport()
 
+SYSTEM_NAME_REGEX = re.compile("^(?:[a-zA-Z0-9]{1,8})|(?:[a-zA-Z0-9]{0,7}[*])$")
+MESSAGE_ID_REGEX = re.compile("^(?:[a-zA-Z0-9]{1,})|(?:[a-zA-Z0-9]{0,}[*])$")
+JOB_NAME_REGEX = re.compile("^(?:[a-zA-Z0-9]{1,8})|(?:[a-zA-Z0-9]{0,7}[*])$")
+# one line of the response to 'd r,a,s'
+REQUEST_WITH_SYSTEM_REGEX = re.compile(
+    r"\s*([0-9]{2,})\s([A-Z]{1})\s([A-Z0-9]{1,8})\s+((?:[A-Z0-9]{1,8})?)\s*[&*]?[0-9]+(.*)"
+)
+# one line of the response to 'd r,a,jn'
+REQUEST_WITH_JOB_NAME_REGEX = re.compile(
+    r"\s*([0-9]{2,})\s[A-Z]{1}\s+([A-Z0-9]{1,8})?\s*[&*]?[0-9]+\s([A-Z0-9]+)"
+)
+
 
 def run_module():
     module_args = dict(
@@ -220,25 +236,21 @@ def parse_params(params):
 
 
 def system_type(arg_val, params):
-    regex = "^(?:[a-zA-Z0-9]{1,8})|(?:[a-zA-Z0-9]{0,7}[*])$"
-    validate_parameters_based_on_regex(arg_val, regex)
+    validate_parameters_based_on_regex(arg_val, SYSTEM_NAME_REGEX)
     return arg_val.upper()
 
 
 def message_id_type(arg_val, params):
-    regex = "^(?:[a-zA-Z0-9]{1,})|(?:[a-zA-Z0-9]{0,}[*])$"
-    validate_parameters_based_on_regex(arg_val, regex)
+    validate_parameters_based_on_regex(arg_val, MESSAGE_ID_REGEX)
     return arg_val.upper()
 
 
 def job_name_type(arg_val, params):
-    regex = "^(?:[a-zA-Z0-9]{1,8})|(?:[a-zA-Z0-9]{0,7}[*])$"
-    validate_parameters_based_on_regex(arg_val, regex)
+    validate_parameters_based_on_regex(arg_val, JOB_NAME_REGEX)
     return arg_val.upper()
 
 
-def validate_parameters_based_on_regex(value, regex):
-    pattern = re.compile(regex)
+def validate_parameters_based_on_regex(value, pattern):
     if pattern.fullmatch(value):
         pass
     else:
@@ -247,37 +259,70 @@ def validate_parameters_based_on_regex(value, regex):
 
 
 def find_required_request(params):
-    """Find the request given the options provided."""
-    merged_list = create_merge_list()
+    """Find the request given the options provided.
+    The system and job name are passed to the operator commands when
+    the console can filter on them, the other conditions are applied
+    to the merged list."""
+    merged_list = create_merge_list(params)
     requests = filter_requests(merged_list, params)
     return requests
 
 
-def create_merge_list():
+def create_merge_list(params):
     """Merge the return lists that execute both 'd r,a,s' and 'd r,a,jn'.
     For example, if we have:
     'd r,a,s' response like: "742 R MV28     JOB57578 &742 ARC0055A REPLY 'GO'OR 'CANCEL'"
     'd r,a,jn' response like:"742 R FVFNT29H &742 ARC0055A REPLY 'GO' OR 'CANCEL'"
-    the results will be merged so that a full list of information returned on condition"""
-    operator_cmd_a = "d r,a,s"
-    operator_cmd_b = "d r,a,jn"
-    message_a = execute_command(operator_cmd_a)
-    message_b = execute_command(operator_cmd_b)
+    the results will be merged so that a full list of information returned on condition.
+    Both commands are issued at the same time, scoped by the conditions
+    the console can filter on."""
+    operands = "".join(
+        ",{0}={1}".format(operand, value)
+        for operand, value in command_filters(params).items()
+    )
+    operator_cmd_a = "d r,a,s{0}".format(operands)
+    operator_cmd_b = "d r,a,jn{0}".format(operands)
+    message_a, message_b = map_concurrently(
+        execute_command, [operator_cmd_a, operator_cmd_b], 2
+    )
     list_a = parse_result_a(message_a)
     list_b = parse_result_b(message_b)
     merged_list = merge_list(list_a, list_b)
     return merged_list
 
 
+def command_filters(params):
+    """Get the 'd r' operands that select only the requests matching
+    the conditions provided. The console filters on a specific system
+    name and on a specific or generic job name.
+
+    Arguments:
+        params {dict} -- The parsed module parameters.
+
+    Returns:
+        OrderedDict -- The 'd r' operands and their values.
+    """
+    filters = OrderedDict()
+    system = params.get("system")
+    job_name = params.get("job_name")
+    if system and not system.endswith("*"):
+        filters["SYS"] = system
+    if job_name and job_name != "*":
+        filters["JOBS"] = job_name
+    return filters
+
+
 def filter_requests(merged_list, params):
-    """filter the request given the params provided."""
+    """filter the request given the params provided.
+    Conditions already applied by the operator commands are skipped."""
     system = params.get("system")
     message_id = params.get("message_id")
     job_name = params.get("job_name")
+    filters = command_filters(params)
     newlist = merged_list
-    if system:
+    if system and "SYS" not in filters:
         newlist = handle_conditions(newlist, "system", system)
-    if job_name:
+    if job_name and "JOBS" not in filters:
         newlist = handle_conditions(newlist, "job_name", job_name)
     if message_id:
         newlist = handle_conditions(newlist, "message_id", message_id)
@@ -321,10 +366,7 @@ def parse_result_a(result):
 
     for index, line in enumerate(lines):
         line = line.strip()
-        pattern = re.compile(
-            r"\s*([0-9]{2,})\s([A-Z]{1})\s([A-Z0-9]{1,8})\s+((?:[A-Z0-9]{1,8})?)\s*[&*]?[0-9]+(.*)"
-        )
-        m = pattern.search(line)
+        m = REQUEST_WITH_SYSTEM_REGEX.search(line)
         if index == (len(lines) - 1):
             end_flag = True
         if m or end_flag:
@@ -360,10 +402,7 @@ def parse_result_b(result):
     lines = result.split("\n")
     for index, line in enumerate(lines):
         line = line.strip()
-        pattern_with_job_name = re.compile(
-            r"\s*([0-9]{2,})\s[A-Z]{1}\s+([A-Z0-9]{1,8})?\s*[&*]?[0-9]+\s([A-Z0-9]+)"
-        )
-        m = pattern_with_job_name.search(line)
+        m = REQUEST_WITH_JOB_NAME_REGEX.search(line)
         if m:
             dict_temp = {
                 "number": m.group(1),
@@ -376,13 +415,17 @@ def parse_result_b(result):
 
 
 def merge_list(list_a, list_b):
+    """Join the requests of both lists on the reply number,
+    keeping the order of list_a."""
+    requests_b = {}
+    for dict_b in list_b:
+        requests_b.setdefault(dict_b.get("number"), []).append(dict_b)
     merged_list = []
     for dict_a in list_a:
-        for dict_b in list_b:
-            if dict_a.get("number") == dict_b.get("number"):
-                dict_z = dict_a.copy()
-                dict_z.update(dict_b)
-                merged_list.append(dict_z)
+        for dict_b in requests_b.get(dict_a.get("number"), []):
+            dict_z = dict_a.copy()
+            dict_z.update(dict_b)
+            merged_list.append(dict_z)
     return merged_list
 
 
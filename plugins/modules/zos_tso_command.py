@@ -88,13 +88,13 @@ EXAMPLES = r"""
 """
 
 from ansible.module_utils.basic import AnsibleModule
-from os import chmod
-from tempfile import NamedTemporaryFile
 import json
-from stat import S_IEXEC, S_IREAD, S_IWRITE
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.rexx import (
+    cached_script,
+)
 
 
 def run_tso_command(commands, module):
@@ -143,12 +143,8 @@ drop listcato.
 
 
 def copy_rexx_and_run(script, command, module):
-    delete_on_close = True
-    tmp_file = NamedTemporaryFile(delete=delete_on_close)
-    with open(tmp_file.name, "w") as f:
-        f.write(script)
-    chmod(tmp_file.name, S_IEXEC | S_IREAD | S_IWRITE)
-    rc, stdout, stderr = module.run_command([tmp_file.name, command])
+    with cached_script(script) as script_path:
+        rc, stdout, stderr = module.run_command([script_path, command])
     return rc, stdout, stderr
 
 
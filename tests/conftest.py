@@ -21,6 +21,22 @@ def pytest_addoption(parser):
         default="test_config.yml",
         help="Absolute path to YAML file containing inventory info for functional testing.",
     )
+    parser.addoption(
+        "--perf",
+        action="store_true",
+        default=False,
+        help="Run the performance benchmarks, which are skipped by default.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """ Skip tests marked as performance benchmarks unless --perf is given. """
+    if config.getoption("--perf"):
+        return
+    skip_perf = pytest.mark.skip(reason="performance benchmark, run with --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
 
 
 @pytest.fixture(scope="session")
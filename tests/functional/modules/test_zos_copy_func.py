@@ -257,6 +257,214 @@ def test_copy_local_dir_to_non_existing_pdse(ansible_zos_module):
         hosts.all.zos_data_set(name=dest, state="absent")
 
 
+def test_copy_local_file_pattern_to_non_existing_pdse(ansible_zos_module):
+    hosts = ansible_zos_module
+    source_path = tempfile.mkdtemp()
+    dest = "USER.TEST.PDS.FUNCTEST"
+    try:
+        populate_dir(source_path)
+        copy_result = hosts.all.zos_copy(src=source_path + "/file*", dest=dest)
+        verify_copy = hosts.all.shell(
+            cmd="cat \"//'{0}'\" > /dev/null 2>/dev/null".format(dest + "(FILE5)"),
+            executable=SHELL_EXECUTABLE,
+        )
+        for cp_res in copy_result.contacted.values():
+            assert cp_res.get("msg") is None
+            assert cp_res.get("changed") is True
+            assert [r.get("dest") for r in cp_res.get("results")] == [
+                "{0}(FILE{1})".format(dest, i + 1) for i in range(5)
+            ]
+        for v_cp in verify_copy.contacted.values():
+            assert v_cp.get("rc") == 0
+    finally:
+        shutil.rmtree(source_path)
+        hosts.all.zos_data_set(name=dest, state="absent")
+
+
+def test_copy_local_symlink_list_keeps_names(ansible_zos_module):
+    hosts = ansible_zos_module
+    source_path = tempfile.mkdtemp()
+    dest_path = "/tmp/testdir"
+    try:
+        populate_dir(source_path)
+        os.symlink(source_path + "/file1", source_path + "/app.jcl")
+        copy_result = hosts.all.zos_copy(
+            src=[source_path + "/app.jcl", source_path + "/file2"], dest=dest_path
+        )
+        stat_res = hosts.all.stat(path=dest_path + "/app.jcl")
+        for cp_res in copy_result.contacted.values():
+            assert cp_res.get("msg") is None
+        for result in stat_res.contacted.values():
+            assert result.get("stat").get("exists") is True
+    finally:
+        shutil.rmtree(source_path)
+        hosts.all.file(path=dest_path, state="absent")
+
+
+def test_copy_local_file_with_pattern_characters(ansible_zos_module):
+    hosts = ansible_zos_module
+    source_path = tempfile.mkdtemp()
+    src = source_path + "/rpt[1].txt"
+    dest_path = "/tmp/rpt1.txt"
+    try:
+        with open(src, "w") as infile:
+            infile.write(DUMMY_DATA)
+        copy_result = hosts.all.zos_copy(src=src, dest=dest_path)
+        for cp_res in copy_result.contacted.values():
+            assert cp_res.get("msg") is None
+            assert cp_res.get("results") is None
+            assert cp_res.get("changed") is True
+    finally:
+        shutil.rmtree(source_path)
+        hosts.all.file(path=dest_path, state="absent")
+
+
+def test_copy_local_file_list_invalid_member_name_fails(ansible_zos_module):
+    hosts = ansible_zos_module
+    source_path = tempfile.mkdtemp()
+    dest = "USER.TEST.PDS.FUNCTEST"
+    try:
+        populate_dir(source_path)
+        with open(source_path + "/.profile", "w") as infile:
+            infile.write(DUMMY_DATA)
+        copy_result = hosts.all.zos_copy(
+            src=[source_path + "/file1", source_path + "/.profile"], dest=dest
+        )
+        for cp_res in copy_result.contacted.values():
+            assert cp_res.get("failed") is True
+            assert "member name" in cp_res.get("msg")
+    finally:
+        shutil.rmtree(source_path)
+        hosts.all.zos_data_set(name=dest, state="absent")
+
+
+def test_copy_local_file_list_to_uss_dir_without_force(ansible_zos_module):
+    hosts = ansible_zos_module
+    source_path = tempfile.mkdtemp()
+    dest_path = "/tmp/testdir"
+    try:
+        populate_dir(source_path)
+        hosts.all.file(path=dest_path, state="directory")
+        hosts.all.file(path=dest_path + "/file1", state="touch")
+        copy_result = hosts.all.zos_copy(
+            src=[source_path + "/file1", source_path + "/file2"],
+            dest=dest_path,
+            force=False,
+        )
+        stat_res = hosts.all.stat(path=dest_path + "/file2")
+        for cp_res in copy_result.contacted.values():
+            assert cp_res.get("msg") is None
+            results = cp_res.get("results")
+            assert results[0].get("changed") is False
+            assert results[0].get("note") is not None
+            assert results[1].get("changed") is True
+        for result in stat_res.contacted.values():
+            assert result.get("stat").get("exists") is True
+    finally:
+        shutil.rmtree(source_path)
+        hosts.all.file(path=dest_path, state="absent")
+
+
+def test_copy_local_file_to_existing_pdse_member_skip_unchanged(ansible_zos_module):
+    hosts = ansible_zos_module
+    dest = "USER.TEST.PDS.FUNCTEST"
+    fd, src = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        with open(src, "w") as infile:
+            infile.write(DUMMY_DATA)
+        hosts.all.zos_data_set(name=dest, type="pdse", replace=True)
+        hosts.all.zos_copy(
+            src=src,
+            dest=dest + "(DATA)",
+            encoding={"from": "ISO8859-1", "to": "IBM-1047"},
+        )
+        copy_res = hosts.all.zos_copy(
+            src=src,
+            dest=dest + "(DATA)",
+            encoding={"from": "ISO8859-1", "to": "IBM-1047"},
+            force=True,
+            skip_unchanged=True,
+        )
+        for result in copy_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is False
+            assert result.get("note") is not None
+        with open(src, "a") as infile:
+            infile.write("DUMMY DATA ---- LINE 008 ------\n")
+        copy_res = hosts.all.zos_copy(
+            src=src,
+            dest=dest + "(DATA)",
+            encoding={"from": "ISO8859-1", "to": "IBM-1047"},
+            force=True,
+            skip_unchanged=True,
+        )
+        for result in copy_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("note") is None
+    finally:
+        os.remove(src)
+        hosts.all.zos_data_set(name=dest, state="absent")
+
+
+def test_copy_local_file_to_existing_uss_file_delta(ansible_zos_module):
+    hosts = ansible_zos_module
+    dest_path = "/tmp/delta_file"
+    fd, src = tempfile.mkstemp()
+    os.close(fd)
+    try:
+        with open(src, "wb") as infile:
+            infile.write(os.urandom(1048576))
+        hosts.all.zos_copy(src=src, dest=dest_path, is_binary=True)
+        with open(src, "r+b") as infile:
+            infile.seek(524288)
+            infile.write(b"changed block")
+        copy_res = hosts.all.zos_copy(
+            src=src,
+            dest=dest_path,
+            is_binary=True,
+            force=True,
+            delta=True,
+            validate=True,
+        )
+        for result in copy_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+            assert result.get("size") == 1048576
+    finally:
+        os.remove(src)
+        hosts.all.file(path=dest_path, state="absent")
+
+
+def test_copy_local_dir_to_pdse_compressed(ansible_zos_module):
+    hosts = ansible_zos_module
+    dest = "USER.TEST.PDSE.FUNCTEST"
+    source_path = tempfile.mkdtemp()
+    try:
+        for name in ["file1", "file2"]:
+            with open(os.path.join(source_path, name), "w") as infile:
+                infile.write(DUMMY_DATA)
+        copy_res = hosts.all.zos_copy(
+            src=source_path,
+            dest=dest,
+            encoding={"from": "ISO8859-1", "to": "IBM-1047"},
+            compress="gzip",
+        )
+        verify_copy = hosts.all.shell(
+            cmd="cat \"//'{0}(FILE2)'\"".format(dest),
+            executable=SHELL_EXECUTABLE,
+        )
+        for result in copy_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+        for result in verify_copy.contacted.values():
+            assert result.get("rc") == 0
+            assert result.get("stdout").strip() == DUMMY_DATA.strip()
+    finally:
+        shutil.rmtree(source_path)
+        hosts.all.zos_data_set(name=dest, state="absent")
+
+
 def test_copy_local_file_to_uss_binary(ansible_zos_module):
     hosts = ansible_zos_module
     dest_path = "/tmp/profile"
@@ -306,6 +306,29 @@ def test_uss_encoding_conversion_mvs_pds_member_to_uss_file(ansible_zos_module):
         assert result.get("changed") is True
 
 
+def test_uss_encoding_conversion_uss_path_to_uss_path_in_parallel(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=USS_PATH, state="directory")
+    for i in range(10):
+        hosts.all.copy(content=TEST_DATA, dest=USS_PATH + "/encode{0}".format(i))
+    hosts.all.file(path=USS_DEST_PATH, state="directory")
+    results = hosts.all.zos_encode(
+        src=USS_PATH,
+        dest=USS_DEST_PATH,
+        from_encoding=TO_ENCODING,
+        to_encoding=FROM_ENCODING,
+        parallelism=3,
+    )
+    pprint(vars(results))
+    for result in results.contacted.values():
+        assert result.get("changed") is True
+    results = hosts.all.shell(cmd="ls {0} | wc -l".format(USS_DEST_PATH))
+    hosts.all.file(path=USS_PATH, state="absent")
+    hosts.all.file(path=USS_DEST_PATH, state="absent")
+    for result in results.contacted.values():
+        assert result.get("stdout").strip() == "10"
+
+
 def test_uss_encoding_conversion_uss_path_to_mvs_pds(ansible_zos_module):
     hosts = ansible_zos_module
     hosts.all.file(path=USS_PATH, state="directory")
@@ -121,6 +121,43 @@ def test_fetch_partitioned_data_set(ansible_zos_module):
             shutil.rmtree(dest_path)
 
 
+def test_fetch_partitioned_data_set_compressed(ansible_zos_module):
+    hosts = ansible_zos_module
+    params = dict(src="IMSTESTL.COMN91", dest="/tmp/", flat=True, compress="gzip")
+    dest_path = "/tmp/IMSTESTL.COMN91"
+    try:
+        results = hosts.all.zos_fetch(**params)
+        for result in results.contacted.values():
+            assert result.get("changed") is True
+            assert result.get("data_set_type") == "Partitioned"
+            assert result.get("module_stderr") is None
+            assert os.path.isdir(dest_path)
+            assert len(os.listdir(dest_path)) > 0
+    finally:
+        if os.path.exists(dest_path):
+            shutil.rmtree(dest_path)
+
+
+def test_fetch_uss_file_compressed(ansible_zos_module):
+    hosts = ansible_zos_module
+    params = dict(
+        src="/etc/profile", dest="/tmp/", flat=True, compress="zstd-fallback"
+    )
+    dest_path = "/tmp/profile"
+    try:
+        results = hosts.all.zos_fetch(**params)
+        stat_res = hosts.all.stat(path="/etc/profile")
+        for result in results.contacted.values():
+            assert result.get("changed") is True
+            assert result.get("module_stderr") is None
+            assert os.path.isfile(dest_path)
+        for result in stat_res.contacted.values():
+            assert result.get("stat").get("exists") is True
+    finally:
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+
+
 def test_fetch_vsam_data_set(ansible_zos_module):
     hosts = ansible_zos_module
     params = dict(src="IMSTESTL.LDS01.WADS0", dest="/tmp/", flat=True)
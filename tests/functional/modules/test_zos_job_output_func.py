@@ -76,3 +76,23 @@ def test_zos_job_output_job_exists(ansible_zos_module):
     for result in results.contacted.values():
         assert result.get("changed") is False
         assert result.get("jobs") is not None
+
+
+def test_zos_job_output_max_lines_tail(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=TEMP_PATH, state="directory")
+    hosts.all.shell(
+        cmd="echo {0} > {1}/SAMPLE".format(quote(JCL_FILE_CONTENTS), TEMP_PATH)
+    )
+    hosts.all.zos_job_submit(
+        src="{0}/SAMPLE".format(TEMP_PATH), location="USS", wait=True, volume=None
+    )
+    hosts.all.file(path=TEMP_PATH, state="absent")
+    results = hosts.all.zos_job_output(
+        job_name="SAMPLE", ddname="JESMSGLG", max_lines=2, tail=True
+    )
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+        for job in result.get("jobs"):
+            for dd in job.get("ddnames"):
+                assert len(dd.get("content")) <= 2
@@ -107,3 +107,44 @@ def test_job_submit_LOCAL(ansible_zos_module):
 #     for result in results.contacted.values():
 #         assert result.get('jobs')[0].get('ret_code').get('code')== '0000'
 #         assert result.get('changed') is True
+
+
+def test_job_submit_USS_wait_backoff(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=TEMP_PATH, state="directory")
+    hosts.all.shell(
+        cmd="echo {0} > {1}/SAMPLE".format(quote(JCL_FILE_CONTENTS), TEMP_PATH)
+    )
+    results = hosts.all.zos_job_submit(
+        src="{0}/SAMPLE".format(TEMP_PATH),
+        location="USS",
+        wait=True,
+        poll_interval_s=0.5,
+        max_poll_interval_s=2,
+    )
+    hosts.all.file(path=TEMP_PATH, state="absent")
+    for result in results.contacted.values():
+        assert result.get("jobs")[0].get("ret_code").get("code") == 0
+        assert result.get("poll_count") >= 1
+        assert result.get("poll_overhead_s") >= 0
+        assert result.get("changed") is True
+
+
+def test_job_submit_USS_list(ansible_zos_module):
+    hosts = ansible_zos_module
+    hosts.all.file(path=TEMP_PATH, state="directory")
+    for name in ("SAMPLE1", "SAMPLE2"):
+        hosts.all.shell(
+            cmd="echo {0} > {1}/{2}".format(quote(JCL_FILE_CONTENTS), TEMP_PATH, name)
+        )
+    results = hosts.all.zos_job_submit(
+        src=["{0}/SAMPLE1".format(TEMP_PATH), "{0}/SAMPLE2".format(TEMP_PATH)],
+        location="USS",
+        wait=True,
+        max_rc=0,
+    )
+    hosts.all.file(path=TEMP_PATH, state="absent")
+    for result in results.contacted.values():
+        assert len(result.get("jobs")) == 2
+        assert result.get("highest_rc") == 0
+        assert result.get("changed") is True
@@ -80,3 +80,26 @@ def test_zos_operator_positive_with_debug_verbose(ansible_zos_module):
         assert result['rc'] == 0
         assert result.get("changed") is True
         assert result.get("content") is not None
+
+
+def test_zos_operator_cmds(ansible_zos_module):
+    hosts = ansible_zos_module
+    commands = ['d a,l', 'd r,l', 'd etr']
+    results = hosts.all.zos_operator(cmds=commands, parallelism=2)
+    for result in results.contacted.values():
+        assert result['rc'] == 0
+        assert result.get("changed") is True
+        assert [res.get("cmd") for res in result.get("results")] == commands
+        for res in result.get("results"):
+            assert res.get("rc") == 0
+            assert res.get("content") is not None
+            assert res.get("elapsed") >= 0
+
+
+def test_zos_operator_cmds_invalid_command(ansible_zos_module):
+    hosts = ansible_zos_module
+    results = hosts.all.zos_operator(cmds=['d a,l', 'invalid,command'])
+    for result in results.contacted.values():
+        assert result.get("changed") is False
+        assert result.get("results")[0].get("rc") == 0
+        assert result.get("results")[1].get("rc") > 0
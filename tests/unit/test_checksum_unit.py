@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from hashlib import sha256
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.checksum"
+ZOS_COPY_IMPORT_NAME = "ibm_zos_core.plugins.modules.zos_copy"
+
+
+# * Tests for module_utils checksum
+
+
+def test_checksum_of_file(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    checksum = importer(IMPORT_NAME)
+    data = b"LINE 1  \n" * 20000
+    path = tmp_path / "file"
+    path.write_bytes(data)
+    assert checksum.get_checksum(str(path)) == sha256(data).hexdigest()
+
+
+def test_checksum_of_records(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    checksum = importer(IMPORT_NAME)
+    local = tmp_path / "local"
+    local.write_bytes(b"\nLINE 1\r\n\nLINE 2\n")
+    records = tmp_path / "records"
+    records.write_bytes(b"   \x15LINE 1      \x15\x15LINE 2     \x15     \x15")
+    different = tmp_path / "different"
+    different.write_bytes(b"\nLINE 1\nLINE 2\n")
+    assert checksum.get_checksum(str(local), records=True) == checksum.get_checksum(
+        str(records), records=True
+    )
+    assert checksum.get_checksum(str(local), records=True) != checksum.get_checksum(
+        str(different), records=True
+    )
+    assert checksum.get_checksum(str(local)) != checksum.get_checksum(str(records))
+
+
+def test_zos_copy_dest_checksum_in_source_encoding(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    checksum = importer(IMPORT_NAME)
+    zos_copy = importer(ZOS_COPY_IMPORT_NAME)
+    encode = zos_copy.encode
+    mocker.patch.object(encode, "AnsibleModuleHelper")
+    mocker.patch.object(encode, "list_iconv_code_sets", return_value=(0, "", ""))
+    local = tmp_path / "local.txt"
+    local.write_bytes(b"HELLO WORLD\n")
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    module = mocker.MagicMock()
+    module.params = dict(
+        src=str(local),
+        dest=str(dest),
+        is_uss=True,
+        is_binary=False,
+        encoding={"from": "ISO8859-1", "to": "IBM-1047"},
+        copy_member=False,
+    )
+    assert zos_copy.get_dest_checksum(module) is None
+
+    (dest / "local.txt").write_bytes(
+        encode.convert_bytes(b"HELLO WORLD\n", "ISO8859-1", "IBM-1047")
+    )
+    assert zos_copy.get_dest_checksum(module) == checksum.get_checksum(str(local))
+    (dest / "local.txt").write_bytes(b"HELLO WORLD\n")
+    assert zos_copy.get_dest_checksum(module) != checksum.get_checksum(str(local))
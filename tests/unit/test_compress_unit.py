@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import io
+import os
+import tarfile
+
+import pytest
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.compress"
+
+TEXT = b"//JOBNAME JOB (ACCT),'COMPRESS',CLASS=A,MSGCLASS=X\n" * 2000
+
+
+# * Tests for module_utils compress
+
+
+@pytest.mark.parametrize("compress_format", ["gzip", "zstd-fallback"])
+def test_compress_file(zos_import_mocker, tmp_path, compress_format):
+    mocker, importer = zos_import_mocker
+    compress = importer(IMPORT_NAME)
+    src = tmp_path / "local" / "member.jcl"
+    src.parent.mkdir()
+    src.write_bytes(TEXT)
+    archive = tmp_path / ("payload" + compress.ARCHIVE_SUFFIX)
+    compress.pack([str(src)], str(archive), compress=compress_format)
+    assert archive.stat().st_size * 10 < len(TEXT)
+
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    paths = compress.unpack(str(archive), str(remote))
+    assert paths == [str(remote / "member.jcl")]
+    assert (remote / "member.jcl").read_bytes() == TEXT
+
+
+def test_compress_directory_and_files(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    compress = importer(IMPORT_NAME)
+    src = tmp_path / "local" / "proclib"
+    src.mkdir(parents=True)
+    for name in ["a.jcl", "b.jcl"]:
+        (src / name).write_bytes(TEXT)
+    other = tmp_path / "local" / "store"
+    other.write_bytes(b"")
+    link = tmp_path / "local" / "c.jcl"
+    link.symlink_to(other)
+    archive = tmp_path / "payload.tar.gz"
+    compress.pack([str(src) + "/", str(link)], str(archive))
+
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    paths = compress.unpack(str(archive), str(remote))
+    assert paths == [str(remote / "proclib"), str(remote / "c.jcl")]
+    assert sorted(os.listdir(str(remote / "proclib"))) == ["a.jcl", "b.jcl"]
+    assert (remote / "proclib" / "b.jcl").read_bytes() == TEXT
+    assert (remote / "c.jcl").read_bytes() == b""
+
+
+def test_compress_rejects_invalid_archives(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    compress = importer(IMPORT_NAME)
+    with pytest.raises(compress.CompressError):
+        compress.pack([str(tmp_path)], str(tmp_path / "payload.tar.zst"), "zstd")
+
+    archive = tmp_path / "payload.tar.gz"
+    with tarfile.open(str(archive), "w:gz") as tar:
+        info = tarfile.TarInfo("../outside")
+        info.size = 4
+        tar.addfile(info, io.BytesIO(b"data"))
+    remote = tmp_path / "remote"
+    remote.mkdir()
+    with pytest.raises(compress.CompressError):
+        compress.unpack(str(archive), str(remote))
+    assert not (tmp_path / "outside").exists()
+
+    archive.write_bytes(b"not an archive")
+    with pytest.raises(compress.CompressError):
+        compress.unpack(str(archive), str(remote))
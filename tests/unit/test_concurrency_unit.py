@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import time
+
+import pytest
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.concurrency"
+
+
+# * Tests for module_utils concurrency
+
+
+def test_map_concurrently_bounded_and_ordered(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    concurrency = importer(IMPORT_NAME)
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def square(value):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return value * value
+
+    assert concurrency.map_concurrently(square, range(10), 3) == [
+        value * value for value in range(10)
+    ]
+    assert 1 < running[1] <= 3
+
+
+def test_map_concurrently_raises_first_error(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    concurrency = importer(IMPORT_NAME)
+
+    def check(value):
+        if value in (2, 5):
+            raise ValueError(value)
+        return value
+
+    with pytest.raises(ValueError) as e:
+        concurrency.map_concurrently(check, range(8), 4)
+    assert e.value.args == (2,)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.data_set"
+
+
+# * Tests for module_utils data_set
+
+LISTDS_OUT = """READY
+  LISTDS ( -
+    'USER.TEST.PDS' -
+    'USER.MISSING' -
+    'USER.TEST.SEQ' -
+    'USER.TEST.VSAM' -
+  )
+USER.TEST.PDS
+--RECFM-LRECL-BLKSIZE-DSORG
+  FB    80    27920   PO
+--VOLUMES--
+  VOL001
+IKJ58503I DATA SET 'USER.MISSING' NOT IN CATALOG
+USER.TEST.SEQ
+--RECFM-LRECL-BLKSIZE-DSORG
+  VB    1028  6144    PS
+--VOLUMES--
+  VOL002
+USER.TEST.VSAM
+--DSORG
+  VSAM
+READY
+END
+"""
+
+LISTCAT_OUT = """IDCAMS  SYSTEM SERVICES
+  LISTCAT ENT( -
+    USER.TEST.PDS -
+    USER.MISSING -
+    USER.TEST.SEQ -
+    USER.TEST.VSAM -
+  ) ALL
+NONVSAM ------- USER.TEST.PDS
+     IN-CAT --- CATALOG.USER
+  VOLUMES
+    VOLSER------------VOL001     DEVTYPE------X'3010200F'
+IDC3012I ENTRY USER.MISSING NOT FOUND
+IDC3009I ** VSAM CATALOG RETURN CODE IS 8 - REASON CODE IS IGG0CLEG-42
+NONVSAM ------- USER.TEST.SEQ
+     IN-CAT --- CATALOG.USER
+  VOLUMES
+    VOLSER------------VOL002     DEVTYPE------X'3010200F'
+CLUSTER ------- USER.TEST.VSAM
+     IN-CAT --- CATALOG.USER
+   DATA ------- USER.TEST.VSAM.DATA
+  VOLUMES
+    VOLSER------------VOL003     DEVTYPE------X'3010200F'
+   INDEX ------ USER.TEST.VSAM.INDEX
+IDC0001I FUNCTION COMPLETED, HIGHEST CONDITION CODE WAS 4
+"""
+
+
+def test_data_set_utils_bulk(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    data_set = importer(IMPORT_NAME)
+    data_set.metadata_cache.invalidate()
+    mocker.patch.object(data_set, "AnsibleModuleHelper")
+    ikjeft01 = mocker.patch.object(
+        data_set.mvs_cmd, "ikjeft01", return_value=(8, LISTDS_OUT, "")
+    )
+    idcams = mocker.patch.object(
+        data_set.mvs_cmd, "idcams", return_value=(4, LISTCAT_OUT, "")
+    )
+    names = [
+        "user.test.pds",
+        "USER.MISSING",
+        "USER.TEST.SEQ",
+        "USER.TEST.VSAM",
+        "/u/user/file.txt",
+    ]
+    utils = data_set.DataSetUtils.bulk(names)
+    assert ikjeft01.call_count == 1
+    assert idcams.call_count == 1
+    assert list(utils.keys()) == names
+    pds = utils.get("user.test.pds")
+    assert pds.exists() is True
+    assert pds.ds_type() == "PO"
+    assert pds.recfm() == "FB"
+    assert pds.blksize() == 27920
+    assert pds.volume() == "VOL001"
+    assert not utils.get("USER.MISSING").exists()
+    assert utils.get("USER.MISSING").volume() is None
+    assert utils.get("USER.TEST.SEQ").lrecl() == "1028"
+    assert utils.get("USER.TEST.SEQ").volume() == "VOL002"
+    assert utils.get("USER.TEST.VSAM").ds_type() == "VSAM"
+    assert utils.get("USER.TEST.VSAM").volume() == "VOL003"
+    assert utils.get("/u/user/file.txt").is_uss_path
+
+    # cached data sets are not listed again, only the new ones
+    utils = data_set.DataSetUtils.bulk(["USER.TEST.SEQ", "USER.TEST.PDS"])
+    assert ikjeft01.call_count == 1
+    assert utils.get("USER.TEST.PDS").recfm() == "FB"
+    data_set.metadata_cache.invalidate("USER.TEST.SEQ")
+    utils = data_set.DataSetUtils.bulk(["USER.TEST.SEQ", "USER.TEST.PDS"])
+    assert ikjeft01.call_count == 2
+    assert "'USER.TEST.PDS'" not in ikjeft01.call_args[0][0]
+    assert idcams.call_count == 2
+    data_set.metadata_cache.invalidate()
+
+
+def test_data_set_is_vsam_searches_every_volume(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    data_set = importer(IMPORT_NAME)
+    data_set.metadata_cache.invalidate()
+    vsam_data = dict(
+        data_set_name="USER.TEST.VSAM.DATA",
+        volume="VOL002",
+        sequence="1",
+        data_set_organization="VS",
+    )
+    entries = dict(VOL001=dict(), VOL002={"USER.TEST.VSAM.DATA": vsam_data})
+    mocker.patch.object(
+        data_set.vtoc,
+        "get_volume_index",
+        side_effect=lambda volume: mocker.Mock(get=entries.get(volume).get),
+    )
+    try:
+        assert data_set.DataSet.is_vsam("USER.TEST.VSAM", ["VOL001", "VOL002"])
+        assert not data_set.DataSet.is_vsam("USER.TEST.SEQ", ["VOL001", "VOL002"])
+    finally:
+        data_set.metadata_cache.invalidate()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import random
+
+import pytest
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.delta"
+
+
+def random_bytes(size, seed=0):
+    generator = random.Random(seed)
+    return bytes(bytearray(generator.getrandbits(8) for _ in range(size)))
+
+
+def transfer(delta, tmp_path, old, new, max_literal_ratio=None):
+    """Rebuild a new file from an old one in another directory, the way
+    zos_copy does between the controller and the managed node."""
+    local = tmp_path / "local"
+    remote = tmp_path / "remote"
+    for directory in (local, remote):
+        directory.mkdir(exist_ok=True)
+    (local / "file").write_bytes(new)
+    (remote / "file").write_bytes(old)
+
+    signature = delta.get_signature(str(remote / "file"))
+    literal_size = delta.write_delta(
+        str(local / "file"),
+        signature,
+        str(local / "file.delta"),
+        max_literal_ratio=max_literal_ratio,
+    )
+    (remote / "file.delta").write_bytes((local / "file.delta").read_bytes())
+    delta.apply_delta(
+        str(remote / "file"),
+        str(remote / "file.delta"),
+        str(remote / "file.new"),
+        signature.get("block_size"),
+    )
+    assert (remote / "file.new").read_bytes() == new
+    return literal_size
+
+
+# * Tests for module_utils delta
+
+
+def test_delta_sends_changed_blocks(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    delta = importer(IMPORT_NAME)
+    old = random_bytes(1000000)
+    new = bytearray(old)
+    new[10000:10010] = b"X" * 10
+    new[300000:300000] = b"inserted" * 100
+    del new[600000:601000]
+    new += b"appended"
+    assert (
+        transfer(delta, tmp_path, old, bytes(new), delta.MAX_LITERAL_RATIO)
+        < 5 * delta.MIN_BLOCK_SIZE
+    )
+    assert transfer(delta, tmp_path, old, old) == 0
+    assert transfer(delta, tmp_path, old, old[1:]) < delta.MIN_BLOCK_SIZE
+
+
+@pytest.mark.parametrize(
+    "old,new",
+    [
+        (b"", b"new file"),
+        (b"old file", b""),
+        (b"short", b"short and more"),
+        (random_bytes(5000), random_bytes(5000)[:4096] + b"tail"),
+        (random_bytes(5000), random_bytes(5000, seed=1)),
+    ],
+)
+def test_delta_small_files(zos_import_mocker, tmp_path, old, new):
+    mocker, importer = zos_import_mocker
+    delta = importer(IMPORT_NAME)
+    assert transfer(delta, tmp_path, old, new) <= len(new)
+
+
+def test_delta_stops_when_most_of_the_file_changed(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    delta = importer(IMPORT_NAME)
+    old = random_bytes(3000000)
+    new = old[:1000000] + random_bytes(2000000, seed=1)
+    (tmp_path / "old").write_bytes(old)
+    (tmp_path / "new").write_bytes(new)
+    signature = delta.get_signature(str(tmp_path / "old"))
+    with pytest.raises(delta.DeltaTooLargeError):
+        delta.write_delta(str(tmp_path / "new"), signature, str(tmp_path / "delta"))
+    assert transfer(delta, tmp_path, old, new) > len(new) // 2
+
+
+def test_delta_rejects_invalid_delta(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    delta = importer(IMPORT_NAME)
+    (tmp_path / "old").write_bytes(b"old")
+    (tmp_path / "delta").write_bytes(delta.DELTA_MAGIC + delta.COPY_OP + b"\x00")
+    with pytest.raises(delta.DeltaError):
+        delta.apply_delta(
+            str(tmp_path / "old"),
+            str(tmp_path / "delta"),
+            str(tmp_path / "new"),
+            delta.MIN_BLOCK_SIZE,
+        )
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import shutil
+import subprocess
+import threading
+import time
+
+import pytest
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.encode"
+
+# every byte except the line endings, which z/OS iconv maps differently
+# from the iconv these tests run against
+ALL_BYTES = bytes(bytearray(b for b in range(256) if b not in (0x0A, 0x85)))
+
+ICONV_LIST = """Character sets:
+IBM-037\t\t037
+IBM-1047\t\t1047
+IBM-1252\t\t1252
+ISO8859-1\t\t819
+UTF-8\t\t1208
+"""
+
+
+def mock_module(mocker, encode):
+    module = mocker.patch.object(encode, "AnsibleModuleHelper").return_value
+    mocker.patch.object(
+        encode, "list_iconv_code_sets", return_value=(0, ICONV_LIST, "")
+    )
+    return module
+
+
+# * Tests for module_utils encode
+
+
+@pytest.mark.skipif(shutil.which("iconv") is None, reason="iconv is not installed")
+@pytest.mark.parametrize(
+    "code_set,iconv_code_set", [("IBM-1047", "IBM-1047"), ("IBM-037", "IBM037")]
+)
+def test_encode_in_process_matches_iconv(zos_import_mocker, code_set, iconv_code_set):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    expected = subprocess.check_output(
+        ["iconv", "-f", "ISO8859-1", "-t", iconv_code_set],
+        input=ALL_BYTES,
+    )
+    converted = encode.convert_bytes(ALL_BYTES, "ISO8859-1", code_set)
+    assert converted == expected
+    assert encode.convert_bytes(converted, code_set, "iso8859-1") == ALL_BYTES
+
+
+def test_encode_in_process_new_line(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    assert encode.convert_bytes(b"a\nb", "ISO8859-1", "IBM-1047") == b"\x81\x15\x82"
+    assert encode.convert_bytes(b"\x81\x15", "IBM-1047", "UTF-8") == b"a\n"
+
+
+def test_encode_in_process_utf8(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    text = "café [x]\n" * 30000
+    src = tmp_path / "src.txt"
+    src.write_bytes(text.encode("utf-8"))
+    dest = tmp_path / "dest.txt"
+    with open(str(src), "rb") as src_fo, open(str(dest), "wb") as dest_fo:
+        encode.convert_stream(src_fo, dest_fo, "UTF-8", "IBM-1047")
+    converted = dest.read_bytes()
+    assert len(converted) == len(text)
+    assert encode.convert_bytes(converted, "IBM-1047", "UTF-8").decode("utf-8") == text
+    with pytest.raises(UnicodeError):
+        encode.convert_bytes("€".encode("utf-8"), "UTF-8", "IBM-1047")
+
+
+def test_encode_uses_iconv_for_other_code_sets(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    assert encode.can_convert_in_process("IBM-1047", "utf-8")
+    assert not encode.can_convert_in_process("IBM-1047", "IBM-1252")
+    module = mock_module(mocker, encode)
+    module.run_command.return_value = (0, "converted", "")
+    encode_utils = encode.EncodeUtils()
+    assert encode_utils.string_convert_encoding("a", "IBM-1047", "IBM-1252") == (
+        "converted"
+    )
+    assert module.run_command.call_count == 1
+    assert encode_utils.string_convert_encoding("%d", "ISO8859-1", "UTF-8") == "%d"
+    assert module.run_command.call_count == 1
+
+
+def test_encode_in_process_files(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    module = mock_module(mocker, encode)
+    encode_utils = encode.EncodeUtils()
+    content = b"HELLO WORLD, THIS IS A SMALL FILE.\n" * 20
+    paths = []
+    for i in range(20):
+        path = tmp_path / "file{0}.txt".format(i)
+        path.write_bytes(content)
+        paths.append(str(path))
+
+    for path in paths:
+        assert encode_utils.uss_convert_encoding(path, path, "ISO8859-1", "IBM-1047")
+    for path in paths:
+        with open(path, "rb") as converted:
+            assert converted.read() == encode.convert_bytes(
+                content, "ISO8859-1", "IBM-1047"
+            )
+    assert not module.run_command.called
+
+
+@pytest.mark.perf
+def test_encode_in_process_throughput(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    mock_module(mocker, encode)
+    encode_utils = encode.EncodeUtils()
+    content = b"HELLO WORLD, THIS IS A SMALL FILE.\n" * 20
+    paths = []
+    for i in range(10000):
+        path = tmp_path / "file{0}.txt".format(i)
+        path.write_bytes(content)
+        paths.append(str(path))
+
+    start = time.time()
+    for path in paths:
+        encode_utils.uss_convert_encoding(path, path, "ISO8859-1", "IBM-1047")
+    in_process = (time.time() - start) / len(paths)
+
+    # starting a process per file, as iconv was
+    start = time.time()
+    for path in paths:
+        subprocess.check_call(["cat", path], stdout=subprocess.DEVNULL)
+    forked = (time.time() - start) / len(paths)
+    print(
+        "in process: {0:.1f}us per file, forked: {1:.1f}us per file".format(
+            in_process * 1e6, forked * 1e6
+        )
+    )
+    assert in_process < forked
+
+
+def test_encode_files_concurrently(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    mock_module(mocker, encode)
+    encode_utils = encode.EncodeUtils()
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    for name in ["a", "b", "sub/c", "sub/d"]:
+        (src / name).write_bytes(b"HELLO\n")
+    dest = tmp_path / "dest"
+    dest.mkdir()
+
+    # every file waits for the other three, so the conversion only
+    # completes if all four run at the same time
+    barrier = threading.Barrier(4, timeout=10)
+
+    def convert(src_file, dest_file, from_code, to_code):
+        barrier.wait()
+        shutil.copy(src_file, dest_file)
+        return True
+
+    mocker.patch.object(encode_utils, "uss_convert_encoding", side_effect=convert)
+    assert encode_utils.uss_convert_encoding_prev(
+        str(src), str(dest), "IBM-1047", "ISO8859-1", max_workers=4
+    )
+    assert not barrier.broken
+    assert (dest / "sub" / "d").read_bytes() == b"HELLO\n"
+
+
+def test_encode_files_reports_every_failure(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    mock_module(mocker, encode)
+    encode_utils = encode.EncodeUtils()
+    results = dict(a=True, b=encode.EncodeError("bad data"), c=False, d=True)
+
+    def convert(src_file, dest_file, from_code, to_code):
+        if isinstance(results.get(src_file), Exception):
+            raise results.get(src_file)
+        return results.get(src_file)
+
+    mocker.patch.object(encode_utils, "uss_convert_encoding", side_effect=convert)
+    files = [(name, name) for name in "abcd"]
+    with pytest.raises(encode.EncodeError) as e:
+        encode_utils.uss_convert_encoding_files(files, "IBM-1047", "ISO8859-1")
+    assert "Failed to convert 2 of 4 files." in e.value.msg
+    assert e.value.msg.index("b: ") < e.value.msg.index("c: ")
+    assert "bad data" in e.value.msg
+
+
+def test_encode_iconv_list_is_cached(zos_import_mocker, tmp_path, monkeypatch):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o700)
+    monkeypatch.setenv(encode.CODE_SET_CACHE_DIR_ENV, str(cache_dir))
+    iconv = tmp_path / "iconv"
+    iconv.write_bytes(b"")
+    module = mocker.MagicMock()
+    module.get_bin_path.return_value = str(iconv)
+    module.run_command.return_value = (0, ICONV_LIST, "")
+    mocker.patch.object(encode, "AnsibleModuleHelper", return_value=module)
+    mocker.patch.dict(encode._iconv_lists, clear=True)
+
+    assert "IBM-1252" in encode.get_code_sets(module)
+    assert encode.list_iconv_code_sets(module) == (0, ICONV_LIST, "")
+    assert module.run_command.call_count == 1
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # a new process reads the list cached on disk
+    encode._iconv_lists.clear()
+    assert encode.list_iconv_code_sets(module) == (0, ICONV_LIST, "")
+    assert module.run_command.call_count == 1
+
+    # a changed iconv binary lists its code sets again
+    iconv.write_bytes(b"updated")
+    encode._iconv_lists.clear()
+    assert encode.list_iconv_code_sets(module) == (0, ICONV_LIST, "")
+    assert module.run_command.call_count == 2
+
+    encode_utils = encode.EncodeUtils()
+    assert encode_utils._validate_encoding("ibm-1047") == "ibm-1047"
+    for encoding in ["IBM-9999", "IBM 1047", "IBM-1047\n"]:
+        with pytest.raises(ValueError):
+            encode_utils._validate_encoding(encoding)
+    assert module.run_command.call_count == 2
+
+
+def test_encode_iconv_list_failure_is_not_cached(
+    zos_import_mocker, tmp_path, monkeypatch
+):
+    mocker, importer = zos_import_mocker
+    encode = importer(IMPORT_NAME)
+    monkeypatch.setenv(encode.CODE_SET_CACHE_DIR_ENV, str(tmp_path))
+    module = mocker.MagicMock()
+    module.get_bin_path.return_value = str(tmp_path)
+    module.run_command.return_value = (1, "", "iconv: not available")
+    mocker.patch.dict(encode._iconv_lists, clear=True)
+    assert encode.get_code_sets(module) == frozenset()
+    assert encode.get_code_sets(module) == frozenset()
+    assert module.run_command.call_count == 2
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.job"
+
+
+# * Tests for module_utils job
+
+JOB_OUTPUT_LINES = [
+    '{"type":"job","job_id":"JOB00134","job_name":"HELLO","subsystem":"STL1",'
+    '"owner":"OMVSADM","ret_code":{"msg":"CC 0000"},"class":"R","content_type":"JOB"}\n',
+    '{"type":"dd","ddname":"JESMSGLG","record_count":"2","id":"2",'
+    '"stepname":"JES2","procstep":"","byte_count":"100"}\n',
+    '{"type":"line","content":" 10.25.48 JOB00134 ---- TUESDAY"}\n',
+    '{"type":"line","content":" PRINT \\"HELLO WORLD\\" \\\\ DONE"}\n',
+    '{"type":"job","job_id":"JOB00135","job_name":"HELLO","subsystem":"STL1",'
+    '"owner":"OMVSADM","ret_code":{"msg":""},"class":"R","content_type":"JOB"}\n',
+    "\n",
+    '{"type":"end","rows":2}\n',
+]
+
+
+def test_job_output_iter_assembles_jobs(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    mocker.patch.object(
+        job, "_get_job_output_lines", return_value=iter(JOB_OUTPUT_LINES)
+    )
+    jobs = job.job_output(job_id="JOB00134")
+    assert len(jobs) == 2
+    assert jobs[0].get("job_id") == "JOB00134"
+    assert "type" not in jobs[0]
+    assert jobs[0].get("ret_code").get("code") == 0
+    dd = jobs[0].get("ddnames")[0]
+    assert dd.get("ddname") == "JESMSGLG"
+    assert dd.get("content") == [
+        " 10.25.48 JOB00134 ---- TUESDAY",
+        ' PRINT "HELLO WORLD" \\ DONE',
+    ]
+    assert jobs[1].get("ddnames") == []
+    assert jobs[1].get("ret_code").get("msg") == "AC"
+
+
+def test_job_output_iter_stops_early(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    consumed = []
+
+    def lines(*args):
+        for line in JOB_OUTPUT_LINES:
+            consumed.append(line)
+            yield line
+
+    mocker.patch.object(job, "_get_job_output_lines", side_effect=lines)
+    first = next(job.job_output_iter(job_name="HELLO"))
+    assert first.get("job_id") == "JOB00134"
+    assert len(consumed) == 5
+
+
+def test_job_output_records_requires_end_record(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    mocker.patch.object(
+        job, "_get_job_output_lines", return_value=iter(JOB_OUTPUT_LINES[:3])
+    )
+    with pytest.raises(RuntimeError):
+        job.job_output(job_id="JOB00134")
+
+
+def test_stream_command_yields_lines(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    lines = list(job._stream_command(["printf", "first\\nsecond\\n"], "test"))
+    assert lines == ["first\n", "second\n"]
+    with pytest.raises(RuntimeError):
+        list(job._stream_command(["false"], "test"))
+
+
+def test_job_output_limits_pushed_down(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    patched = mocker.patch.object(
+        job, "_get_job_output_lines", return_value=iter(JOB_OUTPUT_LINES)
+    )
+    job.job_output(job_id="JOB00134", dd_name="SYSPRINT", max_lines=200, tail=True)
+    patched.assert_called_once_with(
+        "JOB00134", "*", "*", "SYSPRINT", 200, 0, True
+    )
+
+
+@pytest.mark.parametrize("limit", [-1, "abc", True])
+def test_job_output_rejects_invalid_limits(zos_import_mocker, limit):
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    with pytest.raises(ValueError):
+        job.job_output(job_id="JOB00134", max_bytes=limit)
+
+
+JOB_STATUS_OUT = (
+    "JOB00134 HELLO    STL1     STL1     OMVSADM  R        JOB      CC 0000\n"
+    "JOB00135 HELLO    STL1     STL1     OMVSADM  R        JOB      ABEND S222\n"
+    "JOB00136 HELLO    STL1     STL1     OMVSADM  R        JOB      \n"
+    "*END 3\n"
+)
+
+
+def test_job_status_batch_parses_fixed_columns(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    patched = mocker.patch.object(
+        job, "_get_job_status_str", return_value=(0, JOB_STATUS_OUT, "")
+    )
+    jobs = job.job_status_batch(["JOB00134", "JOB00135", "JOB00136"])
+    patched.assert_called_once_with("JOB00134,JOB00135,JOB00136", "*", "*")
+    assert [j.get("job_id") for j in jobs] == ["JOB00134", "JOB00135", "JOB00136"]
+    assert jobs[0].get("owner") == "OMVSADM"
+    assert jobs[0].get("content_type") == "JOB"
+    assert jobs[0].get("ret_code").get("code") == 0
+    assert jobs[1].get("ret_code").get("msg_code") == "S222"
+    assert jobs[2].get("ret_code").get("msg") == "AC"
+
+
+def test_job_status_no_output(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    mocker.patch.object(job, "_get_job_status_str", return_value=(0, "*END 0\n", ""))
+    assert job.job_status(job_id="JOB00134") == []
+    mocker.patch.object(job, "_get_job_status_str", return_value=(0, "", ""))
+    with pytest.raises(RuntimeError):
+        job.job_status(job_id="JOB00134")
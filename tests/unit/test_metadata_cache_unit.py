@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.metadata_cache"
+DATA_SET_IMPORT_NAME = "ibm_zos_core.plugins.module_utils.data_set"
+
+LISTCAT_OUT = """IDCAMS  SYSTEM SERVICES
+  LISTCAT ENTRIES('USER.TEST.SEQ')
+NONVSAM ------- USER.TEST.SEQ
+     IN-CAT --- CATALOG.USER
+"""
+
+
+# * Tests for module_utils metadata_cache
+
+
+def test_metadata_cache_hits_and_misses(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    metadata_cache = importer(IMPORT_NAME)
+    cache = metadata_cache.MetadataCache()
+    loader = mocker.MagicMock(return_value=True)
+    assert cache.lookup("cataloged", "user.test.seq", None, loader) is True
+    assert cache.lookup("cataloged", "USER.TEST.SEQ ", None, loader) is True
+    assert loader.call_count == 1
+    assert cache.stats() == dict(hits=1, misses=1, invalidations=0, entries=1)
+
+
+def test_metadata_cache_lookup_many(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    metadata_cache = importer(IMPORT_NAME)
+    cache = metadata_cache.MetadataCache()
+    cache.lookup("info", "USER.TEST.PDS", None, lambda: dict(dsorg="PO"))
+    loader = mocker.MagicMock(
+        side_effect=lambda names: dict((name, dict(dsorg="PS")) for name in names)
+    )
+    results = cache.lookup_many(
+        "info", ["USER.TEST.PDS", "USER.TEST.SEQ"], None, loader
+    )
+    assert results == {
+        "USER.TEST.PDS": dict(dsorg="PO"),
+        "USER.TEST.SEQ": dict(dsorg="PS"),
+    }
+    loader.assert_called_once_with(["USER.TEST.SEQ"])
+    cache.lookup_many("info", ["USER.TEST.PDS", "USER.TEST.SEQ"], None, loader)
+    assert loader.call_count == 1
+    assert cache.stats() == dict(hits=3, misses=2, invalidations=0, entries=2)
+
+
+def test_metadata_cache_invalidate(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    metadata_cache = importer(IMPORT_NAME)
+    cache = metadata_cache.MetadataCache()
+    cache.lookup("cataloged", "USER.TEST.PDS", None, lambda: True)
+    cache.lookup("cataloged", "USER.TEST.SEQ", None, lambda: True)
+    cache.lookup(metadata_cache.VTOC, None, "VOL001", lambda: [])
+    cache.invalidate("user.test.pds(member)")
+    assert cache.stats().get("entries") == 1
+    loader = mocker.MagicMock(return_value=False)
+    assert cache.lookup("cataloged", "USER.TEST.SEQ", None, loader) is True
+    assert cache.lookup("cataloged", "USER.TEST.PDS", None, loader) is False
+    cache.invalidate()
+    assert cache.stats().get("entries") == 0
+    assert cache.stats().get("invalidations") == 2
+
+
+def test_data_set_cataloged_runs_listcat_once(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    metadata_cache = importer(IMPORT_NAME)
+    data_set = importer(DATA_SET_IMPORT_NAME)
+    metadata_cache.invalidate()
+    module = mocker.patch.object(data_set, "AnsibleModuleHelper").return_value
+    run_command = module.run_command
+    run_command.return_value = (0, LISTCAT_OUT, "")
+    mocker.patch.object(data_set.Datasets, "delete", return_value=0)
+    try:
+        assert data_set.DataSet.data_set_cataloged("USER.TEST.SEQ")
+        assert data_set.DataSet.data_set_cataloged("user.test.seq")
+        assert run_command.call_count == 1
+        data_set.DataSet.delete("USER.TEST.SEQ")
+        run_command.return_value = (4, "", "")
+        assert not data_set.DataSet.data_set_cataloged("USER.TEST.SEQ")
+        assert run_command.call_count == 2
+    finally:
+        metadata_cache.invalidate()
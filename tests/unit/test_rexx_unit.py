@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.rexx"
+
+SCRIPT = """/* REXX */
+say 'hello'
+"""
+
+
+# * Tests for module_utils rexx
+
+
+def test_cached_script_is_reused(zos_import_mocker, tmp_path, monkeypatch):
+    mocker, importer = zos_import_mocker
+    rexx = importer(IMPORT_NAME)
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setenv(rexx.SCRIPT_CACHE_DIR_ENV, cache_dir)
+    with rexx.cached_script(SCRIPT) as first:
+        assert os.path.dirname(first) == cache_dir
+        assert os.access(first, os.X_OK)
+        with open(first) as f:
+            assert f.read() == SCRIPT
+    assert os.path.isfile(first)
+    mtime = os.stat(first).st_mtime_ns
+    with rexx.cached_script(SCRIPT) as second:
+        assert second == first
+    assert os.stat(first).st_mtime_ns == mtime
+    with rexx.cached_script(SCRIPT + "say 'bye'\n") as other:
+        assert other != first
+    assert sorted(os.listdir(cache_dir)) == sorted(
+        [os.path.basename(first), os.path.basename(other)]
+    )
+    assert oct(os.stat(cache_dir).st_mode & 0o777) == oct(0o700)
+
+
+def test_cached_script_shared_dir_falls_back(zos_import_mocker, tmp_path, monkeypatch):
+    mocker, importer = zos_import_mocker
+    rexx = importer(IMPORT_NAME)
+    cache_dir = tmp_path / "shared"
+    cache_dir.mkdir()
+    cache_dir.chmod(0o777)
+    monkeypatch.setenv(rexx.SCRIPT_CACHE_DIR_ENV, str(cache_dir))
+    with rexx.cached_script(SCRIPT) as path:
+        assert os.path.dirname(path) != str(cache_dir)
+        assert os.access(path, os.X_OK)
+    assert not os.path.exists(path)
+    assert os.listdir(str(cache_dir)) == []
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.sftp"
+
+
+# * Tests for module_utils sftp
+
+
+def play_context(mocker, port=None):
+    context = mocker.MagicMock()
+    context.remote_user = "omvsadm"
+    context.remote_addr = "zos.example.com"
+    context.port = port
+    return context
+
+
+def test_sftp_session_reuses_connection(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    sftp = importer(IMPORT_NAME)
+    popen = mocker.patch.object(sftp.subprocess, "Popen")
+    connection = mocker.MagicMock()
+    connection.get_option.return_value = "sftp"
+    connection._build_command.return_value = ["sftp", "-b", "-", "[zos]"]
+    connection._run.return_value = (0, b"sftp> put a b\n", b"")
+
+    session = sftp.SftpSession(connection, play_context(mocker), 22)
+    assert session.uses_connection
+    assert session.run(["mkdir /tmp/p", "put a /tmp/p"]) == (0, "sftp> put a b\n", "")
+    assert session.run(["put c /tmp/p"])[0] == 0
+    connection._build_command.assert_called_with("sftp", "[zos.example.com]")
+    assert connection._run.call_args_list[0][0][1] == b"mkdir /tmp/p\nput a /tmp/p\n"
+    assert not popen.called
+
+
+def test_sftp_session_ignores_verbose_ssh_output(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    sftp = importer(IMPORT_NAME)
+    connection = mocker.MagicMock()
+    connection.get_option.return_value = "sftp"
+    connection._build_command.return_value = ["sftp", "-vvv", "-b", "-", "[zos]"]
+    connection._run.return_value = (
+        0,
+        b"sftp> put a b\n",
+        b"OpenSSH_8.9p1, OpenSSL 3.0.2 15 Mar 2022\n"
+        b"debug1: Reading configuration data /etc/ssh/ssh_config\n"
+        b"Authenticated to zos.example.com ([10.0.0.1]:22) using \"publickey\".\n"
+        b"Transferred: sent 4096, received 2048 bytes, in 0.2 seconds\n",
+    )
+
+    session = sftp.SftpSession(connection, play_context(mocker), 22)
+    assert session.run(["put a b"]) == (0, "sftp> put a b\n", "")
+
+    connection._run.return_value = (1, b"", b"remote open: Permission denied\n")
+    assert session.run(["put a b"]) == (1, "", "remote open: Permission denied")
+
+
+def test_sftp_session_shares_own_master(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    sftp = importer(IMPORT_NAME)
+    mocker.patch.object(sftp, "CONTROL_PATH_DIR", str(tmp_path / "cp"))
+    popen = mocker.patch.object(sftp.subprocess, "Popen")
+    popen.return_value.communicate.return_value = (
+        b"",
+        b"Connected to zos.example.com.\nremote open: Permission denied\n",
+    )
+    popen.return_value.returncode = 1
+    connection = mocker.MagicMock(spec=["exec_command"])
+
+    session = sftp.SftpSession(connection, play_context(mocker), 22)
+    assert not session.uses_connection
+    rc, out, err = session.run(["get /tmp/p /tmp/q"])
+    assert err == "remote open: Permission denied"
+    cmd = popen.call_args[0][0]
+    assert cmd[1:3] == ["-b", "-"]
+    assert cmd[-1] == "omvsadm@zos.example.com"
+    control_path = [arg for arg in cmd if arg.startswith("-oControlPath=")][0]
+    assert control_path.startswith("-oControlPath={0}".format(tmp_path / "cp"))
+
+    # a different sftp port can not use the master of the connection
+    connection = mocker.MagicMock()
+    session = sftp.SftpSession(connection, play_context(mocker, port=22), 2222)
+    assert not session.uses_connection
+    session.run(["get /tmp/p /tmp/q"])
+    assert popen.call_args[0][0][3] == "-oPort=2222"
+    assert popen.call_args[0][0][6] != control_path
+
+
+def test_sftp_session_reuses_ansible_ssh_connection(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    sftp = importer(IMPORT_NAME)
+    from ansible.playbook.play_context import PlayContext
+    from ansible.plugins.loader import connection_loader
+
+    context = PlayContext()
+    context.remote_addr = "zos.example.com"
+    context.remote_user = "omvsadm"
+    connection = connection_loader.get("ssh", context, "/dev/null")
+    connection.set_options(
+        var_options=dict(ansible_host="zos.example.com", ansible_user="omvsadm")
+    )
+    run = mocker.patch.object(connection, "_run", return_value=(0, b"", b""))
+
+    session = sftp.SftpSession(connection, context, 22)
+    assert session.uses_connection
+    assert session.run(["put a /tmp/p"]) == (0, "", "")
+    cmd = run.call_args[0][0]
+    assert cmd[0] == b"sftp"
+    assert cmd[1:3] == [b"-b", b"-"]
+    assert cmd[-1] == b"[zos.example.com]"
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import tracemalloc
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.vtoc"
+
+LISTVTOC_HEADER = """1                    SYSTEMS SUPPORT UTILITIES---IEHLIST                    DATE: 2020.125      TIME: 10.39.55
+                     CONTENTS OF VTOC ON VOL VOL001  <THIS VOLUME IS NOT SMS MANAGED>
+0THERE IS A 2 LEVEL VTOC INDEX
+ DATA SETS ARE LISTED IN ALPHANUMERIC ORDER
+"""
+
+LISTVTOC_DATA_SETS = """0---------------DATA SET NAME----------------   SER NO  SEQNO  DATE.CRE  DATE.EXP  DATE.REF  EXT  DSORG  RECFM  OPTCD  BLKSIZE
+ USER.TEST.SEQ                                  VOL001      1  2020.101  00.000    2020.125    2  PS     FB     00       27920
+0SMS.IND  LRECL  KEYLEN  INITIAL ALLOC  2ND ALLOC  EXTEND  LAST BLK(T-R-L)  DIR.REM  F2 OR F3(C-H-R)  DSCB(C-H-R)
+             80          TRKS                   1  0AV         1  17  17080                             1   2   4
+ EATTR
+  NS
+0EXTENTS  NO  LOW(C-H)    HIGH(C-H)      NO  LOW(C-H)    HIGH(C-H)
+          0     85   9      85  10       1     90   0       90   4
+0----ON THE ABOVE DATASET,EXTENTS WERE FOUND
+0---------------DATA SET NAME----------------   SER NO  SEQNO  DATE.CRE  DATE.EXP  DATE.REF  EXT  DSORG  RECFM  OPTCD  BLKSIZE
+ USER.TEST.VSAM.DATA                            VOL001      1  2020.101  00.000    2020.125    0  VS     U      00           0
+0SMS.IND  LRECL  KEYLEN  INITIAL ALLOC  2ND ALLOC  EXTEND  LAST BLK(T-R-L)  DIR.REM  F2 OR F3(C-H-R)  DSCB(C-H-R)
+                         CYLS                   1                                                       1   2   5
+ EATTR
+  NS
+0THE ABOVE DATASET HAS NO EXTENTS
+"""
+
+
+# * Tests for module_utils vtoc
+
+
+def _listvtoc(count):
+    sections = [
+        LISTVTOC_DATA_SETS.replace("USER.TEST.", "USER.T{0:05d}.".format(i))
+        for i in range(count)
+    ]
+    return LISTVTOC_HEADER + "".join(sections)
+
+
+def test_vtoc_process_output(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    vtoc = importer(IMPORT_NAME)
+    data_sets = vtoc._process_output(LISTVTOC_HEADER + LISTVTOC_DATA_SETS)
+    assert [ds.get("data_set_name") for ds in data_sets] == [
+        "USER.TEST.SEQ",
+        "USER.TEST.VSAM.DATA",
+    ]
+    seq, vsam = data_sets
+    assert seq.get("volume") == "VOL001"
+    assert seq.get("data_set_organization") == "PS"
+    assert seq.get("record_format") == "FB"
+    assert seq.get("block_size") == "27920"
+    assert seq.get("record_length") == "80"
+    assert seq.get("space_type") == "TRKS"
+    assert seq.get("average_block_size") == "0"
+    assert seq.get("last_block_pointer") == dict(
+        track="1", block="17", bytes_remaining="17080"
+    )
+    assert seq.get("dscb_format_1_or_8") == dict(cylinder="1", track="2", record="4")
+    assert seq.get("extended_attributes") == "NS"
+    assert seq.get("extents") == [
+        dict(
+            number="0",
+            low=dict(cylinder="85", track="9"),
+            high=dict(cylinder="85", track="10"),
+        ),
+        dict(
+            number="1",
+            low=dict(cylinder="90", track="0"),
+            high=dict(cylinder="90", track="4"),
+        ),
+    ]
+    assert vsam.get("data_set_organization") == "VS"
+    assert vsam.get("space_type") == "CYLS"
+    assert "extents" not in vsam
+    assert "last_block_pointer" not in vsam
+
+
+def test_vtoc_large_listvtoc_is_parsed_incrementally(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    vtoc = importer(IMPORT_NAME)
+    stdout = _listvtoc(5000)
+    data_sets = vtoc._process_output(stdout)
+    assert len(data_sets) == 10000
+    assert data_sets[-1].get("data_set_name") == "USER.T04999.VSAM.DATA"
+
+    # only the data set being parsed is held, not a copy of the whole output
+    tracemalloc.start()
+    try:
+        count = sum(1 for data_set in vtoc._iter_data_sets(stdout))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert count == 10000
+    assert peak < len(stdout) / 10
+
+
+def test_vtoc_data_set_entry_stops_parsing_once_found(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    vtoc = importer(IMPORT_NAME)
+    vtoc.metadata_cache.invalidate()
+    iehlist = mocker.patch.object(vtoc, "_iehlist", return_value=_listvtoc(5000))
+    parse = mocker.patch.object(
+        vtoc, "_parse_data_set_info", side_effect=vtoc._parse_data_set_info
+    )
+    try:
+        data_set = vtoc.get_data_set_entry("user.t00001.seq", "vol001")
+        assert data_set.get("data_set_name") == "USER.T00001.SEQ"
+        assert parse.call_count == 3
+
+        # found in the index without parsing or running IEHLIST again
+        assert vtoc.get_data_set_entry("USER.T00000.VSAM.DATA", "VOL001")
+        assert parse.call_count == 3
+
+        assert vtoc.get_data_set_entry("USER.MISSING", "VOL001") is None
+        assert parse.call_count == 10000
+        assert len(vtoc.get_volume_entry("VOL001")) == 10000
+        assert iehlist.call_count == 1
+
+        # the index is rebuilt once data sets on the volume change
+        vtoc.metadata_cache.invalidate("USER.T00001.SEQ")
+        assert vtoc.get_data_set_entry("USER.T00001.SEQ", "VOL001")
+        assert iehlist.call_count == 2
+    finally:
+        vtoc.metadata_cache.invalidate()
+
+
+def test_vtoc_index_without_listvtoc_output(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    vtoc = importer(IMPORT_NAME)
+    index = vtoc.VolumeTableOfContents(None)
+    assert index.get("USER.TEST.SEQ") is None
+    assert index.entries() is None
+
+
+def test_vtoc_get_volume_entries(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    vtoc = importer(IMPORT_NAME)
+    vtoc.metadata_cache.invalidate()
+
+    # every volume waits for the other two, so the listing only completes
+    # if all three are listed at the same time
+    barrier = threading.Barrier(3, timeout=10)
+
+    def iehlist(dd, stdin):
+        # the data set spans volumes in reverse order
+        barrier.wait()
+        volume = dd[-6:]
+        sequence = str(4 - int(volume[-1]))
+        return (LISTVTOC_HEADER + LISTVTOC_DATA_SETS).replace(
+            "VOL001      1", "{0}      {1}".format(volume, sequence)
+        )
+
+    mocker.patch.object(vtoc, "_iehlist", side_effect=iehlist)
+    volumes = ["vol001", "vol002", "vol003", "VOL001"]
+    try:
+        data_sets = vtoc.get_volume_entries(volumes)
+        assert not barrier.broken
+        assert list(data_sets.elapsed) == ["VOL001", "VOL002", "VOL003"]
+        assert all(elapsed >= 0 for elapsed in data_sets.elapsed.values())
+        entries = data_sets.get("USER.TEST.SEQ")
+        assert [entry.get("volume") for entry in entries] == [
+            "VOL003",
+            "VOL002",
+            "VOL001",
+        ]
+        assert data_sets.get("USER.MISSING") == []
+        assert len(data_sets.entries()) == 6
+    finally:
+        vtoc.metadata_cache.invalidate()
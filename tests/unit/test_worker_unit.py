@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.worker"
+
+MARKER = "__ZOS_WORKER_MISSING__"
+
+FAKE_MODULE = """
+import atexit, json, os, sys
+atexit.register(lambda: open(os.environ["WORKER_TEST_MARKER"], "w").close())
+print(json.dumps(dict(
+    preloaded="zoautil_py" in sys.modules,
+    argv=sys.argv[1:],
+    cwd=os.getcwd(),
+    value=os.environ.get("WORKER_TEST_VALUE"),
+)))
+sys.exit(3)
+"""
+
+
+# * Tests for module_utils worker
+
+
+def _setup(tmp_path):
+    stub_dir = tmp_path / "stubs"
+    (stub_dir / "zoautil_py").mkdir(parents=True)
+    (stub_dir / "zoautil_py" / "__init__.py").write_text("")
+    module_path = tmp_path / "AnsiballZ_fake.py"
+    module_path.write_text(FAKE_MODULE)
+    worker_path = tmp_path / "worker.py"
+    env = dict(os.environ)
+    env.update(
+        PYTHONPATH=str(stub_dir),
+        WORKER_TEST_VALUE="first",
+        WORKER_TEST_MARKER=str(tmp_path / "first.marker"),
+        ZOS_CORE_WORKER_DIR=str(tmp_path / "sockets"),
+    )
+    return str(module_path), str(worker_path), env
+
+
+def _bootstrap(worker, worker_path, module_path, env, cwd):
+    return subprocess.run(
+        [sys.executable, "-S", "-c", worker.BOOTSTRAP, worker_path, MARKER]
+        + [module_path, "arg1"],
+        env=env,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+
+def test_worker_bootstrap_without_worker(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    worker = importer(IMPORT_NAME)
+    module_path, worker_path, env = _setup(tmp_path)
+    result = _bootstrap(worker, worker_path, module_path, env, str(tmp_path))
+    assert result.returncode == 3
+    assert result.stderr.strip() == MARKER
+    assert json.loads(result.stdout).get("argv") == ["arg1"]
+
+
+def test_worker_runs_payload_in_daemon(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    worker = importer(IMPORT_NAME)
+    module_path, worker_path, env = _setup(tmp_path)
+    shutil.copy(worker.__file__, worker_path)
+    shutil.copy(worker.rexx.__file__, str(tmp_path / "rexx.py"))
+    socket_dir = tmp_path / "sockets"
+    try:
+        # the first run starts the daemon and runs the payload the normal way
+        result = _bootstrap(worker, worker_path, module_path, env, str(tmp_path))
+        assert result.returncode == 3
+        assert json.loads(result.stdout).get("preloaded") is False
+        assert (tmp_path / "first.marker").exists()
+        for i in range(100):
+            if any(name.endswith(".sock") for name in os.listdir(str(socket_dir))):
+                break
+            time.sleep(0.1)
+        assert oct(os.stat(str(socket_dir)).st_mode & 0o777) == oct(0o700)
+
+        env.update(
+            WORKER_TEST_VALUE="second",
+            WORKER_TEST_MARKER=str(tmp_path / "second.marker"),
+        )
+        result = _bootstrap(worker, worker_path, module_path, env, str(socket_dir))
+        assert result.returncode == 3
+        assert MARKER not in result.stderr
+        output = json.loads(result.stdout)
+        assert output.get("preloaded") is True
+        assert output.get("argv") == ["arg1"]
+        assert output.get("value") == "second"
+        assert output.get("cwd") == str(socket_dir)
+        # the exit handlers of the payload run in the daemon too
+        assert (tmp_path / "second.marker").exists()
+    finally:
+        # removing the socket stops the daemon
+        for name in os.listdir(str(socket_dir)):
+            if name.endswith(".sock"):
+                os.remove(str(socket_dir / name))
+
+
+def test_worker_exit_code(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    worker = importer(IMPORT_NAME)
+    assert worker._exit_code(None) == 0
+    assert worker._exit_code(256 + 4) == 4
+    mocker.patch.object(worker.sys, "stderr")
+    assert worker._exit_code("failed") == 1
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.filter.wtor"
+
+
+# * Tests for filter wtor
+
+WTORS = [
+    {"number": "001", "message_text": "*399 HWSC0000I *IMS CONNECT READY* IM5HCONN"},
+    {"number": "002", "message_text": "*400 DFS3139I IMS INITIALIZED"},
+    {"number": "003", "message_text": "*401 IEE094D SPECIFY OPERAND(S) FOR DUMP"},
+    {"number": "004", "message_text": "*402 iee094d specify operand(s) for dump"},
+]
+
+test_data = [
+    ("IEE094D", False, False, ["003"]),
+    ("IEE094D", True, False, ["003", "004"]),
+    (["HWSC0000I", "DFS[0-9]+I"], False, False, ["001", "002"]),
+    (["HWSC0000I", "DFS[0-9]+I"], False, True, ["001"]),
+    (["(?P<id>IMS)", "(?P<id>DUMP)"], False, False, ["001", "002", "003"]),
+    ([r"(IMS) \1", "DUMP"], False, False, ["003"]),
+    ([], False, False, []),
+]
+
+
+@pytest.mark.parametrize("text,ignore_case,first_only,expected", test_data)
+def test_filter_wtor_messages(
+    zos_import_mocker, text, ignore_case, first_only, expected
+):
+    mocker, importer = zos_import_mocker
+    wtor = importer(IMPORT_NAME)
+    for response in (WTORS, {"actions": WTORS}):
+        found = wtor.filter_wtor_messages(
+            response, text, ingore_case=ignore_case, first_only=first_only
+        )
+        assert [w.get("number") for w in found] == expected
+
+
+def test_filter_wtor_messages_single_pass(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    wtor = importer(IMPORT_NAME)
+    texts = ["MSG{0:03d}I".format(i) for i in range(50)]
+    compile = mocker.spy(wtor.re, "compile")
+    wtor.filter_wtor_messages(WTORS, texts)
+    wtor.filter_wtor_messages(WTORS, texts)
+    assert compile.call_count == 1
+    assert len(wtor._compile(texts, False)) == 1
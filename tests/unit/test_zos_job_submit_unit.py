@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2020
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock
+
+# Used my some mock modules, should match import directly below
+IMPORT_NAME = "ibm_zos_core.plugins.modules.zos_job_submit"
+
+
+# * Tests for zos_job_submit
+
+test_data = [
+    ("USER.JCL(NIGHT*)", True),
+    ("USER.JCL(N?GHT01)", True),
+    ("USER.JCL(NIGHT01)", False),
+    ("USER.JCL", False),
+    ("/u/user/night*.jcl", False),
+]
+
+
+@pytest.mark.parametrize("src,expected", test_data)
+def test_zos_job_submit_is_member_pattern(zos_import_mocker, src, expected):
+    mocker, importer = zos_import_mocker
+    zos_job_submit = importer(IMPORT_NAME)
+    assert zos_job_submit.is_member_pattern(src) == expected
+
+
+test_data = [
+    ("USER.JCL(NIGHT01)", True),
+    (["USER.JCL(NIGHT*)", "/u/user/step1.jcl"], True),
+    ("relative/path.jcl", False),
+    ([], False),
+]
+
+
+@pytest.mark.parametrize("src,expected", test_data)
+def test_zos_job_submit_jcl_sources(zos_import_mocker, src, expected):
+    mocker, importer = zos_import_mocker
+    zos_job_submit = importer(IMPORT_NAME)
+    passed = True
+    try:
+        zos_job_submit.jcl_sources(src, {})
+    except ValueError:
+        passed = False
+    assert passed == expected
+
+
+def test_zos_job_submit_list_matching_members(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_job_submit = importer(IMPORT_NAME)
+    module = MagicMock()
+    module.run_command.return_value = (0, "NIGHT02\nNIGHT01\nDAY01\n", "")
+    members = zos_job_submit.list_matching_members("user.jcl(night*)", module)
+    module.run_command.assert_called_once_with(["mls", "USER.JCL"])
+    assert members == ["USER.JCL(NIGHT01)", "USER.JCL(NIGHT02)"]
+
+
+def test_zos_job_submit_wait_for_jobs_polls_pending_only(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_job_submit = importer(IMPORT_NAME)
+    mocker.patch.object(zos_job_submit, "sleep")
+    polls = [
+        [
+            {"job_id": "JOB00001", "ret_code": {"msg": "CC 0000"}},
+            {"job_id": "JOB00002", "ret_code": {"msg": "AC"}},
+        ],
+        [{"job_id": "JOB00002", "ret_code": {"msg": "CC 0004"}}],
+    ]
+    status = mocker.patch.object(
+        zos_job_submit, "job_status_batch", side_effect=polls
+    )
+    stats = zos_job_submit.wait_for_jobs(["JOB00001", "JOB00002"], 60, 0.25, 10)
+    assert stats.get("completed") is True
+    assert stats.get("poll_count") == 2
+    assert status.call_args_list[1][0][0] == ["JOB00002"]
+    assert stats.get("jobs").get("JOB00002").get("ret_code").get("msg") == "CC 0004"
+    sleeps = [c[0][0] for c in zos_job_submit.sleep.call_args_list]
+    assert sleeps == [0.25, 0.5]
+
+
+test_data = [
+    ([{"name": "A"}, {"name": "B", "after": ["A"]}], True),
+    ([{"name": "A"}, {"name": "A"}], False),
+    ([{"name": "A", "after": ["C"]}], False),
+    ([{"name": "A", "after": ["B"]}, {"name": "B", "after": ["A"]}], False),
+]
+
+
+@pytest.mark.parametrize("schedule,expected", test_data)
+def test_zos_job_submit_order_job_schedule(zos_import_mocker, schedule, expected):
+    mocker, importer = zos_import_mocker
+    zos_job_submit = importer(IMPORT_NAME)
+    passed = True
+    try:
+        zos_job_submit.order_job_schedule(schedule)
+    except ValueError:
+        passed = False
+    assert passed == expected
+
+
+def test_zos_job_submit_order_job_schedule_dependencies_first(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_job_submit = importer(IMPORT_NAME)
+    schedule = [
+        {"name": "LOAD", "after": ["EXTRACT1", "EXTRACT2"]},
+        {"name": "EXTRACT1"},
+        {"name": "EXTRACT2"},
+    ]
+    ordered = zos_job_submit.order_job_schedule(schedule)
+    assert [job.get("name") for job in ordered] == ["EXTRACT1", "EXTRACT2", "LOAD"]
+
+
+def test_zos_job_submit_run_job_schedule(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_job_submit = importer(IMPORT_NAME)
+    mocker.patch.object(zos_job_submit, "sleep")
+    job_ids = {"A.JCL(E1)": "JOB00001", "A.JCL(E2)": "JOB00002", "A.JCL(L)": "JOB00003"}
+    submit = mocker.patch.object(
+        zos_job_submit, "submit_jcl", side_effect=lambda src, *args: job_ids[src]
+    )
+    codes = {"JOB00001": "CC 0000", "JOB00002": "CC 0008", "JOB00003": "CC 0000"}
+
+    def status(ids):
+        return [
+            {
+                "job_id": job_id,
+                "ret_code": {"msg": codes[job_id], "code": int(codes[job_id][3:])},
+            }
+            for job_id in ids
+        ]
+
+    batch = mocker.patch.object(zos_job_submit, "job_status_batch", side_effect=status)
+    schedule = [
+        {"name": "E1", "src": "A.JCL(E1)", "after": None, "max_rc": None},
+        {"name": "E2", "src": "A.JCL(E2)", "after": None, "max_rc": None},
+        {"name": "L1", "src": "A.JCL(L)", "after": ["E1"], "max_rc": None},
+        {"name": "L2", "src": "A.JCL(L)", "after": ["E2"], "max_rc": None},
+        {"name": "L3", "src": "A.JCL(L)", "after": ["L2"], "max_rc": None},
+    ]
+    params = dict(
+        location="DATA_SET",
+        volume=None,
+        parallelism=1,
+        poll_interval_s=0.25,
+        max_poll_interval_s=10,
+        wait_time_s=60,
+        max_rc=4,
+    )
+    result = zos_job_submit.run_job_schedule(MagicMock(), schedule, params)
+    statuses = {job.get("name"): job.get("status") for job in result.get("schedule")}
+    assert statuses == {
+        "E1": "passed",
+        "E2": "failed",
+        "L1": "passed",
+        "L2": "skipped",
+        "L3": "skipped",
+    }
+    assert submit.call_count == 3
+    assert all(len(call[0][0]) == 1 for call in batch.call_args_list)
+    assert result.get("highest_rc") == 8
@@ -25,6 +25,9 @@ class DummyModule(object):
     def run_command(self, *args, **kwargs):
         return (self.rc, self.stdout, self.stderr)
 
+    def get_bin_path(self, *args, **kwargs):
+        return None
+
 
 @pytest.mark.parametrize(
     (
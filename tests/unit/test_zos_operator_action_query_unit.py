@@ -60,3 +60,97 @@ def test_zos_operator_action_query_various_args(zos_import_mocker, args, expecte
     except Exception:
         passed = False
     assert passed == expected
+
+
+def _replies(count):
+    """Build synthetic 'd r,a,s' and 'd r,a,jn' responses with count replies."""
+    lines_a = ["IEE112I 12.12.12 PENDING REQUESTS"]
+    lines_b = ["IEE112I 12.12.12 PENDING REQUESTS"]
+    for number in range(10, count + 10):
+        lines_a.append(
+            " {0} R MV28     JOB{1:05d} *{0} ARC0055A REPLY 'GO' OR".format(
+                number, number % 100000
+            )
+        )
+        lines_a.append("   'CANCEL'")
+        lines_b.append(" {0} R JOB{1:05d} *{0} ARC0055A REPLY".format(number, number))
+    return "\n".join(lines_a) + "\n", "\n".join(lines_b) + "\n"
+
+
+def test_zos_operator_action_query_create_merge_list(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_operator_action_query = importer(IMPORT_NAME)
+    message_a, message_b = _replies(3)
+    responses = {"d r,a,s": message_a, "d r,a,jn": message_b}
+    mocker.patch.object(
+        zos_operator_action_query, "execute_command", side_effect=responses.get
+    )
+    merged = zos_operator_action_query.create_merge_list({})
+    assert [request.get("number") for request in merged] == ["10", "11", "12"]
+    assert merged[0].get("system") == "MV28"
+    assert merged[0].get("job_name") == "JOB00010"
+    assert merged[0].get("message_id") == "ARC0055A"
+    assert merged[0].get("message_text") == "ARC0055A REPLY 'GO' OR 'CANCEL'"
+
+
+class CountingDict(dict):
+    """A reply whose reply number lookups are counted."""
+
+    lookups = 0
+
+    def get(self, key, default=None):
+        if key == "number":
+            CountingDict.lookups += 1
+        return dict.get(self, key, default)
+
+
+def test_zos_operator_action_query_merge_looks_up_each_reply_once(
+    zos_import_mocker,
+):
+    mocker, importer = zos_import_mocker
+    zos_operator_action_query = importer(IMPORT_NAME)
+    message_a, message_b = _replies(1000)
+    list_a = [
+        CountingDict(request)
+        for request in zos_operator_action_query.parse_result_a(message_a)
+    ]
+    list_b = [
+        CountingDict(request)
+        for request in zos_operator_action_query.parse_result_b(message_b)
+    ]
+    CountingDict.lookups = 0
+    merged = zos_operator_action_query.merge_list(list_a, list_b)
+    assert CountingDict.lookups == len(list_a) + len(list_b)
+    assert len(merged) == 1000
+    assert [request.get("number") for request in merged] == [
+        request.get("number") for request in list_a
+    ]
+
+
+test_data = [
+    ({}, "d r,a,s", ["10", "11"]),
+    ({"system": "MV28"}, "d r,a,s,SYS=MV28", ["10", "11"]),
+    ({"system": "MV3*"}, "d r,a,s", []),
+    ({"job_name": "JOB*"}, "d r,a,s,JOBS=JOB*", ["10", "11"]),
+    ({"system": "MV28", "message_id": "IEE*"}, "d r,a,s,SYS=MV28", []),
+]
+
+
+@pytest.mark.parametrize("params,command,expected", test_data)
+def test_zos_operator_action_query_filters_pushed_down(
+    zos_import_mocker, params, command, expected
+):
+    mocker, importer = zos_import_mocker
+    zos_operator_action_query = importer(IMPORT_NAME)
+    message_a, message_b = _replies(2)
+    execute = mocker.patch.object(
+        zos_operator_action_query,
+        "execute_command",
+        side_effect=lambda cmd: message_a if cmd.startswith("d r,a,s") else message_b,
+    )
+    requests = zos_operator_action_query.find_required_request(
+        dict(dict(system=None, message_id=None, job_name=None), **params)
+    )
+    commands = [c[0][0] for c in execute.call_args_list]
+    assert sorted(commands) == sorted([command, command.replace(",s", ",jn", 1)])
+    assert [request.get("number") for request in requests] == expected
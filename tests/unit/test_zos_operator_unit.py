@@ -72,3 +72,41 @@ def test_zos_opreator_various_args(zos_import_mocker, args, expected):
     except Exception as e:
         passed = False
     assert passed == expected
+
+
+test_data = [
+    ({'cmds': ['d a,l', 'd r,l']}, True),
+    ({'cmds': ['d a,l'], 'parallelism': 0}, False),
+    ({'cmds': 'd a,l'}, True),
+]
+
+
+@pytest.mark.parametrize("args,expected", test_data)
+def test_zos_operator_cmds_args(zos_import_mocker, args, expected):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+    passed = True
+    try:
+        zos_operator.parse_params(args)
+    except Exception:
+        passed = False
+    assert passed == expected
+
+
+def test_zos_operator_run_operator_commands(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_operator = importer(IMPORT_NAME)
+    module = mocker.patch.object(zos_operator, 'AnsibleModuleHelper').return_value
+    responses = {
+        'opercmd -v  d r,l': (0, 'D R,L\nIEE112I', ''),
+        'opercmd -v  bad': (8, '', 'INVALID COMMAND'),
+    }
+    module.run_command.side_effect = lambda cmd: responses[cmd]
+    params = zos_operator.parse_params({'cmds': ['d r,l', 'bad'], 'verbose': True})
+    results = zos_operator.run_operator_commands(params)
+    assert [res.get('cmd') for res in results] == ['d r,l', 'bad']
+    assert [res.get('rc') for res in results] == [0, 8]
+    assert results[0].get('content') == ['D R,L', 'IEE112I']
+    assert results[1].get('content') == ['INVALID COMMAND']
+    assert all(res.get('elapsed') >= 0 for res in results)
+    assert module.run_command.call_count == 2